@@ -0,0 +1 @@
+from .arrow_user_snapshot_writer import ArrowUserSnapshotWriter
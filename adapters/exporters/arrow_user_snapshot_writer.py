@@ -0,0 +1,111 @@
+from collections.abc import AsyncIterable
+from typing import Any, Literal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from adapters.id import Ulid
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.user import ExportedUser
+
+COLOR_THEMES: pa.Array = pa.array([str(theme) for theme in ColorTheme], pa.string())
+LANGUAGES: pa.Array = pa.array([str(language) for language in Language], pa.string())
+
+
+class ArrowUserSnapshotWriter:
+    schema: pa.Schema = pa.schema(
+        [
+            pa.field('id', pa.binary(16), nullable=False),
+            pa.field('username', pa.string(), nullable=False),
+            pa.field('email', pa.string(), nullable=False),
+            pa.field('birth_date', pa.date32(), nullable=False),
+            pa.field(
+                'color_theme', pa.dictionary(pa.int8(), pa.string()), nullable=False
+            ),
+            pa.field('language', pa.dictionary(pa.int8(), pa.string()), nullable=False),
+            pa.field('is_active', pa.bool_(), nullable=False),
+            pa.field('created_at', pa.timestamp('us', tz='UTC'), nullable=False),
+        ]
+    )
+
+    def __init__(
+        self,
+        path: str,
+        format: Literal['arrow', 'parquet'],
+        rows_per_batch: int = 64 * 1024,
+    ) -> None:
+        self._path: str = path
+        self._format: Literal['arrow', 'parquet'] = format
+        self._rows_per_batch: int = rows_per_batch
+        self._color_theme_indexes: dict[ColorTheme, int] = {
+            theme: index for index, theme in enumerate(ColorTheme)
+        }
+        self._language_indexes: dict[Language, int] = {
+            language: index for index, language in enumerate(Language)
+        }
+
+    async def write(self, users: AsyncIterable[ExportedUser]) -> int:
+        writer: Any = self._open()
+        columns: dict[str, list[Any]] = self._empty_columns()
+        rows: int = 0
+
+        try:
+            async for user in users:
+                self._append(columns, user)
+
+                if len(columns['id']) == self._rows_per_batch:
+                    rows += self._flush(writer, columns)
+
+            if columns['id']:
+                rows += self._flush(writer, columns)
+        finally:
+            writer.close()
+
+        return rows
+
+    def _open(self) -> Any:
+        if self._format == 'parquet':
+            return pq.ParquetWriter(self._path, self.schema, compression='zstd')
+
+        return pa.ipc.new_file(self._path, self.schema)
+
+    def _empty_columns(self) -> dict[str, list[Any]]:
+        return {name: [] for name in self.schema.names}
+
+    def _append(self, columns: dict[str, list[Any]], user: ExportedUser) -> None:
+        columns['id'].append(bytes(Ulid(user.id)))
+        columns['username'].append(user.username)
+        columns['email'].append(user.email)
+        columns['birth_date'].append(user.birth_date)
+        columns['color_theme'].append(self._color_theme_indexes[user.color_theme])
+        columns['language'].append(self._language_indexes[user.language])
+        columns['is_active'].append(user.is_active)
+        columns['created_at'].append(user.created_at)
+
+    def _flush(self, writer: Any, columns: dict[str, list[Any]]) -> int:
+        rows: int = len(columns['id'])
+
+        writer.write_batch(
+            pa.RecordBatch.from_arrays(
+                [
+                    pa.array(columns['id'], pa.binary(16)),
+                    pa.array(columns['username'], pa.string()),
+                    pa.array(columns['email'], pa.string()),
+                    pa.array(columns['birth_date'], pa.date32()),
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(columns['color_theme'], pa.int8()), COLOR_THEMES
+                    ),
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(columns['language'], pa.int8()), LANGUAGES
+                    ),
+                    pa.array(columns['is_active'], pa.bool_()),
+                    pa.array(columns['created_at'], pa.timestamp('us', tz='UTC')),
+                ],
+                schema=self.schema,
+            )
+        )
+
+        for column in columns.values():
+            column.clear()
+
+        return rows
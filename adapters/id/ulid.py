@@ -1,5 +1,10 @@
+from datetime import datetime, timedelta, timezone
+from typing import Self
+
 from ulid import ULID
 
+EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 class Ulid:
     def __init__(self, value: str | bytes | None = None) -> None:
@@ -12,6 +17,12 @@ class Ulid:
         else:
             raise TypeError('ULID inválido')
 
+    @classmethod
+    def lower_bound(cls, moment: datetime) -> Self:
+        milliseconds: int = max(0, (moment - EPOCH) // timedelta(milliseconds=1))
+
+        return cls(milliseconds.to_bytes(6, 'big') + bytes(10))
+
     def __bytes__(self) -> bytes:
         return bytes(self._ulid)
 
@@ -1 +1,2 @@
+from .archived_user_model import ArchivedUserModel
 from .user_model import UserModel
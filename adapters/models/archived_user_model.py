@@ -0,0 +1,13 @@
+from typing import ClassVar
+
+from pymongo import ASCENDING
+
+from adapters.models.base import MongoIndex
+from adapters.models.user_model import UserModel
+
+
+class ArchivedUserModel(UserModel):
+    collection_name: ClassVar[str] = 'users_archive'
+    indexes: ClassVar[tuple[MongoIndex, ...]] = (
+        MongoIndex(name='email_unique', keys=(('email', ASCENDING),), unique=True),
+    )
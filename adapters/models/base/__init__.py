@@ -1 +1,2 @@
+from .mongo_index import MongoIndex
 from .mongo_model import MongoModel
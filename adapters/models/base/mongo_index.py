@@ -0,0 +1,24 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pymongo import IndexModel
+
+
+@dataclass(frozen=True)
+class MongoIndex:
+    name: str
+    keys: tuple[tuple[str, int], ...]
+    unique: bool = False
+    partial_filter: Mapping[str, Any] | None = None
+
+    def to_index_model(self) -> IndexModel:
+        if self.partial_filter is None:
+            return IndexModel(list(self.keys), name=self.name, unique=self.unique)
+
+        return IndexModel(
+            list(self.keys),
+            name=self.name,
+            unique=self.unique,
+            partialFilterExpression=dict(self.partial_filter),
+        )
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel, model_validator
 
+from .mongo_index import MongoIndex
+
 
 class MongoModel(ABC, BaseModel):
+    collection_name: ClassVar[str]
+    indexes: ClassVar[tuple[MongoIndex, ...]] = ()
+
     @abstractmethod
     def to_entity(self) -> Any: ...
 
@@ -1,12 +1,15 @@
+from collections.abc import Iterable, Mapping
 from datetime import date, datetime
-from typing import Annotated
+from typing import Annotated, Any, ClassVar
 
 from pydantic import ConfigDict, Field, field_validator
+from pymongo import ASCENDING
 
 from adapters.id import Ulid
-from adapters.models.base import MongoModel
+from adapters.models.base import MongoIndex, MongoModel
 from domain.entities import User
 from domain.value_objects import ColorTheme, Language
+from ports.repositories.user import ExportedUser
 
 
 class UserModel(MongoModel):
@@ -19,9 +22,41 @@ class UserModel(MongoModel):
     language: Language
     is_active: bool
     created_at: datetime
+    version: int = 0
+    deactivated_at: datetime | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    collection_name: ClassVar[str] = 'users'
+    indexes: ClassVar[tuple[MongoIndex, ...]] = (
+        MongoIndex(name='email_unique', keys=(('email', ASCENDING),), unique=True),
+        MongoIndex(
+            name='is_active_language_color_theme_id',
+            keys=(
+                ('is_active', ASCENDING),
+                ('language', ASCENDING),
+                ('color_theme', ASCENDING),
+                ('_id', ASCENDING),
+            ),
+        ),
+        MongoIndex(
+            name='deactivated_at_inactive',
+            keys=(('deactivated_at', ASCENDING),),
+            partial_filter={'is_active': False},
+        ),
+    )
+
+    export_projection: ClassVar[dict[str, bool]] = {
+        '_id': True,
+        'username': True,
+        'email': True,
+        'birth_date': True,
+        'color_theme': True,
+        'language': True,
+        'is_active': True,
+        'created_at': True,
+    }
+
     @field_validator('id', mode='before')
     @classmethod
     def cast_id(cls, id: str | bytes) -> bytes:
@@ -36,6 +71,58 @@ class UserModel(MongoModel):
             day=birth_date.day,
         )
 
+    @classmethod
+    def partial_document_from_entity(
+        cls, user: User, fields: Iterable[str]
+    ) -> dict[str, Any]:
+        document: dict[str, Any] = {field: getattr(user, field) for field in fields}
+
+        if 'birth_date' in document:
+            document['birth_date'] = cls.cast_birth_date(document['birth_date'])
+
+        return document
+
+    @classmethod
+    def entity_from_document(cls, document: Mapping[str, Any]) -> User:
+        birth_date: datetime = document['birth_date']
+
+        return User(
+            id=str(Ulid(document['_id'])),
+            birth_date=date(
+                year=birth_date.year,
+                month=birth_date.month,
+                day=birth_date.day,
+            ),
+            color_theme=ColorTheme(document['color_theme']),
+            created_at=document['created_at'],
+            email=document['email'],
+            hashed_password=document['hashed_password'],
+            is_active=document['is_active'],
+            language=Language(document['language']),
+            username=document['username'],
+            version=document.get('version', 0),
+            deactivated_at=document.get('deactivated_at'),
+        )
+
+    @classmethod
+    def exported_user_from_document(cls, document: Mapping[str, Any]) -> ExportedUser:
+        birth_date: datetime = document['birth_date']
+
+        return ExportedUser(
+            id=str(Ulid(document['_id'])),
+            username=document['username'],
+            email=document['email'],
+            birth_date=date(
+                year=birth_date.year,
+                month=birth_date.month,
+                day=birth_date.day,
+            ),
+            color_theme=ColorTheme(document['color_theme']),
+            language=Language(document['language']),
+            is_active=document['is_active'],
+            created_at=document['created_at'],
+        )
+
     def to_entity(self) -> User:
         return User(
             id=str(Ulid(self.id)),
@@ -51,4 +138,6 @@ class UserModel(MongoModel):
             is_active=self.is_active,
             language=self.language,
             username=self.username,
+            version=self.version,
+            deactivated_at=self.deactivated_at,
         )
@@ -0,0 +1,3 @@
+from .latency_histogram import LatencyHistogram
+from .mongo_command_monitor import MongoCommandMonitor
+from .query_stats import QueryStats
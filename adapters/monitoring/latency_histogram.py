@@ -0,0 +1,40 @@
+import bisect
+import threading
+
+
+class LatencyHistogram:
+    bounds_ms: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self) -> None:
+        self._bucket_counts: list[int] = [0] * (len(self.bounds_ms) + 1)
+        self._count: int = 0
+        self._total_ms: float = 0
+        self._max_ms: float = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, duration_ms: float) -> None:
+        bucket: int = bisect.bisect_left(self.bounds_ms, duration_ms)
+
+        with self._lock:
+            self._bucket_counts[bucket] += 1
+            self._count += 1
+            self._total_ms += duration_ms
+            self._max_ms = max(self._max_ms, duration_ms)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total_ms(self) -> float:
+        return self._total_ms
+
+    @property
+    def max_ms(self) -> float:
+        return self._max_ms
+
+    @property
+    def buckets(self) -> dict[str, int]:
+        labels: list[str] = [f'{bound:g}' for bound in self.bounds_ms] + ['inf']
+
+        return dict(zip(labels, self._bucket_counts))
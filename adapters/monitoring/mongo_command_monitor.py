@@ -0,0 +1,107 @@
+import json
+import logging
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from pymongo.monitoring import (
+    CommandFailedEvent,
+    CommandListener,
+    CommandStartedEvent,
+    CommandSucceededEvent,
+)
+
+from .latency_histogram import LatencyHistogram
+from .query_stats import QueryStats
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SHAPED_FIELDS: tuple[str, ...] = (
+    'filter',
+    'query',
+    'pipeline',
+    'updates',
+    'deletes',
+    'sort',
+    'hint',
+)
+
+
+class MongoCommandMonitor(CommandListener):
+    def __init__(self, slow_command_ms: float) -> None:
+        self._slow_command_ms: float = slow_command_ms
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self._started: dict[tuple[Any, int], tuple[str, Mapping[str, Any]]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def started(self, event: CommandStartedEvent) -> None:
+        self._started[(event.connection_id, event.request_id)] = (
+            self._collection(event.command_name, event.command),
+            event.command,
+        )
+
+    def succeeded(self, event: CommandSucceededEvent) -> None:
+        self._finish(event, failed=False)
+
+    def failed(self, event: CommandFailedEvent) -> None:
+        self._finish(event, failed=True)
+
+    @property
+    def histograms(self) -> dict[tuple[str, str], LatencyHistogram]:
+        return dict(self._histograms)
+
+    @classmethod
+    def shape(cls, command: Mapping[str, Any]) -> dict[str, Any]:
+        return {
+            field: cls._shape_value(command[field])
+            for field in SHAPED_FIELDS
+            if field in command
+        }
+
+    def _finish(
+        self, event: CommandSucceededEvent | CommandFailedEvent, *, failed: bool
+    ) -> None:
+        collection, command = self._started.pop(
+            (event.connection_id, event.request_id), ('', {})
+        )
+        duration_ms: float = event.duration_micros / 1000
+
+        self._histogram(event.command_name, collection).record(duration_ms)
+
+        if (stats := QueryStats.current()) is not None:
+            stats.record(duration_ms)
+
+        if duration_ms >= self._slow_command_ms:
+            logger.warning(
+                'slow mongo command %s on %s%s took %.1f ms: %s',
+                event.command_name,
+                collection or '-',
+                ' (failed)' if failed else '',
+                duration_ms,
+                json.dumps(self.shape(command), default=str),
+            )
+
+    def _histogram(self, command_name: str, collection: str) -> LatencyHistogram:
+        key: tuple[str, str] = (command_name, collection)
+
+        if (histogram := self._histograms.get(key)) is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+
+        return histogram
+
+    def _collection(self, command_name: str, command: Mapping[str, Any]) -> str:
+        target: Any = command.get(command_name)
+
+        # getMore names the cursor id first and the collection separately
+        return target if isinstance(target, str) else command.get('collection', '')
+
+    @classmethod
+    def _shape_value(cls, value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return {key: cls._shape_value(item) for key, item in value.items()}
+
+        if isinstance(value, list):
+            return [cls._shape_value(value[0])] if value else []
+
+        return '?'
@@ -0,0 +1,43 @@
+import threading
+from contextvars import ContextVar, Token
+from typing import ClassVar, Self
+
+
+class QueryStats:
+    _current: ClassVar[ContextVar['QueryStats | None']] = ContextVar(
+        'query_stats', default=None
+    )
+
+    def __init__(self) -> None:
+        self._count: int = 0
+        self._total_ms: float = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def current(cls) -> Self | None:
+        return cls._current.get()  # type: ignore
+
+    @classmethod
+    def start(cls) -> tuple[Self, Token['QueryStats | None']]:
+        stats: Self = cls()
+
+        return stats, cls._current.set(stats)
+
+    @classmethod
+    def stop(cls, token: Token['QueryStats | None']) -> None:
+        cls._current.reset(token)
+
+    def record(self, duration_ms: float) -> None:
+        # drivers run commands on executor threads with a copy of the request
+        # context, so the same instance may be updated from several threads
+        with self._lock:
+            self._count += 1
+            self._total_ms += duration_ms
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total_ms(self) -> float:
+        return self._total_ms
@@ -0,0 +1,3 @@
+from .in_memory_lease_repository import InMemoryLeaseRepository
+from .mongo_lease_repository import MongoLeaseRepository
+from .sqlite_lease_repository import SqliteLeaseRepository
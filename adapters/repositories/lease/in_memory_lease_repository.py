@@ -0,0 +1,21 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from ports.repositories.lease import ILeaseRepository
+
+
+class InMemoryLeaseRepository(ILeaseRepository):
+    def __init__(self) -> None:
+        self._holder: str = uuid4().hex
+        self._leases: dict[str, tuple[str, datetime]] = {}
+
+    async def acquire(self, name: str, ttl: timedelta) -> bool:
+        now: datetime = datetime.now(UTC)
+        holder, expires_at = self._leases.get(name, (self._holder, now))
+
+        if holder != self._holder and expires_at > now:
+            return False
+
+        self._leases[name] = self._holder, now + ttl
+
+        return True
@@ -0,0 +1,41 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+
+from adapters.repositories.mongo import MongoWriteConcerns
+from ports.repositories.lease import ILeaseRepository
+
+
+class MongoLeaseRepository(ILeaseRepository):
+    collection_name: str = 'leases'
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        write_concerns: MongoWriteConcerns = MongoWriteConcerns(),
+    ) -> None:
+        self._collection: AsyncIOMotorCollection = db.get_collection(
+            self.collection_name, write_concern=write_concerns.get('durable')
+        )
+        self._holder: str = uuid4().hex
+
+    async def acquire(self, name: str, ttl: timedelta) -> bool:
+        now: datetime = datetime.now(UTC)
+
+        try:
+            # a lease held by someone else and not expired matches nothing, so the
+            # upsert collides with its _id
+            await self._collection.update_one(
+                {
+                    '_id': name,
+                    '$or': [{'holder': self._holder}, {'expires_at': {'$lte': now}}],
+                },
+                {'$set': {'holder': self._holder, 'expires_at': now + ttl}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            return False
+
+        return True
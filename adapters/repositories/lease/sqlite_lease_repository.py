@@ -0,0 +1,47 @@
+import sqlite3
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+from adapters.repositories.sqlite import SqliteConnectionPool
+from ports.repositories.lease import ILeaseRepository
+
+SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+'''
+ACQUIRE: str = (
+    'INSERT INTO leases (name, holder, expires_at) VALUES (?1, ?2, ?3) '
+    'ON CONFLICT (name) DO UPDATE SET holder = excluded.holder, '
+    'expires_at = excluded.expires_at '
+    'WHERE leases.holder = excluded.holder OR leases.expires_at <= ?4'
+)
+
+
+class SqliteLeaseRepository(ILeaseRepository):
+    def __init__(self, pool: SqliteConnectionPool) -> None:
+        self._pool: SqliteConnectionPool = pool
+        self._holder: str = uuid4().hex
+
+    @classmethod
+    async def create_schema(cls, pool: SqliteConnectionPool) -> None:
+        def create(connection: sqlite3.Connection) -> None:
+            connection.executescript(SCHEMA)
+
+        await pool.run(create)
+
+    async def acquire(self, name: str, ttl: timedelta) -> bool:
+        now: float = time.time()
+
+        def acquire(connection: sqlite3.Connection) -> bool:
+            return (
+                connection.execute(
+                    ACQUIRE, (name, self._holder, now + ttl.total_seconds(), now)
+                ).rowcount
+                == 1
+            )
+
+        return await self._pool.run(acquire)
@@ -0,0 +1 @@
+from .mongo_write_concerns import MongoWriteConcerns, WriteConcernProfile
@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from typing import Literal
+
+from pymongo import WriteConcern
+
+WriteConcernProfile = Literal['fast', 'durable']
+
+
+@dataclass(frozen=True, kw_only=True)
+class MongoWriteConcerns:
+    fast: WriteConcern = field(default_factory=lambda: WriteConcern(w=1))
+    durable: WriteConcern = field(
+        default_factory=lambda: WriteConcern(w='majority', j=True)
+    )
+
+    def get(self, profile: WriteConcernProfile) -> WriteConcern:
+        return self.fast if profile == 'fast' else self.durable
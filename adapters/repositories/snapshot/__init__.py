@@ -0,0 +1,3 @@
+from .in_memory_snapshot_repository import InMemorySnapshotRepository
+from .mongo_snapshot_repository import MongoSnapshotRepository
+from .sqlite_snapshot_repository import SqliteSnapshotRepository
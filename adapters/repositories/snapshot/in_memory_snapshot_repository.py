@@ -0,0 +1,12 @@
+from ports.repositories.snapshot import ISnapshotRepository, StoredSnapshot
+
+
+class InMemorySnapshotRepository(ISnapshotRepository):
+    def __init__(self) -> None:
+        self._snapshots: dict[str, StoredSnapshot] = {}
+
+    async def get(self, name: str) -> StoredSnapshot | None:
+        return self._snapshots.get(name)
+
+    async def save(self, name: str, snapshot: StoredSnapshot) -> None:
+        self._snapshots[name] = snapshot
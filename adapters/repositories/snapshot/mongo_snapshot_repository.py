@@ -0,0 +1,32 @@
+from datetime import timezone
+from typing import Any
+
+from bson import Binary
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+from ports.repositories.snapshot import ISnapshotRepository, StoredSnapshot
+
+
+class MongoSnapshotRepository(ISnapshotRepository):
+    collection_name: str = 'snapshots'
+
+    def __init__(self, db: AsyncIOMotorDatabase) -> None:
+        self._collection: AsyncIOMotorCollection = db[self.collection_name]
+
+    async def get(self, name: str) -> StoredSnapshot | None:
+        document: dict[str, Any] | None = await self._collection.find_one({'_id': name})
+
+        if document is None:
+            return None
+
+        return StoredSnapshot(
+            taken_at=document['taken_at'].replace(tzinfo=timezone.utc),
+            data=bytes(document['data']),
+        )
+
+    async def save(self, name: str, snapshot: StoredSnapshot) -> None:
+        await self._collection.replace_one(
+            {'_id': name},
+            {'taken_at': snapshot.taken_at, 'data': Binary(snapshot.data)},
+            upsert=True,
+        )
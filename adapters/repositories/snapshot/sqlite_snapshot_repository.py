@@ -0,0 +1,51 @@
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any
+
+from adapters.repositories.sqlite import SqliteConnectionPool
+from ports.repositories.snapshot import ISnapshotRepository, StoredSnapshot
+
+SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS snapshots (
+    name TEXT PRIMARY KEY,
+    taken_at TEXT NOT NULL,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+'''
+SELECT: str = 'SELECT taken_at, data FROM snapshots WHERE name = ?'
+UPSERT: str = (
+    'INSERT INTO snapshots (name, taken_at, data) VALUES (?, ?, ?) '
+    'ON CONFLICT (name) DO UPDATE SET taken_at = excluded.taken_at, '
+    'data = excluded.data'
+)
+
+
+class SqliteSnapshotRepository(ISnapshotRepository):
+    def __init__(self, pool: SqliteConnectionPool) -> None:
+        self._pool: SqliteConnectionPool = pool
+
+    @classmethod
+    async def create_schema(cls, pool: SqliteConnectionPool) -> None:
+        def create(connection: sqlite3.Connection) -> None:
+            connection.executescript(SCHEMA)
+
+        await pool.run(create)
+
+    async def get(self, name: str) -> StoredSnapshot | None:
+        row: tuple[Any, ...] | None = await self._pool.run(
+            lambda connection: connection.execute(SELECT, (name,)).fetchone()
+        )
+
+        if row is None:
+            return None
+
+        return StoredSnapshot(taken_at=datetime.fromisoformat(row[0]), data=row[1])
+
+    async def save(self, name: str, snapshot: StoredSnapshot) -> None:
+        taken_at: str = snapshot.taken_at.astimezone(timezone.utc).isoformat()
+
+        await self._pool.run(
+            lambda connection: connection.execute(
+                UPSERT, (name, taken_at, snapshot.data)
+            )
+        )
@@ -0,0 +1 @@
+from .sqlite_connection_pool import SqliteConnectionPool
@@ -0,0 +1,76 @@
+import asyncio
+import sqlite3
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar('T')
+
+
+class SqliteConnectionPool:
+    def __init__(self, path: str, size: int, busy_timeout_ms: int = 5000) -> None:
+        self._path: str = path
+        self._size: int = size
+        self._busy_timeout_ms: int = busy_timeout_ms
+        self._idle: asyncio.Queue[sqlite3.Connection] = asyncio.Queue()
+        self._connections: list[sqlite3.Connection] = []
+        self._connecting: int = 0
+
+    async def run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        connection: sqlite3.Connection = await self._acquire()
+        thread: asyncio.Task[T] = asyncio.ensure_future(
+            asyncio.to_thread(operation, connection)
+        )
+        # a cancelled caller must not hand the connection over while the thread uses it
+        thread.add_done_callback(lambda _: self._release(connection))
+
+        return await asyncio.shield(thread)
+
+    def close(self) -> None:
+        for connection in self._connections:
+            connection.close()
+
+        self._connections = []
+        self._idle = asyncio.Queue()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def open_connections(self) -> int:
+        return len(self._connections)
+
+    async def _acquire(self) -> sqlite3.Connection:
+        if (
+            self._idle.empty()
+            and len(self._connections) + self._connecting < self._size
+        ):
+            self._connecting += 1
+
+            try:
+                connection: sqlite3.Connection = await asyncio.to_thread(self._connect)
+            finally:
+                self._connecting -= 1
+
+            self._connections.append(connection)
+
+            return connection
+
+        return await self._idle.get()
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        if connection in self._connections:
+            self._idle.put_nowait(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(f'PRAGMA busy_timeout={self._busy_timeout_ms}')
+
+        return connection
@@ -1 +1,4 @@
+from .coalescing_user_repository import CoalescingUserRepository
+from .in_memory_user_repository import InMemoryUserRepository
 from .mongo_user_repository import MongoUserRepository
+from .sqlite_user_repository import SqliteUserRepository
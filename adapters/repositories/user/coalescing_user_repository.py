@@ -0,0 +1,121 @@
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from copy import deepcopy
+from datetime import datetime
+
+from domain.entities import User
+from ports.repositories.user import ExportedUser, IUserRepository, UserFilters
+
+
+class CoalescingUserRepository(IUserRepository):
+    def __init__(self, repository: IUserRepository) -> None:
+        self._repository: IUserRepository = repository
+        self._pending: dict[str, list[asyncio.Future[User | None]]] = {}
+        self._flush_scheduled: bool = False
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def archive_deactivated(
+        self, deactivated_before: datetime, limit: int
+    ) -> int:
+        return await self._repository.archive_deactivated(deactivated_before, limit)
+
+    async def count_signups(self, boundaries: Sequence[datetime]) -> list[int]:
+        return await self._repository.count_signups(boundaries)
+
+    async def create(self, user: User) -> None:
+        await self._repository.create(user)
+
+    async def create_many(self, users: Sequence[User]) -> list[bool]:
+        return await self._repository.create_many(users)
+
+    def export(
+        self, batch_size: int, include_archived: bool = False
+    ) -> AsyncIterator[ExportedUser]:
+        return self._repository.export(batch_size, include_archived)
+
+    async def get_by_email(self, email: str) -> User | None:
+        return await self._repository.get_by_email(email)
+
+    async def get_by_id(self, user_id: str) -> User | None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[User | None] = loop.create_future()
+
+        self._pending.setdefault(user_id, []).append(future)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+
+        return await future
+
+    async def get_by_ids(self, user_ids: Sequence[str]) -> list[User]:
+        return await self._repository.get_by_ids(user_ids)
+
+    async def list_users(
+        self, after_id: str | None, limit: int, filters: UserFilters
+    ) -> list[User]:
+        return await self._repository.list_users(after_id, limit, filters)
+
+    async def update(self, user: User) -> None:
+        await self._repository.update(user)
+
+    def _flush(self) -> None:
+        pending: dict[str, list[asyncio.Future[User | None]]] = self._pending
+
+        self._pending = {}
+        self._flush_scheduled = False
+
+        batch: asyncio.Task[None] = asyncio.create_task(self._load(pending))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _load(
+        self, pending: dict[str, list[asyncio.Future[User | None]]]
+    ) -> None:
+        try:
+            users: list[User] = await self._repository.get_by_ids(list(pending))
+        except (TypeError, ValueError):
+            # one malformed id rejects the whole batch, so each id gets its own answer
+            await asyncio.gather(
+                *(
+                    self._load_one(user_id, futures)
+                    for user_id, futures in pending.items()
+                )
+            )
+            return
+        except Exception as e:
+            for futures in pending.values():
+                self._fail(futures, e)
+            return
+
+        users_by_id: dict[str, User] = {user.id: user for user in users}
+
+        for user_id, futures in pending.items():
+            self._resolve(futures, users_by_id.get(user_id))
+
+    async def _load_one(
+        self, user_id: str, futures: list[asyncio.Future[User | None]]
+    ) -> None:
+        try:
+            user: User | None = await self._repository.get_by_id(user_id)
+        except Exception as e:
+            self._fail(futures, e)
+            return
+
+        self._resolve(futures, user)
+
+    def _fail(
+        self, futures: list[asyncio.Future[User | None]], error: Exception
+    ) -> None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _resolve(
+        self, futures: list[asyncio.Future[User | None]], user: User | None
+    ) -> None:
+        for index, future in enumerate(futures):
+            if not future.done():
+                future.set_result(
+                    user if index == 0 or user is None else deepcopy(user)
+                )
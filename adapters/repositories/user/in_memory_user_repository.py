@@ -0,0 +1,160 @@
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Sequence
+from copy import deepcopy
+from datetime import datetime, timezone
+
+from adapters.id import Ulid
+from domain.entities import User
+from ports.repositories.exceptions import RepositoryException
+from ports.repositories.user import ExportedUser, IUserRepository, UserFilters
+
+
+class InMemoryUserRepository(IUserRepository):
+    def __init__(self) -> None:
+        self._users_by_id: dict[str, User] = {}
+        self._archived_users_by_id: dict[str, User] = {}
+        self._ids_by_email: dict[str, str] = {}
+
+    async def archive_deactivated(
+        self, deactivated_before: datetime, limit: int
+    ) -> int:
+        deactivated_users: list[tuple[datetime, str]] = sorted(
+            (user.deactivated_at or datetime.min.replace(tzinfo=timezone.utc), user.id)
+            for user in self._users_by_id.values()
+            if not user.is_active
+            and (
+                user.deactivated_at is None or user.deactivated_at < deactivated_before
+            )
+        )
+
+        for _, user_id in deactivated_users[:limit]:
+            self._archived_users_by_id[user_id] = self._users_by_id.pop(user_id)
+
+        return len(deactivated_users[:limit])
+
+    async def count_signups(self, boundaries: Sequence[datetime]) -> list[int]:
+        user_ids: list[str] = sorted([*self._users_by_id, *self._archived_users_by_id])
+        positions: list[int] = [
+            bisect_left(user_ids, str(Ulid.lower_bound(boundary)))
+            for boundary in boundaries
+        ]
+
+        return [end - start for start, end in zip(positions, positions[1:])]
+
+    async def create(self, user: User) -> None:
+        if user.id in self._users_by_id or user.id in self._archived_users_by_id:
+            raise RepositoryException.AlreadyExists('id')
+
+        if user.email in self._ids_by_email:
+            raise RepositoryException.AlreadyExists('email')
+
+        self._store(user)
+
+    async def create_many(self, users: Sequence[User]) -> list[bool]:
+        created: list[bool] = []
+
+        for user in users:
+            try:
+                await self.create(user)
+            except RepositoryException.AlreadyExists:
+                created.append(False)
+            else:
+                created.append(True)
+
+        return created
+
+    async def export(
+        self, batch_size: int, include_archived: bool = False
+    ) -> AsyncIterator[ExportedUser]:
+        users_by_id: dict[str, User] = (
+            {**self._users_by_id, **self._archived_users_by_id}
+            if include_archived
+            else self._users_by_id
+        )
+
+        for user_id in sorted(users_by_id):
+            user: User | None = users_by_id.get(user_id)
+
+            if user is None:
+                continue
+
+            yield ExportedUser(
+                id=user.id,
+                username=user.username,
+                email=user.email,
+                birth_date=user.birth_date,
+                color_theme=user.color_theme,
+                language=user.language,
+                is_active=user.is_active,
+                created_at=user.created_at,
+            )
+
+    async def get_by_email(self, email: str) -> User | None:
+        user_id: str | None = self._ids_by_email.get(email)
+
+        return None if user_id is None else self._load(user_id)
+
+    async def get_by_id(self, user_id: str) -> User | None:
+        return self._load(user_id)
+
+    async def get_by_ids(self, user_ids: Sequence[str]) -> list[User]:
+        return [
+            user
+            for user_id in dict.fromkeys(user_ids)
+            if (user := self._load(user_id)) is not None
+        ]
+
+    async def list_users(
+        self, after_id: str | None, limit: int, filters: UserFilters
+    ) -> list[User]:
+        users: list[User] = []
+
+        for user_id in sorted(self._users_by_id):
+            user: User = self._users_by_id[user_id]
+
+            if after_id is not None and user_id <= after_id:
+                continue
+
+            if (
+                (filters.is_active is None or user.is_active == filters.is_active)
+                and (filters.language is None or user.language == filters.language)
+                and (
+                    filters.color_theme is None
+                    or user.color_theme == filters.color_theme
+                )
+            ):
+                users.append(deepcopy(user))
+
+            if len(users) == limit:
+                break
+
+        return users
+
+    async def update(self, user: User) -> None:
+        if not user.changed_fields:
+            return
+
+        stored_user: User | None = self._users_by_id.get(user.id)
+
+        if stored_user is None or stored_user.version != user.version:
+            raise RepositoryException.Conflict(user.id)
+
+        if self._ids_by_email.get(user.email, user.id) != user.id:
+            raise RepositoryException.AlreadyExists('email')
+
+        del self._ids_by_email[stored_user.email]
+        user.increment_version()
+        self._store(user)
+
+    def _store(self, user: User) -> None:
+        user.clear_changes()
+
+        self._users_by_id[user.id] = deepcopy(user)
+        self._ids_by_email[user.email] = user.id
+
+    def _load(self, user_id: str) -> User | None:
+        user: User | None = self._users_by_id.get(
+            user_id, self._archived_users_by_id.get(user_id)
+        )
+
+        return None if user is None else deepcopy(user)
@@ -1,39 +1,299 @@
-from typing import Any
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, ClassVar, get_args
 
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from motor.motor_asyncio import (
+    AsyncIOMotorCollection,
+    AsyncIOMotorCursor,
+    AsyncIOMotorDatabase,
+)
+from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pymongo.results import UpdateResult
 
 from adapters.id import Ulid
-from adapters.models import UserModel
+from adapters.models import ArchivedUserModel, UserModel
+from adapters.repositories.mongo import MongoWriteConcerns, WriteConcernProfile
 from domain.entities import User
-from ports.repositories.user import IUserRepository
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.exceptions import RepositoryException
+from ports.repositories.user import ExportedUser, IUserRepository, UserFilters
+
+DUPLICATE_KEY_ERROR_CODE: int = 11000
 
 
 class MongoUserRepository(IUserRepository):
-    def __init__(self, db: AsyncIOMotorDatabase) -> None:
-        self._collection: AsyncIOMotorCollection = db['users']
+    write_concern_profiles: ClassVar[dict[str, WriteConcernProfile]] = {
+        'archive_deactivated': 'durable',
+        'create': 'durable',
+        'create_many': 'durable',
+        'update': 'durable',
+        'update_preferences': 'fast',
+    }
+    preference_fields: ClassVar[frozenset[str]] = frozenset({'color_theme', 'language'})
+    # archived users leave a stub behind so the email_unique index keeps
+    # their email reserved and lookups know to read the archive
+    tombstone: ClassVar[list[dict[str, Any]]] = [
+        {'$replaceWith': {'_id': '$_id', 'email': '$email', 'archived': True}}
+    ]
+    not_archived: ClassVar[dict[str, Any]] = {'archived': {'$exists': False}}
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        write_concerns: MongoWriteConcerns = MongoWriteConcerns(),
+    ) -> None:
+        self._collection: AsyncIOMotorCollection = db[UserModel.collection_name]
+        self._archive: AsyncIOMotorCollection = db[ArchivedUserModel.collection_name]
+        self._writers: dict[tuple[str, WriteConcernProfile], AsyncIOMotorCollection] = {
+            (collection.name, profile): collection.with_options(
+                write_concern=write_concerns.get(profile)
+            )
+            for collection in (self._collection, self._archive)
+            for profile in get_args(WriteConcernProfile)
+        }
+
+    async def archive_deactivated(
+        self, deactivated_before: datetime, limit: int
+    ) -> int:
+        documents: list[dict[str, Any]] = (
+            # users deactivated before deactivated_at existed have no date and go first
+            await self._collection.find(
+                {
+                    'is_active': False,
+                    'deactivated_at': {'$not': {'$gte': deactivated_before}},
+                }
+            )
+            .sort('deactivated_at', ASCENDING)
+            .hint('deactivated_at_inactive')
+            .limit(limit)
+            .to_list(length=None)
+        )
+
+        if not documents:
+            return 0
+
+        archived_ids: set[bytes] = {document['_id'] for document in documents}
+
+        try:
+            await self._writer(self._archive, 'archive_deactivated').insert_many(
+                documents, ordered=False
+            )
+        except BulkWriteError as e:
+            for error in e.details['writeErrors']:
+                if error['code'] != DUPLICATE_KEY_ERROR_CODE:
+                    raise
+
+                # a duplicate _id was copied by an interrupted run; any other
+                # duplicate stays in the hot collection
+                if '_id' not in error.get('keyPattern', {}):
+                    archived_ids.discard(documents[error['index']]['_id'])
+
+        result: UpdateResult = await self._writer(
+            self._collection, 'archive_deactivated'
+        ).update_many(
+            {'_id': {'$in': list(archived_ids)}, 'is_active': False}, self.tombstone
+        )
+
+        return result.modified_count
+
+    async def count_signups(self, boundaries: Sequence[datetime]) -> list[int]:
+        bounds: list[bytes] = [
+            bytes(Ulid.lower_bound(boundary)) for boundary in boundaries
+        ]
+        # the _id range scan only reads the index, no document is fetched;
+        # archived users keep their _id in the hot collection, so it counts them
+        pipeline: list[dict[str, Any]] = [
+            {'$match': {'_id': {'$gte': bounds[0], '$lt': bounds[-1]}}},
+            {
+                '$bucket': {
+                    'groupBy': '$_id',
+                    'boundaries': bounds,
+                    'output': {'count': {'$sum': 1}},
+                }
+            },
+        ]
+        counts: dict[bytes, int] = dict.fromkeys(bounds[:-1], 0)
+
+        async for bucket in self._collection.aggregate(pipeline):
+            counts[bucket['_id']] = bucket['count']
+
+        return list(counts.values())
 
     async def create(self, user: User) -> None:
         user_model: UserModel = UserModel.from_entity(user)
 
-        await self._collection.insert_one(user_model.to_document())
+        try:
+            await self._writer(self._collection, 'create').insert_one(
+                user_model.to_document()
+            )
+        except DuplicateKeyError as e:
+            raise self._already_exists(e) from e
+
+        user.clear_changes()
+
+    async def create_many(self, users: Sequence[User]) -> list[bool]:
+        if not users:
+            return []
+
+        created: list[bool] = [True] * len(users)
+
+        try:
+            await self._writer(self._collection, 'create_many').insert_many(
+                [UserModel.from_entity(user).to_document() for user in users],
+                ordered=False,
+            )
+        except BulkWriteError as e:
+            for error in e.details['writeErrors']:
+                if error['code'] != DUPLICATE_KEY_ERROR_CODE:
+                    raise
+
+                created[error['index']] = False
+
+        for user, was_created in zip(users, created):
+            if was_created:
+                user.clear_changes()
+
+        return created
+
+    async def export(
+        self, batch_size: int, include_archived: bool = False
+    ) -> AsyncIterator[ExportedUser]:
+        queries: list[tuple[AsyncIOMotorCollection, dict[str, Any]]] = [
+            (self._collection, self.not_archived)
+        ]
+
+        if include_archived:
+            queries.append((self._archive, {}))
+
+        for collection, query in queries:
+            cursor: AsyncIOMotorCursor = collection.find(
+                query, UserModel.export_projection, batch_size=batch_size
+            ).sort('_id', ASCENDING)
+
+            async for document in cursor:
+                yield UserModel.exported_user_from_document(document)
 
     async def get_by_email(self, email: str) -> User | None:
-        user: dict[str, Any] | None = await self._collection.find_one({'email': email})
+        user: dict[str, Any] | None = await self._find_one({'email': email})
 
         if user is not None:
-            return UserModel.from_document(user).to_entity()
+            return UserModel.entity_from_document(user)
 
     async def get_by_id(self, user_id: str) -> User | None:
-        user: dict[str, Any] | None = await self._collection.find_one(
+        user: dict[str, Any] | None = await self._find_one(
             {'_id': bytes(Ulid(user_id))}
         )
 
         if user is not None:
-            return UserModel.from_document(user).to_entity()
+            return UserModel.entity_from_document(user)
 
-    async def update(self, user: User) -> None:
-        user_model: UserModel = UserModel.from_entity(user)
+    async def get_by_ids(self, user_ids: Sequence[str]) -> list[User]:
+        ids: set[bytes] = {bytes(Ulid(user_id)) for user_id in user_ids}
+        users: list[dict[str, Any]] = await self._collection.find(
+            {'_id': {'$in': list(ids)}}
+        ).to_list(length=None)
+
+        archived_ids: set[bytes] = {user['_id'] for user in users if 'archived' in user}
+        users = [user for user in users if 'archived' not in user]
 
-        await self._collection.replace_one(
-            {'_id': user_model.id}, user_model.to_document()
+        if archived_ids:
+            users.extend(
+                await self._archive.find({'_id': {'$in': list(archived_ids)}}).to_list(
+                    length=None
+                )
+            )
+
+        return [UserModel.entity_from_document(user) for user in users]
+
+    async def list_users(
+        self, after_id: str | None, limit: int, filters: UserFilters
+    ) -> list[User]:
+        query: dict[str, Any] = {
+            'is_active': (
+                {'$in': [True, False]}
+                if filters.is_active is None
+                else filters.is_active
+            ),
+            'language': (
+                {'$in': list(Language)}
+                if filters.language is None
+                else filters.language
+            ),
+            'color_theme': (
+                {'$in': list(ColorTheme)}
+                if filters.color_theme is None
+                else filters.color_theme
+            ),
+        }
+
+        if after_id is not None:
+            query['_id'] = {'$gt': bytes(Ulid(after_id))}
+
+        users: list[dict[str, Any]] = (
+            await self._collection.find(query)
+            .sort('_id', ASCENDING)
+            .hint('is_active_language_color_theme_id')
+            .limit(limit)
+            .batch_size(limit)
+            .to_list(length=None)
         )
+
+        return [UserModel.entity_from_document(user) for user in users]
+
+    async def update(self, user: User) -> None:
+        if not user.changed_fields:
+            return
+
+        try:
+            result: UpdateResult = await self._writer(
+                self._collection,
+                (
+                    'update_preferences'
+                    if user.changed_fields <= self.preference_fields
+                    else 'update'
+                ),
+            ).update_one(
+                {
+                    '_id': bytes(Ulid(user.id)),
+                    # documents written before versioning have no version field
+                    'version': user.version if user.version else {'$in': [0, None]},
+                    **self.not_archived,
+                },
+                {
+                    '$set': UserModel.partial_document_from_entity(
+                        user, user.changed_fields
+                    ),
+                    '$inc': {'version': 1},
+                },
+            )
+        except DuplicateKeyError as e:
+            raise self._already_exists(e) from e
+
+        if result.matched_count == 0:
+            raise RepositoryException.Conflict(user.id)
+
+        user.increment_version()
+        user.clear_changes()
+
+    def _writer(
+        self, collection: AsyncIOMotorCollection, operation: str
+    ) -> AsyncIOMotorCollection:
+        return self._writers[collection.name, self.write_concern_profiles[operation]]
+
+    async def _find_one(self, query: dict[str, Any]) -> dict[str, Any] | None:
+        user: dict[str, Any] | None = await self._collection.find_one(query)
+
+        if user is not None and 'archived' in user:
+            # archived accounts still answer lookups, e.g. to report that
+            # they are deactivated instead of unknown
+            user = await self._archive.find_one({'_id': user['_id']})
+
+        return user
+
+    def _already_exists(
+        self, error: DuplicateKeyError
+    ) -> RepositoryException.AlreadyExists:
+        key_pattern: dict[str, Any] = (error.details or {}).get('keyPattern', {})
+
+        return RepositoryException.AlreadyExists(next(iter(key_pattern), 'email'))
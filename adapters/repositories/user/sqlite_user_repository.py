@@ -0,0 +1,405 @@
+import sqlite3
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import date, datetime, timezone
+from typing import Any, TypeVar
+
+from adapters.id import Ulid
+from adapters.repositories.sqlite import SqliteConnectionPool
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.exceptions import RepositoryException
+from ports.repositories.user import ExportedUser, IUserRepository, UserFilters
+
+T = TypeVar('T')
+
+SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS users (
+    id BLOB PRIMARY KEY,
+    username TEXT NOT NULL,
+    email TEXT NOT NULL,
+    hashed_password TEXT NOT NULL,
+    birth_date TEXT NOT NULL,
+    color_theme TEXT NOT NULL,
+    language TEXT NOT NULL,
+    is_active INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    deactivated_at TEXT
+) WITHOUT ROWID;
+
+CREATE UNIQUE INDEX IF NOT EXISTS users_email_unique ON users (email);
+
+CREATE INDEX IF NOT EXISTS users_is_active_language_color_theme_id
+    ON users (is_active, language, color_theme, id);
+'''
+
+ARCHIVE_SCHEMA: str = '''
+CREATE INDEX IF NOT EXISTS users_deactivated_at_inactive
+    ON users (deactivated_at) WHERE is_active = 0;
+
+CREATE TABLE IF NOT EXISTS users_archive (
+    id BLOB PRIMARY KEY,
+    username TEXT NOT NULL,
+    email TEXT NOT NULL,
+    hashed_password TEXT NOT NULL,
+    birth_date TEXT NOT NULL,
+    color_theme TEXT NOT NULL,
+    language TEXT NOT NULL,
+    is_active INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    deactivated_at TEXT
+) WITHOUT ROWID;
+
+CREATE UNIQUE INDEX IF NOT EXISTS users_archive_email_unique
+    ON users_archive (email);
+
+CREATE TRIGGER IF NOT EXISTS users_insert_archived_email
+BEFORE INSERT ON users
+WHEN EXISTS (SELECT 1 FROM users_archive WHERE email = NEW.email)
+BEGIN
+    SELECT RAISE(ABORT, 'UNIQUE constraint failed: users.email');
+END;
+
+CREATE TRIGGER IF NOT EXISTS users_update_archived_email
+BEFORE UPDATE OF email ON users
+WHEN EXISTS (SELECT 1 FROM users_archive WHERE email = NEW.email)
+BEGIN
+    SELECT RAISE(ABORT, 'UNIQUE constraint failed: users.email');
+END;
+'''
+
+MIGRATIONS: dict[str, str] = {
+    'version': 'INTEGER NOT NULL DEFAULT 0',
+    'deactivated_at': 'TEXT',
+}
+
+COLUMNS: str = (
+    'id, username, email, hashed_password, birth_date, '
+    'color_theme, language, is_active, created_at, version, deactivated_at'
+)
+
+INSERT: str = f'INSERT INTO users ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+SELECT_BY_EMAIL: str = (
+    f'SELECT {COLUMNS} FROM users WHERE email = ? '
+    f'UNION ALL SELECT {COLUMNS} FROM users_archive WHERE email = ? LIMIT 1'
+)
+SELECT_BY_ID: str = (
+    f'SELECT {COLUMNS} FROM users WHERE id = ? '
+    f'UNION ALL SELECT {COLUMNS} FROM users_archive WHERE id = ? LIMIT 1'
+)
+SELECT_ARCHIVABLE_IDS: str = (
+    'SELECT id FROM users WHERE is_active = 0 '
+    'AND (deactivated_at IS NULL OR deactivated_at < ?) '
+    'ORDER BY deactivated_at, id LIMIT ?'
+)
+ARCHIVE: str = (
+    f'INSERT INTO users_archive ({COLUMNS}) '
+    f'SELECT {COLUMNS} FROM users WHERE id IN ({SELECT_ARCHIVABLE_IDS})'
+)
+COUNT_SIGNUPS: str = (
+    'SELECT (SELECT COUNT(*) FROM users WHERE id >= ?1 AND id < ?2) '
+    '+ (SELECT COUNT(*) FROM users_archive WHERE id >= ?1 AND id < ?2)'
+)
+DELETE_ARCHIVED: str = f'DELETE FROM users WHERE id IN ({SELECT_ARCHIVABLE_IDS})'
+SELECT_EXPORT_PAGE: str = (
+    'SELECT id, username, email, birth_date, color_theme, language, is_active, '
+    'created_at FROM {table} WHERE id > ? ORDER BY id LIMIT ?'
+)
+
+MAX_VARIABLES: int = 500
+
+
+class SqliteUserRepository(IUserRepository):
+    def __init__(self, pool: SqliteConnectionPool) -> None:
+        self._pool: SqliteConnectionPool = pool
+
+    @classmethod
+    async def create_schema(cls, pool: SqliteConnectionPool) -> None:
+        def create(connection: sqlite3.Connection) -> None:
+            connection.executescript(SCHEMA)
+
+            columns: set[str] = {
+                row[1] for row in connection.execute('PRAGMA table_info(users)')
+            }
+
+            for column, definition in MIGRATIONS.items():
+                if column not in columns:
+                    connection.execute(
+                        f'ALTER TABLE users ADD COLUMN {column} {definition}'
+                    )
+
+            connection.executescript(ARCHIVE_SCHEMA)
+
+        await pool.run(create)
+
+    async def archive_deactivated(
+        self, deactivated_before: datetime, limit: int
+    ) -> int:
+        parameters: tuple[Any, ...] = (
+            deactivated_before.astimezone(timezone.utc).isoformat(),
+            limit,
+        )
+
+        def archive(connection: sqlite3.Connection) -> int:
+            connection.execute('BEGIN IMMEDIATE')
+
+            try:
+                archived: int = connection.execute(ARCHIVE, parameters).rowcount
+                connection.execute(DELETE_ARCHIVED, parameters)
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+
+            connection.execute('COMMIT')
+
+            return archived
+
+        return await self._pool.run(archive)
+
+    async def count_signups(self, boundaries: Sequence[datetime]) -> list[int]:
+        bounds: list[bytes] = [
+            bytes(Ulid.lower_bound(boundary)) for boundary in boundaries
+        ]
+
+        def count(connection: sqlite3.Connection) -> list[int]:
+            return [
+                connection.execute(COUNT_SIGNUPS, (start, end)).fetchone()[0]
+                for start, end in zip(bounds, bounds[1:])
+            ]
+
+        return await self._pool.run(count)
+
+    async def create(self, user: User) -> None:
+        row: tuple[Any, ...] = self._to_row(user)
+
+        await self._write(lambda connection: connection.execute(INSERT, row))
+
+        user.clear_changes()
+
+    async def create_many(self, users: Sequence[User]) -> list[bool]:
+        rows: list[tuple[Any, ...]] = [self._to_row(user) for user in users]
+
+        def insert(connection: sqlite3.Connection) -> list[bool]:
+            created: list[bool] = []
+
+            connection.execute('BEGIN')
+
+            try:
+                for row in rows:
+                    try:
+                        connection.execute(INSERT, row)
+                    except sqlite3.IntegrityError as e:
+                        if not str(e).startswith('UNIQUE constraint failed'):
+                            raise
+
+                        created.append(False)
+                    else:
+                        created.append(True)
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+
+            connection.execute('COMMIT')
+
+            return created
+
+        created: list[bool] = await self._pool.run(insert)
+
+        for user, was_created in zip(users, created):
+            if was_created:
+                user.clear_changes()
+
+        return created
+
+    async def export(
+        self, batch_size: int, include_archived: bool = False
+    ) -> AsyncIterator[ExportedUser]:
+        async for user in self._export_table('users', batch_size):
+            yield user
+
+        if include_archived:
+            async for user in self._export_table('users_archive', batch_size):
+                yield user
+
+    async def _export_table(
+        self, table: str, batch_size: int
+    ) -> AsyncIterator[ExportedUser]:
+        select_page: str = SELECT_EXPORT_PAGE.format(table=table)
+        after_id: bytes = b''
+
+        while True:
+            rows: list[tuple[Any, ...]] = await self._pool.run(
+                lambda connection: connection.execute(
+                    select_page, (after_id, batch_size)
+                ).fetchall()
+            )
+
+            for row in rows:
+                yield ExportedUser(
+                    id=str(Ulid(row[0])),
+                    username=row[1],
+                    email=row[2],
+                    birth_date=date.fromisoformat(row[3]),
+                    color_theme=ColorTheme(row[4]),
+                    language=Language(row[5]),
+                    is_active=bool(row[6]),
+                    created_at=datetime.fromisoformat(row[7]),
+                )
+
+            if len(rows) < batch_size:
+                return
+
+            after_id = rows[-1][0]
+
+    async def get_by_email(self, email: str) -> User | None:
+        row: tuple[Any, ...] | None = await self._pool.run(
+            lambda connection: connection.execute(
+                SELECT_BY_EMAIL, (email, email)
+            ).fetchone()
+        )
+
+        return None if row is None else self._to_entity(row)
+
+    async def get_by_id(self, user_id: str) -> User | None:
+        user_id_bytes: bytes = bytes(Ulid(user_id))
+        row: tuple[Any, ...] | None = await self._pool.run(
+            lambda connection: connection.execute(
+                SELECT_BY_ID, (user_id_bytes, user_id_bytes)
+            ).fetchone()
+        )
+
+        return None if row is None else self._to_entity(row)
+
+    async def get_by_ids(self, user_ids: Sequence[str]) -> list[User]:
+        ids: list[bytes] = [bytes(Ulid(user_id)) for user_id in dict.fromkeys(user_ids)]
+
+        def select(connection: sqlite3.Connection) -> list[tuple[Any, ...]]:
+            rows: list[tuple[Any, ...]] = []
+
+            # each chunk is looked up in both tables
+            chunk_size: int = MAX_VARIABLES // 2
+
+            for start in range(0, len(ids), chunk_size):
+                chunk: list[bytes] = ids[start : start + chunk_size]
+                placeholders: str = ', '.join('?' * len(chunk))
+                rows.extend(
+                    connection.execute(
+                        f'SELECT {COLUMNS} FROM users WHERE id IN ({placeholders}) '
+                        f'UNION ALL SELECT {COLUMNS} FROM users_archive '
+                        f'WHERE id IN ({placeholders})',
+                        (*chunk, *chunk),
+                    )
+                )
+
+            return rows
+
+        return [self._to_entity(row) for row in await self._pool.run(select)]
+
+    async def list_users(
+        self, after_id: str | None, limit: int, filters: UserFilters
+    ) -> list[User]:
+        conditions: list[str] = []
+        parameters: list[Any] = []
+
+        if after_id is not None:
+            conditions.append('id > ?')
+            parameters.append(bytes(Ulid(after_id)))
+
+        for column, value in (
+            ('is_active', filters.is_active),
+            ('language', filters.language),
+            ('color_theme', filters.color_theme),
+        ):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                parameters.append(int(value) if isinstance(value, bool) else str(value))
+
+        statement: str = (
+            f'SELECT {COLUMNS} FROM users '
+            f'{"WHERE " + " AND ".join(conditions) if conditions else ""} '
+            'ORDER BY id LIMIT ?'
+        )
+        rows: list[tuple[Any, ...]] = await self._pool.run(
+            lambda connection: connection.execute(
+                statement, (*parameters, limit)
+            ).fetchall()
+        )
+
+        return [self._to_entity(row) for row in rows]
+
+    async def update(self, user: User) -> None:
+        if not user.changed_fields:
+            return
+
+        fields: list[str] = sorted(user.changed_fields)
+        values: list[Any] = [self._to_column(user, field) for field in fields]
+        statement: str = (
+            f'UPDATE users SET {", ".join(f"{field} = ?" for field in fields)}, '
+            'version = version + 1 WHERE id = ? AND version = ?'
+        )
+
+        cursor: sqlite3.Cursor = await self._write(
+            lambda connection: connection.execute(
+                statement, (*values, bytes(Ulid(user.id)), user.version)
+            )
+        )
+
+        if cursor.rowcount == 0:
+            raise RepositoryException.Conflict(user.id)
+
+        user.increment_version()
+        user.clear_changes()
+
+    async def _write(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        try:
+            return await self._pool.run(operation)
+        except sqlite3.IntegrityError as e:
+            if not str(e).startswith('UNIQUE constraint failed'):
+                raise
+
+            raise RepositoryException.AlreadyExists(str(e).rsplit('.', 1)[-1]) from e
+
+    def _to_row(self, user: User) -> tuple[Any, ...]:
+        return (
+            bytes(Ulid(user.id)),
+            user.username,
+            user.email,
+            user.hashed_password,
+            user.birth_date.isoformat(),
+            str(user.color_theme),
+            str(user.language),
+            int(user.is_active),
+            user.created_at.isoformat(),
+            user.version,
+            None if user.deactivated_at is None else user.deactivated_at.isoformat(),
+        )
+
+    def _to_column(self, user: User, field: str) -> Any:
+        value: Any = getattr(user, field)
+
+        if value is None:
+            return None
+
+        if isinstance(value, date):
+            return value.isoformat()
+
+        if isinstance(value, bool):
+            return int(value)
+
+        return str(value)
+
+    def _to_entity(self, row: tuple[Any, ...]) -> User:
+        return User(
+            id=str(Ulid(row[0])),
+            username=row[1],
+            email=row[2],
+            hashed_password=row[3],
+            birth_date=date.fromisoformat(row[4]),
+            color_theme=ColorTheme(row[5]),
+            language=Language(row[6]),
+            is_active=bool(row[7]),
+            created_at=datetime.fromisoformat(row[8]),
+            version=row[9],
+            deactivated_at=None if row[10] is None else datetime.fromisoformat(row[10]),
+        )
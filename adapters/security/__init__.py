@@ -1 +1,10 @@
+from .admission_controlled_password_manager import AdmissionControlledPasswordManager
+from .admission_controller import AdmissionController
+from .argon2_password_manager import Argon2PasswordManager
+from .bcrypt_cost_calibrator import BcryptCalibration, BcryptCostCalibrator
 from .bcrypt_password_manager import BcryptPasswordManager
+from .caching_password_manager import CachingPasswordManager
+from .credential_cache import CredentialCache
+from .hashing_worker_server import HashingWorkerServer
+from .process_pool_password_manager import ProcessPoolPasswordManager
+from .socket_password_manager import SocketPasswordManager
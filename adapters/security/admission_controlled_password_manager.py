@@ -0,0 +1,23 @@
+from adapters.security.admission_controller import AdmissionController
+from ports.security import IAsyncPasswordManager
+
+
+class AdmissionControlledPasswordManager(IAsyncPasswordManager):
+    def __init__(
+        self,
+        password_manager: IAsyncPasswordManager,
+        admission_controller: AdmissionController,
+    ) -> None:
+        self._password_manager: IAsyncPasswordManager = password_manager
+        self._admission_controller: AdmissionController = admission_controller
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        async with self._admission_controller.admit():
+            return await self._password_manager.verify(plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        async with self._admission_controller.admit():
+            return await self._password_manager.hash(password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._password_manager.needs_rehash(hashed_password)
@@ -0,0 +1,65 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from ports.security.exceptions import PasswordManagerException
+
+
+class AdmissionController:
+    def __init__(
+        self, max_concurrency: int, max_queue_size: int, retry_after: int
+    ) -> None:
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency: int = max_concurrency
+        self._max_queue_size: int = max_queue_size
+        self._retry_after: int = retry_after
+        self._queue_depth: int = 0
+        self._in_flight: int = 0
+        self._admitted_count: int = 0
+        self._rejected_count: int = 0
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncGenerator[None]:
+        if self._semaphore.locked() and self._queue_depth >= self._max_queue_size:
+            self._rejected_count += 1
+            raise PasswordManagerException.Overloaded(self._retry_after)
+
+        self._queue_depth += 1
+
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queue_depth -= 1
+
+        self._in_flight += 1
+        self._admitted_count += 1
+
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def max_queue_size(self) -> int:
+        return self._max_queue_size
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue_depth
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def admitted_count(self) -> int:
+        return self._admitted_count
+
+    @property
+    def rejected_count(self) -> int:
+        return self._rejected_count
@@ -0,0 +1,43 @@
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from adapters.security.bcrypt_password_manager import BcryptPasswordManager
+from ports.security import IPasswordManager
+
+
+class Argon2PasswordManager(IPasswordManager):
+    _bcrypt_prefixes: tuple[str, ...] = ('$2a$', '$2b$', '$2y$')
+
+    def __init__(
+        self,
+        time_cost: int = 3,
+        memory_cost: int = 65536,
+        parallelism: int = 4,
+    ) -> None:
+        self._hasher: PasswordHasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=Type.ID,
+        )
+        self._legacy_password_manager: BcryptPasswordManager = BcryptPasswordManager()
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        if self._is_legacy_hash(hashed_password):
+            return self._legacy_password_manager.verify(plain_password, hashed_password)
+
+        try:
+            return self._hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._is_legacy_hash(hashed_password) or self._hasher.check_needs_rehash(
+            hashed_password
+        )
+
+    def _is_legacy_hash(self, hashed_password: str) -> bool:
+        return hashed_password.startswith(self._bcrypt_prefixes)
@@ -0,0 +1,126 @@
+import fcntl
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from adapters.security.bcrypt_password_manager import BcryptPasswordManager
+
+
+@dataclass(frozen=True, kw_only=True)
+class BcryptCalibration:
+    rounds: int
+    target_ms: float | None = None
+    measurements_ms: dict[int, float] = field(default_factory=dict)
+
+
+class BcryptCostCalibrator:
+    _sample_password: str = 'calibration#Password1'
+
+    def __init__(
+        self, *, min_rounds: int, max_rounds: int, target_ms: float, samples: int = 3
+    ) -> None:
+        self._min_rounds: int = min_rounds
+        self._max_rounds: int = max_rounds
+        self._target_ms: float = target_ms
+        self._samples: int = samples
+
+    def calibrate(self) -> BcryptCalibration:
+        rounds: int = self._min_rounds
+        # the first hash pays for imports and cold caches
+        self._time_hash(self._min_rounds)
+        measurements_ms: dict[int, float] = {}
+
+        for candidate_rounds in range(self._min_rounds, self._max_rounds + 1):
+            measurements_ms[candidate_rounds] = self._time_hash(candidate_rounds)
+
+            if measurements_ms[candidate_rounds] > self._target_ms:
+                break
+
+            rounds = candidate_rounds
+
+        return BcryptCalibration(
+            rounds=rounds,
+            target_ms=self._target_ms,
+            measurements_ms=measurements_ms,
+        )
+
+    def calibrate_shared(self, path: str) -> BcryptCalibration:
+        with open(path, 'a+') as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            file.seek(0)
+            stored: str = file.read()
+
+            if stored:
+                calibration: BcryptCalibration | None = self._load(json.loads(stored))
+
+                if calibration is not None:
+                    return calibration
+
+            calibration = self.calibrate()
+
+            file.seek(0)
+            file.truncate()
+            json.dump(
+                {
+                    'rounds': calibration.rounds,
+                    'target_ms': calibration.target_ms,
+                    'measurements_ms': calibration.measurements_ms,
+                },
+                file,
+            )
+
+            return calibration
+
+    def wait_for_shared(
+        self, path: str, timeout_seconds: float, poll_seconds: float = 0.5
+    ) -> BcryptCalibration:
+        deadline: float = time.monotonic() + timeout_seconds
+
+        while True:
+            if os.path.exists(path):
+                with open(path) as file:
+                    # blocks while calibrate_shared still holds the file
+                    fcntl.flock(file, fcntl.LOCK_SH)
+                    stored: str = file.read()
+
+                calibration: BcryptCalibration | None = (
+                    self._load(json.loads(stored)) if stored else None
+                )
+
+                if calibration is not None:
+                    return calibration
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f'No bcrypt calibration was written to {path}')
+
+            time.sleep(poll_seconds)
+
+    def _load(self, stored: dict[str, Any]) -> BcryptCalibration | None:
+        if (
+            stored.get('target_ms') != self._target_ms
+            or not self._min_rounds <= stored.get('rounds', 0) <= self._max_rounds
+        ):
+            return None
+
+        return BcryptCalibration(
+            rounds=stored['rounds'],
+            target_ms=self._target_ms,
+            measurements_ms={
+                int(rounds): elapsed
+                for rounds, elapsed in stored.get('measurements_ms', {}).items()
+            },
+        )
+
+    def _time_hash(self, rounds: int) -> float:
+        password_manager: BcryptPasswordManager = BcryptPasswordManager(rounds=rounds)
+        elapsed_ms: list[float] = []
+
+        for _ in range(self._samples):
+            start: float = time.perf_counter()
+            password_manager.hash(self._sample_password)
+            elapsed_ms.append((time.perf_counter() - start) * 1000)
+
+        return statistics.median(elapsed_ms)
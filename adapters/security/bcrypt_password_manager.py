@@ -1,11 +1,44 @@
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from bcrypt import checkpw, gensalt, hashpw
 
 from ports.security import IPasswordManager
 
 
 class BcryptPasswordManager(IPasswordManager):
+    _prefixes: tuple[str, ...] = ('2a', '2b', '2y')
+    _argon2_prefix: str = '$argon2'
+
+    def __init__(self, rounds: int = 12, max_rounds: int | None = None) -> None:
+        self._rounds: int = rounds
+        self._max_rounds: int = max(rounds, max_rounds or rounds)
+
     def verify(self, plain_password: str, hashed_password: str) -> bool:
-        return checkpw(plain_password.encode(), hashed_password.encode())
+        if hashed_password.startswith(self._argon2_prefix):
+            # left behind by a switch back from argon2id; rehashed on login
+            try:
+                return PasswordHasher().verify(hashed_password, plain_password)
+            except (VerificationError, InvalidHashError):
+                return False
+
+        try:
+            return checkpw(plain_password.encode(), hashed_password.encode())
+        except ValueError:
+            return False
 
     def hash(self, password: str) -> str:
-        return hashpw(password.encode(), gensalt()).decode()
+        return hashpw(password.encode(), gensalt(rounds=self._rounds)).decode()
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        rounds: int | None = self._get_rounds(hashed_password)
+
+        # a stronger hash is kept, so workers calibrated a round apart agree
+        return rounds is None or not self._rounds <= rounds <= self._max_rounds
+
+    def _get_rounds(self, hashed_password: str) -> int | None:
+        parts: list[str] = hashed_password.split('$')
+
+        if len(parts) != 4 or parts[1] not in self._prefixes or not parts[2].isdigit():
+            return None
+
+        return int(parts[2])
@@ -0,0 +1,36 @@
+import time
+
+from adapters.security.credential_cache import CredentialCache
+from ports.security import IAsyncPasswordManager
+
+
+class CachingPasswordManager(IAsyncPasswordManager):
+    def __init__(
+        self,
+        password_manager: IAsyncPasswordManager,
+        credential_cache: CredentialCache,
+    ) -> None:
+        self._password_manager: IAsyncPasswordManager = password_manager
+        self._credential_cache: CredentialCache = credential_cache
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        if self._credential_cache.contains(plain_password, hashed_password):
+            return True
+
+        start: float = time.perf_counter()
+        is_valid: bool = await self._password_manager.verify(
+            plain_password, hashed_password
+        )
+
+        if is_valid:
+            self._credential_cache.add(
+                plain_password, hashed_password, time.perf_counter() - start
+            )
+
+        return is_valid
+
+    async def hash(self, password: str) -> str:
+        return await self._password_manager.hash(password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._password_manager.needs_rehash(hashed_password)
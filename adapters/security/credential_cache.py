@@ -0,0 +1,90 @@
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+
+
+class CredentialCache:
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._key: bytes = secrets.token_bytes(32)
+        self._ttl_seconds: float = ttl_seconds
+        self._max_entries: int = max_entries
+        self._entries: OrderedDict[bytes, float] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._verified_count: int = 0
+        self._verified_seconds: float = 0.0
+
+    def contains(self, plain_password: str, hashed_password: str) -> bool:
+        key: bytes = self._get_key(plain_password, hashed_password)
+        expires_at: float | None = self._entries.get(key)
+
+        if expires_at is not None and expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True
+
+        if expires_at is not None:
+            del self._entries[key]
+
+        self._misses += 1
+        return False
+
+    def add(
+        self, plain_password: str, hashed_password: str, verify_seconds: float
+    ) -> None:
+        key: bytes = self._get_key(plain_password, hashed_password)
+
+        self._entries[key] = time.monotonic() + self._ttl_seconds
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+        self._verified_count += 1
+        self._verified_seconds += verify_seconds
+
+    def _get_key(self, plain_password: str, hashed_password: str) -> bytes:
+        return hmac.digest(
+            self._key,
+            b'\0'.join((hashed_password.encode(), plain_password.encode())),
+            hashlib.sha256,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self._hits + self._misses
+
+        return self._hits / lookups if lookups else 0.0
+
+    @property
+    def verify_seconds_saved(self) -> float:
+        if not self._verified_count:
+            return 0.0
+
+        return self._hits * self._verified_seconds / self._verified_count
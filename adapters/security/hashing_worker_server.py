@@ -0,0 +1,123 @@
+import asyncio
+import itertools
+import json
+import os
+from concurrent.futures import Executor
+from typing import Any
+
+from ports.security import IPasswordManager
+
+
+class HashingWorkerServer:
+    _priorities: dict[str, int] = {
+        'verify': 0,
+        'hash': 1,
+    }
+
+    def __init__(
+        self,
+        socket_path: str,
+        password_manager: IPasswordManager,
+        executor: Executor,
+        concurrency: int,
+    ) -> None:
+        self._socket_path: str = socket_path
+        self._password_manager: IPasswordManager = password_manager
+        self._executor: Executor = executor
+        self._concurrency: int = concurrency
+        self._queue: asyncio.PriorityQueue[
+            tuple[int, int, str, tuple[str, ...], asyncio.Future[Any]]
+        ] = asyncio.PriorityQueue()
+        self._sequence: itertools.count[int] = itertools.count()
+        self._server: asyncio.Server | None = None
+        self._dispatchers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=self._socket_path
+        )
+        os.chmod(self._socket_path, 0o600)
+
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch()) for _ in range(self._concurrency)
+        ]
+
+    async def serve_forever(self) -> None:
+        await self.start()
+
+        try:
+            await self._server.serve_forever()  # type: ignore
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                response: dict[str, Any] = await self._handle_request(line)
+
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, line: bytes) -> dict[str, Any]:
+        try:
+            request: dict[str, Any] = json.loads(line)
+            operation: str = request['op']
+            args: tuple[str, ...] = (
+                (request['password'], request['hashed_password'])
+                if operation == 'verify'
+                else (request['password'],)
+            )
+            priority: int = self._priorities[operation]
+        except (ValueError, KeyError, TypeError):
+            return {'error': 'Invalid request'}
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        await self._queue.put((priority, next(self._sequence), operation, args, future))
+
+        try:
+            return {'result': await future}
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def _dispatch(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            _, _, operation, args, future = await self._queue.get()
+
+            try:
+                result: Any = await loop.run_in_executor(
+                    self._executor, getattr(self._password_manager, operation), *args
+                )
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,30 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from ports.security import IAsyncPasswordManager, IPasswordManager
+
+
+class ProcessPoolPasswordManager(IAsyncPasswordManager):
+    def __init__(
+        self, password_manager: IPasswordManager, executor: ProcessPoolExecutor
+    ) -> None:
+        self._password_manager: IPasswordManager = password_manager
+        self._executor: ProcessPoolExecutor = executor
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            self._password_manager.verify,
+            plain_password,
+            hashed_password,
+        )
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            self._password_manager.hash,
+            password,
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._password_manager.needs_rehash(hashed_password)
@@ -0,0 +1,63 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+from ports.security import IAsyncPasswordManager, IPasswordManager
+from ports.security.exceptions import PasswordManagerException
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class SocketPasswordManager(IAsyncPasswordManager):
+    def __init__(
+        self,
+        socket_path: str,
+        password_manager: IPasswordManager,
+        retry_after: int = 1,
+    ) -> None:
+        self._socket_path: str = socket_path
+        self._password_manager: IPasswordManager = password_manager
+        self._retry_after: int = retry_after
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._request(
+            {
+                'op': 'verify',
+                'password': plain_password,
+                'hashed_password': hashed_password,
+            }
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._request({'op': 'hash', 'password': password})
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._password_manager.needs_rehash(hashed_password)
+
+    async def _request(self, request: dict[str, str]) -> Any:
+        try:
+            response: dict[str, Any] = await self._exchange(request)
+        except (OSError, ValueError) as e:
+            # a worker that is down or restarting is reported like a full queue
+            logger.warning(
+                'hashing worker at %s is unavailable: %s', self._socket_path, e
+            )
+            raise PasswordManagerException.Overloaded(self._retry_after) from e
+
+        if 'error' in response:
+            raise RuntimeError(f'Hashing worker error: {response["error"]}')
+
+        return response['result']
+
+    async def _exchange(self, request: dict[str, str]) -> dict[str, Any]:
+        reader, writer = await asyncio.open_unix_connection(self._socket_path)
+
+        try:
+            writer.write(json.dumps(request).encode() + b'\n')
+            await writer.drain()
+
+            return json.loads(await reader.readline())
+        finally:
+            writer.close()
+            await writer.wait_closed()
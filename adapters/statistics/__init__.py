@@ -0,0 +1 @@
+from .numpy_user_statistics import NumpyUserStatistics
@@ -0,0 +1,221 @@
+import io
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+import numpy as np
+import numpy.typing as npt
+
+from adapters.id import Ulid
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.user import ExportedUser
+from ports.statistics import IUserStatistics, UserStatistics
+
+EPOCH: datetime = datetime(year=1970, month=1, day=1, tzinfo=UTC)
+EPOCH_ORDINAL: int = EPOCH.date().toordinal()
+MS_PER_DAY: int = 86_400_000
+ULID_TIMESTAMP_WEIGHTS: npt.NDArray[np.uint64] = 256 ** np.arange(
+    5, -1, -1, dtype=np.uint64
+)
+
+AGE_RANGES: tuple[tuple[str, int], ...] = (
+    ('0-17', 0),
+    ('18-24', 18),
+    ('25-34', 25),
+    ('35-44', 35),
+    ('45-54', 45),
+    ('55-64', 55),
+    ('65+', 65),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserSnapshot:
+    taken_at: datetime
+    total_users: int
+    active_users: int
+    language_counts: npt.NDArray[np.intp]
+    color_theme_counts: npt.NDArray[np.intp]
+    sorted_birth_day: npt.NDArray[np.int32]
+    sorted_signup_day: npt.NDArray[np.int32]
+
+
+class NumpyUserStatistics(IUserStatistics):
+    def __init__(self, rows_per_chunk: int = 64 * 1024) -> None:
+        self._rows_per_chunk: int = rows_per_chunk
+        self._languages: dict[Language, int] = {
+            language: code for code, language in enumerate(Language)
+        }
+        self._color_themes: dict[ColorTheme, int] = {
+            theme: code for code, theme in enumerate(ColorTheme)
+        }
+        self._snapshot: UserSnapshot | None = None
+
+    async def refresh(self, users: AsyncIterable[ExportedUser]) -> None:
+        taken_at: datetime = datetime.now(UTC)
+        chunks: list[tuple[npt.NDArray, ...]] = []
+        is_active: list[bool] = []
+        languages: list[int] = []
+        color_themes: list[int] = []
+        birth_days: list[int] = []
+        ids: bytearray = bytearray()
+
+        async for user in users:
+            is_active.append(user.is_active)
+            languages.append(self._languages[user.language])
+            color_themes.append(self._color_themes[user.color_theme])
+            birth_days.append(user.birth_date.toordinal() - EPOCH_ORDINAL)
+            ids += bytes(Ulid(user.id))
+
+            if len(is_active) == self._rows_per_chunk:
+                chunks.append(
+                    self._to_arrays(is_active, languages, color_themes, birth_days, ids)
+                )
+                is_active, languages, color_themes, birth_days = [], [], [], []
+                ids = bytearray()
+
+        chunks.append(
+            self._to_arrays(is_active, languages, color_themes, birth_days, ids)
+        )
+        columns: list[npt.NDArray] = [np.concatenate(column) for column in zip(*chunks)]
+
+        # everything that doesn't depend on the current date is aggregated here,
+        # so compute() is left with a few binary searches over sorted columns
+        self._snapshot = UserSnapshot(
+            taken_at=taken_at,
+            total_users=len(columns[0]),
+            active_users=int(np.count_nonzero(columns[0])),
+            language_counts=np.bincount(columns[1], minlength=len(Language)),
+            color_theme_counts=np.bincount(columns[2], minlength=len(ColorTheme)),
+            sorted_birth_day=np.sort(columns[3]),
+            sorted_signup_day=np.sort(columns[4]),
+        )
+
+    def dump(self) -> bytes | None:
+        snapshot: UserSnapshot | None = self._snapshot
+
+        if snapshot is None:
+            return None
+
+        # the sorted day columns are stored as day histograms, a few thousand
+        # distinct days instead of one entry per user
+        birth_days, birth_counts = np.unique(
+            snapshot.sorted_birth_day, return_counts=True
+        )
+        signup_days, signup_counts = np.unique(
+            snapshot.sorted_signup_day, return_counts=True
+        )
+        buffer: io.BytesIO = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            taken_at_us=np.int64(
+                (snapshot.taken_at - EPOCH) // timedelta(microseconds=1)
+            ),
+            total_users=np.int64(snapshot.total_users),
+            active_users=np.int64(snapshot.active_users),
+            language_counts=snapshot.language_counts,
+            color_theme_counts=snapshot.color_theme_counts,
+            birth_days=birth_days,
+            birth_counts=birth_counts,
+            signup_days=signup_days,
+            signup_counts=signup_counts,
+        )
+
+        return buffer.getvalue()
+
+    def load(self, data: bytes) -> None:
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            self._snapshot = UserSnapshot(
+                taken_at=EPOCH + timedelta(microseconds=int(arrays['taken_at_us'])),
+                total_users=int(arrays['total_users']),
+                active_users=int(arrays['active_users']),
+                language_counts=arrays['language_counts'],
+                color_theme_counts=arrays['color_theme_counts'],
+                sorted_birth_day=np.repeat(
+                    arrays['birth_days'], arrays['birth_counts']
+                ),
+                sorted_signup_day=np.repeat(
+                    arrays['signup_days'], arrays['signup_counts']
+                ),
+            )
+
+    def compute(self, today: date, signup_days: int) -> UserStatistics | None:
+        snapshot: UserSnapshot | None = self._snapshot
+
+        if snapshot is None:
+            return None
+
+        return UserStatistics(
+            snapshot_at=snapshot.taken_at,
+            total_users=snapshot.total_users,
+            active_users=snapshot.active_users,
+            users_by_language={
+                language: int(snapshot.language_counts[code])
+                for language, code in self._languages.items()
+            },
+            users_by_color_theme={
+                theme: int(snapshot.color_theme_counts[code])
+                for theme, code in self._color_themes.items()
+            },
+            users_by_age_range=self._count_age_ranges(snapshot, today),
+            signups_by_day=self._count_signups(snapshot, today, signup_days),
+        )
+
+    def _to_arrays(
+        self,
+        is_active: list[bool],
+        languages: list[int],
+        color_themes: list[int],
+        birth_days: list[int],
+        ids: bytearray,
+    ) -> tuple[npt.NDArray, ...]:
+        timestamps_ms: npt.NDArray[np.uint64] = (
+            np.frombuffer(ids, dtype=np.uint8).reshape(-1, 16)[:, :6].astype(np.uint64)
+            @ ULID_TIMESTAMP_WEIGHTS
+        )
+
+        return (
+            np.array(is_active, dtype=np.bool_),
+            np.array(languages, dtype=np.int8),
+            np.array(color_themes, dtype=np.int8),
+            np.array(birth_days, dtype=np.int32),
+            (timestamps_ms // MS_PER_DAY).astype(np.int32),
+        )
+
+    def _count_age_ranges(self, snapshot: UserSnapshot, today: date) -> dict[str, int]:
+        # users aged at least N were born on or before today minus N years, so
+        # every range boundary is a binary search over the sorted birth days
+        born_until: npt.NDArray[np.int32] = np.array(
+            [self._years_ago(today, age) for _, age in AGE_RANGES], dtype=np.int32
+        )
+        at_least: npt.NDArray[np.intp] = np.searchsorted(
+            snapshot.sorted_birth_day, born_until, side='right'
+        )
+        counts: npt.NDArray[np.intp] = at_least - np.append(at_least[1:], 0)
+
+        return {label: int(count) for (label, _), count in zip(AGE_RANGES, counts)}
+
+    def _count_signups(
+        self, snapshot: UserSnapshot, today: date, signup_days: int
+    ) -> dict[date, int]:
+        first_day: date = today - timedelta(days=signup_days - 1)
+        first: int = first_day.toordinal() - EPOCH_ORDINAL
+        start, end = np.searchsorted(
+            snapshot.sorted_signup_day, [first, first + signup_days]
+        )
+        counts: npt.NDArray[np.intp] = np.bincount(
+            snapshot.sorted_signup_day[start:end] - first, minlength=signup_days
+        )
+
+        return {
+            first_day + timedelta(days=offset): int(count)
+            for offset, count in enumerate(counts)
+        }
+
+    def _years_ago(self, today: date, years: int) -> int:
+        day: date = today.replace(
+            year=today.year - years,
+            day=28 if (today.month, today.day) == (2, 29) else today.day,
+        )
+
+        return day.toordinal() - EPOCH_ORDINAL
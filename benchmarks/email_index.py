@@ -0,0 +1,123 @@
+"""
+Measures login latency against a large users collection with and without
+the unique index on `users.email`.
+
+Usage (needs a reachable MongoDB in MONGO_URI):
+
+    python -m benchmarks.email_index --users 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+from adapters.models import UserModel
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from ports.id import IIdManager
+from ports.repositories.user import IUserRepository
+from ports.security import IPasswordManager
+from web.app import create_app
+from web.db import MongoIndexes
+from web.di import Di
+
+PASSWORD: str = 'Windows#123'
+BATCH_SIZE: int = 10_000
+
+
+async def seed_users(users: int, hashed_password: str) -> list[str]:
+    id_manager: IIdManager = Di.get_raw(IIdManager)
+    collection: AsyncIOMotorCollection = Di.get_raw(AsyncIOMotorDatabase)[
+        UserModel.collection_name
+    ]
+
+    for offset in range(0, users, BATCH_SIZE):
+        await collection.insert_many(
+            [
+                UserModel.from_entity(
+                    User(
+                        id=id_manager.generate(),
+                        username=f'Benchmark User {number}',
+                        email=f'user{number}@email.index',
+                        birth_date=date(year=1990, month=1, day=1),
+                        hashed_password=hashed_password,
+                        color_theme=ColorTheme.DARK,
+                        language=Language.EN_US,
+                    )
+                ).to_document()
+                for number in range(offset, min(offset + BATCH_SIZE, users))
+            ],
+            ordered=False,
+        )
+
+    step: int = max(users // 100, 1)
+
+    return [f'user{number}@email.index' for number in range(0, users, step)]
+
+
+async def measure(client: AsyncClient, emails: list[str]) -> tuple[float, float]:
+    repository: IUserRepository = Di.get_raw(IUserRepository)
+    lookups: list[float] = []
+    logins: list[float] = []
+
+    for email in emails:
+        start: float = time.perf_counter()
+        await repository.get_by_email(email)
+        lookups.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await client.post(
+            '/auth/token/', data={'username': email, 'password': PASSWORD}
+        )
+        logins.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(lookups), statistics.median(logins)
+
+
+async def run(users: int) -> None:
+    app: FastAPI = create_app()
+    db: AsyncIOMotorDatabase = Di.get_raw(AsyncIOMotorDatabase)
+
+    await db.drop_collection(UserModel.collection_name)
+    emails: list[str] = await seed_users(
+        users, Di.get_raw(IPasswordManager).hash(PASSWORD)
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url='http://benchmark'
+    ) as client:
+        lookup, login = await measure(client, emails)
+        print(
+            f'without index: get_by_email p50={lookup:.2f}ms '
+            f'login p50={login:.1f}ms ({users} users)'
+        )
+
+        start: float = time.perf_counter()
+        await MongoIndexes.ensure(db)
+        print(f'index build: {time.perf_counter() - start:.1f}s')
+
+        lookup, login = await measure(client, emails)
+        print(
+            f'   with index: get_by_email p50={lookup:.2f}ms '
+            f'login p50={login:.1f}ms ({users} users)'
+        )
+
+    await db.drop_collection(UserModel.collection_name)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=1_000_000)
+    args: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(run(args.users))
+
+
+if __name__ == '__main__':
+    main()
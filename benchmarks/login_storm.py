@@ -0,0 +1,150 @@
+"""
+Measures `GET /users/me` latency while `POST /auth/token/` is being hammered.
+
+Usage (needs a reachable MongoDB in MONGO_URI):
+
+    python -m benchmarks.login_storm --mode both
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from ports.id import IIdManager
+from ports.repositories.user import IUserRepository
+from ports.security import IAsyncPasswordManager, IPasswordManager
+from web.app import create_app
+from web.di import Di
+
+EMAIL: str = 'benchmark@login.storm'
+PASSWORD: str = 'Windows#123'
+
+
+class InlinePasswordManager(IAsyncPasswordManager):
+    def __init__(self, password_manager: IPasswordManager) -> None:
+        self._password_manager: IPasswordManager = password_manager
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._password_manager.verify(plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return self._password_manager.hash(password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._password_manager.needs_rehash(hashed_password)
+
+
+async def seed_user() -> None:
+    await Di.get_raw(IUserRepository).create(
+        User(
+            id=Di.get_raw(IIdManager).generate(),
+            username='Benchmark User',
+            email=EMAIL,
+            birth_date=date(year=1990, month=1, day=1),
+            hashed_password=Di.get_raw(IPasswordManager).hash(PASSWORD),
+            color_theme=ColorTheme.DARK,
+            language=Language.EN_US,
+        )
+    )
+
+
+async def login(client: AsyncClient) -> str:
+    response = await client.post(
+        '/auth/token/', data={'username': EMAIL, 'password': PASSWORD}
+    )
+
+    return response.json()['access_token']
+
+
+async def login_storm(client: AsyncClient, logins: int) -> None:
+    for _ in range(logins):
+        await login(client)
+
+
+async def read_profile(client: AsyncClient, token: str, requests: int) -> list[float]:
+    latencies: list[float] = []
+
+    for _ in range(requests):
+        start: float = time.perf_counter()
+        await client.get('/users/me', headers={'Authorization': f'Bearer {token}'})
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+async def run(mode: str, *, attackers: int, logins: int, readers: int) -> None:
+    app: FastAPI = create_app()
+
+    if mode == 'inline':
+        Di.map(IAsyncPasswordManager, to=InlinePasswordManager, singleton=True)
+
+    db: AsyncIOMotorDatabase = Di.get_raw(AsyncIOMotorDatabase)
+    await db.drop_collection('users')
+    await seed_user()
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url='http://benchmark'
+    ) as client:
+        token: str = await login(client)
+
+        results: list[list[float] | None] = await asyncio.gather(
+            *(login_storm(client, logins) for _ in range(attackers)),
+            *(read_profile(client, token, logins) for _ in range(readers)),
+        )
+
+    await db.drop_collection('users')
+
+    latencies: list[float] = [
+        latency for result in results if result for latency in result
+    ]
+    percentiles: list[float] = statistics.quantiles(latencies, n=100)
+
+    print(
+        f'{mode:>6}: /users/me p50={percentiles[49]:.1f}ms '
+        f'p99={percentiles[98]:.1f}ms max={max(latencies):.1f}ms '
+        f'({len(latencies)} requests, {attackers * logins} logins)'
+    )
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--mode', choices=('inline', 'pool', 'both'), default='both')
+    parser.add_argument('--attackers', type=int, default=8)
+    parser.add_argument('--logins', type=int, default=10)
+    parser.add_argument('--readers', type=int, default=4)
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.mode == 'both':
+        for mode in ('inline', 'pool'):
+            subprocess.run(
+                [sys.executable, '-m', 'benchmarks.login_storm', '--mode', mode]
+                + [
+                    f'--{name}={getattr(args, name)}'
+                    for name in ('attackers', 'logins', 'readers')
+                ],
+                check=True,
+            )
+        return
+
+    asyncio.run(
+        run(
+            args.mode,
+            attackers=args.attackers,
+            logins=args.logins,
+            readers=args.readers,
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
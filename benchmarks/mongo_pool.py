@@ -0,0 +1,119 @@
+"""
+Compares `get_by_id` throughput across Mongo pool sizes and wire compressors.
+
+Usage (needs a reachable MongoDB in MONGO_URI):
+
+    python -m benchmarks.mongo_pool --pool-sizes 10 50 100 --compressors none zlib zstd
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from adapters.id import Ulid
+from adapters.repositories.user import MongoUserRepository
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from web.config.settings import TestSettings
+from web.config.settings.base import Settings
+from web.db import MongoConnection
+
+DATABASE: str = 'benchmark_mongo_pool'
+
+
+async def reader(repository: MongoUserRepository, user_id: str, deadline: float) -> int:
+    reads: int = 0
+
+    while time.perf_counter() < deadline:
+        await repository.get_by_id(user_id)
+        reads += 1
+
+    return reads
+
+
+async def run(
+    settings: Settings, *, concurrency: int, seconds: float, user_id: str
+) -> float:
+    client: AsyncIOMotorClient = MongoConnection.get_client(
+        settings, MongoConnection.get_command_monitor(settings)
+    )
+    await MongoConnection.warm_up(client, settings)
+
+    repository: MongoUserRepository = MongoUserRepository(client[DATABASE])
+    deadline: float = time.perf_counter() + seconds
+
+    reads: list[int] = await asyncio.gather(
+        *(reader(repository, user_id, deadline) for _ in range(concurrency))
+    )
+
+    client.close()
+
+    return sum(reads) / seconds
+
+
+async def benchmark(
+    pool_sizes: list[int], compressors: list[str], concurrency: int, seconds: float
+) -> None:
+    base_settings: Settings = TestSettings(mongo_database=DATABASE)  # type: ignore
+
+    client: AsyncIOMotorClient = MongoConnection.get_client(
+        base_settings, MongoConnection.get_command_monitor(base_settings)
+    )
+    db: AsyncIOMotorDatabase = client[DATABASE]
+    user: User = User(
+        id=str(Ulid()),
+        username='Benchmark User',
+        email='benchmark@mongo.pool',
+        birth_date=date(year=1990, month=1, day=1),
+        hashed_password='x' * 60,
+        color_theme=ColorTheme.DARK,
+        language=Language.EN_US,
+    )
+    await db.drop_collection('users')
+    await MongoUserRepository(db).create(user)
+
+    for compressor in compressors:
+        for pool_size in pool_sizes:
+            settings: Settings = base_settings.model_copy(
+                update={
+                    'mongo_compressors': [] if compressor == 'none' else [compressor],
+                    'mongo_max_pool_size': pool_size,
+                    'mongo_min_pool_size': pool_size,
+                }
+            )
+            throughput: float = await run(
+                settings, concurrency=concurrency, seconds=seconds, user_id=user.id
+            )
+
+            print(
+                f'compressor={compressor:>6} pool={pool_size:>4}: '
+                f'{throughput:,.0f} reads/s ({concurrency} concurrent readers)'
+            )
+
+    await client.drop_database(DATABASE)
+    client.close()
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--pool-sizes', type=int, nargs='+', default=[10, 50, 100])
+    parser.add_argument(
+        '--compressors',
+        nargs='+',
+        choices=('none', 'zstd', 'snappy', 'zlib'),
+        default=['none', 'zlib'],
+    )
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--seconds', type=float, default=5)
+    args: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(
+        benchmark(args.pool_sizes, args.compressors, args.concurrency, args.seconds)
+    )
+
+
+if __name__ == '__main__':
+    main()
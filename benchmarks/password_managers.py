@@ -0,0 +1,147 @@
+"""
+Compares the bcrypt and Argon2id password managers: hash and verify latency,
+throughput per core and peak RSS of a fresh worker process.
+
+Usage:
+
+    python -m benchmarks.password_managers --bcrypt-rounds 12 \
+        --argon2-time-cost 3 --argon2-memory-cost 65536 --argon2-parallelism 4
+"""
+
+import argparse
+import os
+import resource
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from adapters.security import Argon2PasswordManager, BcryptPasswordManager
+from ports.security import IPasswordManager
+
+PASSWORD: str = 'Windows#123'
+
+
+def measure_latency(
+    password_manager: IPasswordManager, iterations: int
+) -> tuple[list[float], list[float]]:
+    hash_latencies: list[float] = []
+    verify_latencies: list[float] = []
+
+    for _ in range(iterations):
+        start: float = time.perf_counter()
+        hashed_password: str = password_manager.hash(PASSWORD)
+        hash_latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        password_manager.verify(PASSWORD, hashed_password)
+        verify_latencies.append((time.perf_counter() - start) * 1000)
+
+    return hash_latencies, verify_latencies
+
+
+def count_verifications(
+    password_manager: IPasswordManager, hashed_password: str, seconds: float
+) -> int:
+    verifications: int = 0
+    deadline: float = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        password_manager.verify(PASSWORD, hashed_password)
+        verifications += 1
+
+    return verifications
+
+
+def measure_throughput_per_core(
+    password_manager: IPasswordManager, seconds: float
+) -> float:
+    cores: int = os.cpu_count() or 1
+    hashed_password: str = password_manager.hash(PASSWORD)
+
+    with ProcessPoolExecutor(max_workers=cores) as executor:
+        verifications: int = sum(
+            executor.map(
+                count_verifications,
+                [password_manager] * cores,
+                [hashed_password] * cores,
+                [seconds] * cores,
+            )
+        )
+
+    return verifications / seconds / cores
+
+
+def read_peak_rss_kib() -> int:
+    # ru_maxrss survives execve, so a spawned worker would report its parent's peak
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1])
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def peak_rss_of_hashing(password_manager: IPasswordManager) -> tuple[int, int]:
+    baseline: int = read_peak_rss_kib()
+    password_manager.verify(PASSWORD, password_manager.hash(PASSWORD))
+
+    return baseline, read_peak_rss_kib()
+
+
+def measure_peak_rss_kib(password_manager: IPasswordManager) -> int:
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=get_context('spawn')
+    ) as executor:
+        baseline, peak = executor.submit(peak_rss_of_hashing, password_manager).result()
+
+    return peak - baseline
+
+
+def report(
+    name: str, password_manager: IPasswordManager, iterations: int, seconds: float
+) -> None:
+    hash_latencies, verify_latencies = measure_latency(password_manager, iterations)
+
+    print(
+        f'{name:>8}: '
+        f'hash mean={statistics.mean(hash_latencies):.1f}ms '
+        f'max={max(hash_latencies):.1f}ms | '
+        f'verify mean={statistics.mean(verify_latencies):.1f}ms '
+        f'max={max(verify_latencies):.1f}ms | '
+        f'{measure_throughput_per_core(password_manager, seconds):.1f} '
+        f'verify/s/core | '
+        f'peak RSS +{measure_peak_rss_kib(password_manager) / 1024:.1f}MiB'
+    )
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--bcrypt-rounds', type=int, default=12)
+    parser.add_argument('--argon2-time-cost', type=int, default=3)
+    parser.add_argument('--argon2-memory-cost', type=int, default=65536)
+    parser.add_argument('--argon2-parallelism', type=int, default=4)
+    args: argparse.Namespace = parser.parse_args()
+
+    report(
+        'bcrypt',
+        BcryptPasswordManager(rounds=args.bcrypt_rounds),
+        args.iterations,
+        args.seconds,
+    )
+    report(
+        'argon2id',
+        Argon2PasswordManager(
+            time_cost=args.argon2_time_cost,
+            memory_cost=args.argon2_memory_cost,
+            parallelism=args.argon2_parallelism,
+        ),
+        args.iterations,
+        args.seconds,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Measures the per-document cost of mapping a stored user document to a `User`
+through the validated pydantic path and through the trusted fast path.
+
+Usage:
+
+    python -m benchmarks.user_decoding --documents 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+import bson
+
+from adapters.id import Ulid
+from adapters.models import UserModel
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+
+
+def stored_document() -> bytes:
+    user: User = User(
+        id=str(Ulid()),
+        username='Benchmark User',
+        email='benchmark@user.decoding',
+        birth_date=date(year=1990, month=1, day=1),
+        hashed_password='x' * 60,
+        color_theme=ColorTheme.DARK,
+        language=Language.EN_US,
+    )
+
+    return bson.encode(UserModel.from_entity(user).to_document())
+
+
+def measure(
+    name: str, raw: bytes, documents: int, mapper: Callable[[dict[str, Any]], User]
+) -> None:
+    start: float = time.perf_counter()
+
+    for _ in range(documents):
+        mapper(bson.decode(raw))
+
+    elapsed: float = time.perf_counter() - start
+
+    print(
+        f'{name:>9}: {elapsed / documents * 1_000_000:.2f} µs/document '
+        f'({documents / elapsed:,.0f} documents/s, BSON decode included)'
+    )
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--documents', type=int, default=100_000)
+    args: argparse.Namespace = parser.parse_args()
+
+    raw: bytes = stored_document()
+
+    measure(
+        'validated',
+        raw,
+        args.documents,
+        lambda document: UserModel.from_document(document).to_entity(),
+    )
+    measure('fast', raw, args.documents, UserModel.entity_from_document)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Runs the same workloads against the user repository adapters.
+
+Usage (the mongo adapter needs a reachable MongoDB in MONGO_URI):
+
+    python -m benchmarks.user_repositories --repositories sqlite mongo memory
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from adapters.id import Ulid
+from adapters.models import UserModel
+from adapters.repositories.sqlite import SqliteConnectionPool
+from adapters.repositories.user import (
+    InMemoryUserRepository,
+    MongoUserRepository,
+    SqliteUserRepository,
+)
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.user import IUserRepository
+
+DATABASE: str = 'benchmark_user_repositories'
+
+
+def new_user(number: int) -> User:
+    return User(
+        id=str(Ulid()),
+        username=f'Benchmark User {number}',
+        email=f'user{number}@user.repositories',
+        birth_date=date(year=1990, month=1, day=1),
+        hashed_password='x' * 60,
+        color_theme=ColorTheme.DARK,
+        language=Language.EN_US,
+    )
+
+
+async def measure(
+    name: str,
+    workload: str,
+    operations: int,
+    concurrency: int,
+    operation: Callable[[int], Awaitable[object]],
+) -> None:
+    async def worker(offset: int) -> None:
+        for number in range(offset, operations, concurrency):
+            await operation(number)
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    elapsed: float = time.perf_counter() - start
+
+    print(f'{name:>6} {workload:>12}: {operations / elapsed:>10,.0f} ops/s')
+
+
+async def run(
+    name: str, repository: IUserRepository, operations: int, concurrency: int
+) -> None:
+    users: list[User] = [new_user(number) for number in range(operations)]
+
+    await measure(
+        name, 'create', operations, concurrency, lambda n: repository.create(users[n])
+    )
+    await measure(
+        name,
+        'get_by_id',
+        operations,
+        concurrency,
+        lambda n: repository.get_by_id(users[n].id),
+    )
+    await measure(
+        name,
+        'get_by_email',
+        operations,
+        concurrency,
+        lambda n: repository.get_by_email(users[n].email),
+    )
+    await measure(
+        name,
+        'get_by_ids',
+        operations // 100,
+        concurrency,
+        lambda n: repository.get_by_ids(
+            [user.id for user in users[n * 100 : (n + 1) * 100]]
+        ),
+    )
+
+    def update(number: int) -> Awaitable[None]:
+        users[number].update_preferences(
+            new_color_theme=ColorTheme.LIGHT, new_language=Language.PT_BR
+        )
+
+        return repository.update(users[number])
+
+    await measure(name, 'update', operations, concurrency, update)
+
+
+async def benchmark(repositories: list[str], operations: int, concurrency: int) -> None:
+    for name in repositories:
+        if name == 'memory':
+            await run(name, InMemoryUserRepository(), operations, concurrency)
+
+        if name == 'sqlite':
+            with tempfile.TemporaryDirectory() as directory:
+                pool: SqliteConnectionPool = SqliteConnectionPool(
+                    os.path.join(directory, 'users.db'), 4
+                )
+                await SqliteUserRepository.create_schema(pool)
+                await run(name, SqliteUserRepository(pool), operations, concurrency)
+                pool.close()
+
+        if name == 'mongo':
+            client: AsyncIOMotorClient = AsyncIOMotorClient(os.getenv('MONGO_URI'))
+            db: AsyncIOMotorDatabase = client[DATABASE]
+            await db[UserModel.collection_name].create_indexes(
+                [index.to_index_model() for index in UserModel.indexes]
+            )
+            await run(name, MongoUserRepository(db), operations, concurrency)
+            await client.drop_database(DATABASE)
+            client.close()
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--repositories',
+        nargs='+',
+        choices=('sqlite', 'mongo', 'memory'),
+        default=['sqlite', 'mongo'],
+    )
+    parser.add_argument('--operations', type=int, default=10_000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(benchmark(args.repositories, args.operations, args.concurrency))
+
+
+if __name__ == '__main__':
+    main()
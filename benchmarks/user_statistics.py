@@ -0,0 +1,77 @@
+"""
+Measures how long the in-memory user statistics snapshot takes to build and
+how long each statistics request takes to compute over it.
+
+Usage:
+
+    python -m benchmarks.user_statistics --users 1000000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
+
+from ulid import ULID
+
+from adapters.statistics import NumpyUserStatistics
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.user import ExportedUser
+
+
+async def exported_users(amount: int) -> AsyncIterator[ExportedUser]:
+    now: datetime = datetime.now(UTC)
+    languages: list[Language] = list(Language)
+    color_themes: list[ColorTheme] = list(ColorTheme)
+
+    for _ in range(amount):
+        created_at: datetime = now - timedelta(
+            seconds=random.randint(0, 2 * 365 * 86400)
+        )
+
+        yield ExportedUser(
+            id=str(ULID.from_datetime(created_at)),
+            username='Benchmark User',
+            email='benchmark@user.statistics',
+            birth_date=date(year=1950, month=1, day=1)
+            + timedelta(days=random.randint(0, 55 * 365)),
+            color_theme=random.choice(color_themes),
+            language=random.choice(languages),
+            is_active=random.random() < 0.9,
+            created_at=created_at,
+        )
+
+
+async def run(users: int, requests: int) -> None:
+    statistics: NumpyUserStatistics = NumpyUserStatistics()
+
+    start: float = time.perf_counter()
+    await statistics.refresh(exported_users(users))
+    print(
+        f'  refresh: {time.perf_counter() - start:.2f} s for {users:,} users '
+        '(user generation included)'
+    )
+
+    start = time.perf_counter()
+
+    for _ in range(requests):
+        statistics.compute(date.today(), 30)
+
+    elapsed: float = time.perf_counter() - start
+
+    print(f'  compute: {elapsed / requests * 1000:.3f} ms/request')
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--requests', type=int, default=1000)
+    args: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(run(args.users, args.requests))
+
+
+if __name__ == '__main__':
+    main()
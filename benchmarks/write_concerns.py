@@ -0,0 +1,116 @@
+"""
+Compares the latency of preference updates (fast write concern) with password
+updates (durable write concern) through `MongoUserRepository`.
+
+Usage (needs a replica set in MONGO_URI, e.g. a local three-member one):
+
+    MONGO_URI='mongodb://localhost:27017/?replicaSet=rs0' \
+        python -m benchmarks.write_concerns --updates 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Callable
+from datetime import date
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from adapters.id import Ulid
+from adapters.repositories.mongo import MongoWriteConcerns
+from adapters.repositories.user import MongoUserRepository
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from web.config.settings import TestSettings
+from web.config.settings.base import Settings
+from web.db import MongoConnection
+
+DATABASE: str = 'benchmark_write_concerns'
+
+
+def toggle_preferences(user: User, index: int) -> None:
+    user.update_preferences(
+        new_color_theme=ColorTheme.DARK if index % 2 else ColorTheme.LIGHT,
+        new_language=user.language,
+    )
+
+
+def toggle_password(user: User, index: int) -> None:
+    user.update_password(f'{index:060d}')
+
+
+async def measure(
+    repository: MongoUserRepository,
+    user: User,
+    change: Callable[[User, int], None],
+    updates: int,
+) -> list[float]:
+    latencies: list[float] = []
+
+    for index in range(updates):
+        change(user, index)
+
+        start: float = time.perf_counter()
+        await repository.update(user)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    percentiles: list[float] = statistics.quantiles(latencies, n=100)
+
+    print(
+        f'{name:>28}: mean {statistics.fmean(latencies):6.2f} ms, '
+        f'p50 {percentiles[49]:6.2f} ms, p99 {percentiles[98]:6.2f} ms'
+    )
+
+
+async def benchmark(updates: int) -> None:
+    settings: Settings = TestSettings(mongo_database=DATABASE)  # type: ignore
+
+    client: AsyncIOMotorClient = MongoConnection.get_client(
+        settings, MongoConnection.get_command_monitor(settings)
+    )
+    db: AsyncIOMotorDatabase = client[DATABASE]
+    write_concerns: MongoWriteConcerns = MongoConnection.get_write_concerns(settings)
+    repository: MongoUserRepository = MongoUserRepository(db, write_concerns)
+    user: User = User(
+        id=str(Ulid()),
+        username='Benchmark User',
+        email='benchmark@write.concerns',
+        birth_date=date(year=1990, month=1, day=1),
+        hashed_password='x' * 60,
+        color_theme=ColorTheme.DARK,
+        language=Language.EN_US,
+    )
+    await db.drop_collection('users')
+    await repository.create(user)
+
+    # warm up the pool and the server caches
+    await measure(repository, user, toggle_preferences, 100)
+
+    report(
+        f'preferences ({write_concerns.fast.document})',
+        await measure(repository, user, toggle_preferences, updates),
+    )
+    report(
+        f'password ({write_concerns.durable.document})',
+        await measure(repository, user, toggle_password, updates),
+    )
+
+    await client.drop_database(DATABASE)
+    client.close()
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=2000)
+    args: argparse.Namespace = parser.parse_args()
+
+    asyncio.run(benchmark(args.updates))
+
+
+if __name__ == '__main__':
+    main()
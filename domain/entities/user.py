@@ -15,6 +15,8 @@ class User:
         language: Language,
         is_active: bool = True,
         created_at: datetime | None = None,
+        version: int = 0,
+        deactivated_at: datetime | None = None,
     ) -> None:
         self._id: str = id
         self._username: str = username
@@ -25,25 +27,45 @@ class User:
         self._language: Language = language
         self._is_active: bool = is_active
         self._created_at: datetime = created_at or datetime.now(timezone.utc)
+        self._version: int = version
+        self._deactivated_at: datetime | None = deactivated_at
+        self._changed_fields: set[str] = set()
 
     def deactivate(self) -> None:
-        self._is_active = False
+        if self._is_active:
+            self._change('is_active', False)
+            self._change('deactivated_at', datetime.now(timezone.utc))
 
     def update_password(self, new_hashed_password: str) -> None:
-        self._hashed_password = new_hashed_password
+        self._change('hashed_password', new_hashed_password)
 
     def update_personal_data(
         self, *, new_username: str, new_email: str, new_birth_date: date
     ) -> None:
-        self._username = new_username
-        self._email = new_email
-        self._birth_date = new_birth_date
+        self._change('username', new_username)
+        self._change('email', new_email)
+        self._change('birth_date', new_birth_date)
 
     def update_preferences(
         self, *, new_color_theme: ColorTheme, new_language: Language
     ) -> None:
-        self._color_theme = new_color_theme
-        self._language = new_language
+        self._change('color_theme', new_color_theme)
+        self._change('language', new_language)
+
+    def clear_changes(self) -> None:
+        self._changed_fields.clear()
+
+    def increment_version(self) -> None:
+        self._version += 1
+
+    def _change(self, field: str, value: object) -> None:
+        if getattr(self, f'_{field}') != value:
+            setattr(self, f'_{field}', value)
+            self._changed_fields.add(field)
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        return frozenset(self._changed_fields)
 
     @property
     def username(self) -> str:
@@ -80,3 +102,11 @@ class User:
     @property
     def created_at(self) -> datetime:
         return self._created_at
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def deactivated_at(self) -> datetime | None:
+        return self._deactivated_at
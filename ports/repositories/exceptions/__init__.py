@@ -0,0 +1 @@
+from .repository_exception import RepositoryException
@@ -0,0 +1,10 @@
+class RepositoryException:
+    class AlreadyExists(Exception):
+        def __init__(self, field: str) -> None:
+            super().__init__(f'A record with the same {field} already exists')
+            self.field: str = field
+
+    class Conflict(Exception):
+        def __init__(self, record_id: str) -> None:
+            super().__init__(f'The record {record_id} was changed by another writer')
+            self.record_id: str = record_id
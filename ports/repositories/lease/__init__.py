@@ -0,0 +1 @@
+from .i_lease_repository import ILeaseRepository
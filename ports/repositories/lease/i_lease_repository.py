@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+
+class ILeaseRepository(ABC):
+    @abstractmethod
+    async def acquire(self, name: str, ttl: timedelta) -> bool: ...
@@ -0,0 +1,2 @@
+from .i_snapshot_repository import ISnapshotRepository
+from .stored_snapshot import StoredSnapshot
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from .stored_snapshot import StoredSnapshot
+
+
+class ISnapshotRepository(ABC):
+    @abstractmethod
+    async def get(self, name: str) -> StoredSnapshot | None: ...
+
+    @abstractmethod
+    async def save(self, name: str, snapshot: StoredSnapshot) -> None: ...
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class StoredSnapshot:
+    taken_at: datetime
+    data: bytes
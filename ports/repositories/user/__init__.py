@@ -1 +1,3 @@
+from .exported_user import ExportedUser
 from .i_user_repository import IUserRepository
+from .user_filters import UserFilters
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from domain.value_objects import ColorTheme, Language
+
+
+@dataclass(frozen=True, kw_only=True)
+class ExportedUser:
+    id: str
+    username: str
+    email: str
+    birth_date: date
+    color_theme: ColorTheme
+    language: Language
+    is_active: bool
+    created_at: datetime
@@ -1,17 +1,46 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 
 from domain.entities import User
 
+from .exported_user import ExportedUser
+from .user_filters import UserFilters
+
 
 class IUserRepository(ABC):
+    @abstractmethod
+    async def archive_deactivated(
+        self, deactivated_before: datetime, limit: int
+    ) -> int: ...
+
+    @abstractmethod
+    async def count_signups(self, boundaries: Sequence[datetime]) -> list[int]: ...
+
     @abstractmethod
     async def create(self, user: User) -> None: ...
 
+    @abstractmethod
+    async def create_many(self, users: Sequence[User]) -> list[bool]: ...
+
+    @abstractmethod
+    def export(
+        self, batch_size: int, include_archived: bool = False
+    ) -> AsyncIterator[ExportedUser]: ...
+
     @abstractmethod
     async def get_by_email(self, email: str) -> User | None: ...
 
     @abstractmethod
     async def get_by_id(self, user_id: str) -> User | None: ...
 
+    @abstractmethod
+    async def get_by_ids(self, user_ids: Sequence[str]) -> list[User]: ...
+
+    @abstractmethod
+    async def list_users(
+        self, after_id: str | None, limit: int, filters: UserFilters
+    ) -> list[User]: ...
+
     @abstractmethod
     async def update(self, user: User) -> None: ...
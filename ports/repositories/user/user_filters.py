@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from domain.value_objects import ColorTheme, Language
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserFilters:
+    is_active: bool | None = None
+    language: Language | None = None
+    color_theme: ColorTheme | None = None
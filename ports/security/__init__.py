@@ -1 +1,2 @@
+from .i_async_password_manager import IAsyncPasswordManager
 from .i_password_manager import IPasswordManager
@@ -0,0 +1 @@
+from .password_manager_exception import PasswordManagerException
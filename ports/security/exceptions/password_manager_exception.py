@@ -0,0 +1,5 @@
+class PasswordManagerException:
+    class Overloaded(Exception):
+        def __init__(self, retry_after: int) -> None:
+            super().__init__('The password manager is overloaded')
+            self.retry_after: int = retry_after
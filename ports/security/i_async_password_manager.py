@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class IAsyncPasswordManager(ABC):
+    @abstractmethod
+    async def verify(self, plain_password: str, hashed_password: str) -> bool: ...
+
+    @abstractmethod
+    async def hash(self, password: str) -> str: ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool: ...
@@ -7,3 +7,6 @@ class IPasswordManager(ABC):
 
     @abstractmethod
     def hash(self, password: str) -> str: ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool: ...
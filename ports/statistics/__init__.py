@@ -0,0 +1,2 @@
+from .i_user_statistics import IUserStatistics
+from .user_statistics import UserStatistics
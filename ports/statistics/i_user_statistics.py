@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from datetime import date
+
+from ports.repositories.user import ExportedUser
+
+from .user_statistics import UserStatistics
+
+
+class IUserStatistics(ABC):
+    @abstractmethod
+    async def refresh(self, users: AsyncIterable[ExportedUser]) -> None: ...
+
+    @abstractmethod
+    def dump(self) -> bytes | None: ...
+
+    @abstractmethod
+    def load(self, data: bytes) -> None: ...
+
+    @abstractmethod
+    def compute(self, today: date, signup_days: int) -> UserStatistics | None: ...
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from domain.value_objects import ColorTheme, Language
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserStatistics:
+    snapshot_at: datetime
+    total_users: int
+    active_users: int
+    users_by_language: dict[Language, int]
+    users_by_color_theme: dict[ColorTheme, int]
+    users_by_age_range: dict[str, int]
+    signups_by_day: dict[date, int]
@@ -6,6 +6,7 @@ import pytest
 import pytest_asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
+from adapters.models import ArchivedUserModel, UserModel
 from domain.entities import User
 from domain.value_objects import ColorTheme, Language
 
@@ -17,6 +18,10 @@ async def motor_database() -> AsyncGenerator[AsyncIOMotorDatabase]:
         timeoutMS=3000,
     )
     db: AsyncIOMotorDatabase = client['test']
+    for model in (UserModel, ArchivedUserModel):
+        await db[model.collection_name].create_indexes(
+            [index.to_index_model() for index in model.indexes]
+        )
 
     yield db
 
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from adapters.security import AdmissionControlledPasswordManager, AdmissionController
+from ports.security import IAsyncPasswordManager
+from ports.security.exceptions import PasswordManagerException
+
+
+class SlowPasswordManager(IAsyncPasswordManager):
+    def __init__(self) -> None:
+        self.release: asyncio.Event = asyncio.Event()
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        await self.release.wait()
+        return plain_password == hashed_password
+
+    async def hash(self, password: str) -> str:
+        await self.release.wait()
+        return password
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return False
+
+
+@pytest.fixture
+def slow_password_manager() -> SlowPasswordManager:
+    return SlowPasswordManager()
+
+
+@pytest.fixture
+def admission_controller() -> AdmissionController:
+    return AdmissionController(max_concurrency=1, max_queue_size=1, retry_after=3)
+
+
+@pytest.fixture
+def password_manager(
+    slow_password_manager: SlowPasswordManager,
+    admission_controller: AdmissionController,
+) -> AdmissionControlledPasswordManager:
+    return AdmissionControlledPasswordManager(
+        slow_password_manager, admission_controller
+    )
+
+
+@pytest.mark.asyncio
+async def test_operations_are_admitted_up_to_the_concurrency_limit_plus_the_queue(
+    password_manager: AdmissionControlledPasswordManager,
+    slow_password_manager: SlowPasswordManager,
+    admission_controller: AdmissionController,
+) -> None:
+    running = asyncio.create_task(password_manager.hash('senha'))
+    queued = asyncio.create_task(password_manager.verify('senha', 'senha'))
+    await asyncio.sleep(0)
+
+    assert admission_controller.in_flight == 1
+    assert admission_controller.queue_depth == 1
+
+    slow_password_manager.release.set()
+
+    assert await running == 'senha'
+    assert await queued == True
+    assert admission_controller.in_flight == 0
+    assert admission_controller.queue_depth == 0
+    assert admission_controller.admitted_count == 2
+    assert admission_controller.rejected_count == 0
+
+
+@pytest.mark.asyncio
+async def test_when_the_queue_is_full_raises_Overloaded(
+    password_manager: AdmissionControlledPasswordManager,
+    slow_password_manager: SlowPasswordManager,
+    admission_controller: AdmissionController,
+) -> None:
+    running = asyncio.create_task(password_manager.hash('senha'))
+    queued = asyncio.create_task(password_manager.hash('senha'))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordManagerException.Overloaded) as exc_info:
+        await password_manager.verify('senha', 'senha')
+
+    assert exc_info.value.retry_after == 3
+    assert admission_controller.rejected_count == 1
+
+    slow_password_manager.release.set()
+    await asyncio.gather(running, queued)
+
+    assert admission_controller.admitted_count == 2
@@ -0,0 +1,48 @@
+import pytest
+
+from adapters.security import Argon2PasswordManager, BcryptPasswordManager
+
+
+@pytest.fixture
+def password_manager() -> Argon2PasswordManager:
+    return Argon2PasswordManager(time_cost=1, memory_cost=8192, parallelism=1)
+
+
+def test_hash_password(password_manager: Argon2PasswordManager) -> None:
+    password: str = 'senha@123'
+    hashed_password: str = password_manager.hash(password)
+
+    assert hashed_password != password
+    assert hashed_password.startswith('$argon2id$')
+
+
+def test_verify_password(password_manager: Argon2PasswordManager) -> None:
+    password: str = 'senha@123'
+    hashed_password: str = password_manager.hash(password)
+
+    assert password_manager.verify(password, hashed_password) == True
+    assert password_manager.verify('senha@456', hashed_password) == False
+
+
+def test_verify_password_against_bcrypt_hash(
+    password_manager: Argon2PasswordManager,
+) -> None:
+    password: str = 'senha@123'
+    hashed_password: str = BcryptPasswordManager(rounds=4).hash(password)
+
+    assert password_manager.verify(password, hashed_password) == True
+    assert password_manager.verify('senha@456', hashed_password) == False
+
+
+def test_needs_rehash(password_manager: Argon2PasswordManager) -> None:
+    hashed_password: str = password_manager.hash('senha@123')
+    stronger_password_manager: Argon2PasswordManager = Argon2PasswordManager(
+        time_cost=2, memory_cost=8192, parallelism=1
+    )
+
+    assert password_manager.needs_rehash(hashed_password) == False
+    assert stronger_password_manager.needs_rehash(hashed_password) == True
+    assert (
+        password_manager.needs_rehash(BcryptPasswordManager(rounds=4).hash('senha'))
+        == True
+    )
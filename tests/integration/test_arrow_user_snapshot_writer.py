@@ -0,0 +1,62 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Literal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from adapters.exporters import ArrowUserSnapshotWriter
+from adapters.id import Ulid
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.user import ExportedUser
+
+USERS: list[ExportedUser] = [
+    ExportedUser(
+        id=f'01JB0C8Y3RSXK2B1N9Q6FMD3Z{number}',
+        username=f'Usuário {number}',
+        email=f'usuario{number}@gmail.com',
+        birth_date=date(year=1990, month=1, day=1 + number),
+        color_theme=ColorTheme.DARK if number % 2 else ColorTheme.LIGHT,
+        language=Language.PT_BR if number % 2 else Language.JA_JP,
+        is_active=number != 2,
+        created_at=datetime(year=2024, month=10, day=1, tzinfo=UTC),
+    )
+    for number in range(5)
+]
+
+
+async def exported_users() -> AsyncIterator[ExportedUser]:
+    for user in USERS:
+        yield user
+
+
+def read(path: Path, format: Literal['arrow', 'parquet']) -> pa.Table:
+    if format == 'parquet':
+        return pq.read_table(path)
+
+    with pa.ipc.open_file(path) as reader:
+        return reader.read_all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('format', ['arrow', 'parquet'])
+async def test_write_snapshot_in_record_batches(
+    tmp_path: Path, format: Literal['arrow', 'parquet']
+) -> None:
+    path: Path = tmp_path / f'users.{format}'
+
+    rows: int = await ArrowUserSnapshotWriter(
+        str(path), format, rows_per_batch=2
+    ).write(exported_users())
+    table: pa.Table = read(path, format)
+
+    assert rows == table.num_rows == len(USERS)
+    assert table.schema == ArrowUserSnapshotWriter.schema
+    assert table['id'].to_pylist() == [bytes(Ulid(user.id)) for user in USERS]
+    assert table['birth_date'].to_pylist() == [user.birth_date for user in USERS]
+    assert table['color_theme'].to_pylist() == [str(user.color_theme) for user in USERS]
+    assert table['language'].to_pylist() == [str(user.language) for user in USERS]
+    assert table['is_active'].to_pylist() == [user.is_active for user in USERS]
+    assert table['created_at'].to_pylist() == [user.created_at for user in USERS]
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from adapters.security import BcryptCalibration, BcryptCostCalibrator
+
+
+def test_calibrate_picks_the_highest_rounds_under_the_target() -> None:
+    calibration: BcryptCalibration = BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=60_000
+    ).calibrate()
+
+    assert calibration.rounds == 6
+    assert calibration.target_ms == 60_000
+    assert list(calibration.measurements_ms) == [4, 5, 6]
+
+
+def test_when_no_rounds_fit_the_target_calibrate_falls_back_to_the_floor() -> None:
+    calibration: BcryptCalibration = BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=0
+    ).calibrate()
+
+    assert calibration.rounds == 4
+    assert list(calibration.measurements_ms) == [4]
+
+
+def test_calibrate_shared_reuses_the_stored_calibration(tmp_path: Path) -> None:
+    path: str = str(tmp_path / 'bcrypt-calibration.json')
+
+    first: BcryptCalibration = BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=60_000, samples=1
+    ).calibrate_shared(path)
+    second: BcryptCalibration = BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=60_000, samples=1
+    ).calibrate_shared(path)
+
+    assert second == first
+
+
+def test_calibrate_shared_recalibrates_when_the_target_changes(
+    tmp_path: Path,
+) -> None:
+    path: str = str(tmp_path / 'bcrypt-calibration.json')
+
+    BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=60_000, samples=1
+    ).calibrate_shared(path)
+    calibration: BcryptCalibration = BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=0, samples=1
+    ).calibrate_shared(path)
+
+    assert calibration.rounds == 4
+    assert calibration.target_ms == 0
+
+
+def test_wait_for_shared_reads_the_calibration_written_by_another_process(
+    tmp_path: Path,
+) -> None:
+    path: str = str(tmp_path / 'bcrypt-calibration.json')
+    written: BcryptCalibration = BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=60_000, samples=1
+    ).calibrate_shared(path)
+
+    calibration: BcryptCalibration = BcryptCostCalibrator(
+        min_rounds=4, max_rounds=6, target_ms=60_000, samples=1
+    ).wait_for_shared(path, timeout_seconds=0)
+
+    assert calibration == written
+
+
+def test_wait_for_shared_times_out_without_a_calibration(tmp_path: Path) -> None:
+    with pytest.raises(TimeoutError):
+        BcryptCostCalibrator(
+            min_rounds=4, max_rounds=6, target_ms=60_000, samples=1
+        ).wait_for_shared(
+            str(tmp_path / 'bcrypt-calibration.json'),
+            timeout_seconds=0.2,
+            poll_seconds=0.05,
+        )
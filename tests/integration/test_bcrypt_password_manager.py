@@ -1,6 +1,6 @@
 import pytest
 
-from adapters.security import BcryptPasswordManager
+from adapters.security import Argon2PasswordManager, BcryptPasswordManager
 
 
 @pytest.fixture
@@ -23,3 +23,46 @@ def test_verify_password(password_manager: BcryptPasswordManager) -> None:
 
     assert hashed_password != password
     assert password_manager.verify(password, hashed_password) == True
+
+
+def test_hash_password_with_configured_rounds() -> None:
+    password_manager: BcryptPasswordManager = BcryptPasswordManager(rounds=5)
+    hashed_password: str = password_manager.hash('senha@123')
+
+    assert hashed_password.split('$')[2] == '05'
+
+
+def test_needs_rehash_when_hash_rounds_differ_from_configured_ones() -> None:
+    hashed_password: str = BcryptPasswordManager(rounds=4).hash('senha@123')
+
+    assert BcryptPasswordManager(rounds=4).needs_rehash(hashed_password) == False
+    assert BcryptPasswordManager(rounds=5).needs_rehash(hashed_password) == True
+
+
+def test_needs_rehash_keeps_stronger_hashes_within_the_max_rounds() -> None:
+    hashed_password: str = BcryptPasswordManager(rounds=5).hash('senha@123')
+
+    assert (
+        BcryptPasswordManager(rounds=4, max_rounds=5).needs_rehash(hashed_password)
+        == False
+    )
+    assert (
+        BcryptPasswordManager(rounds=4, max_rounds=4).needs_rehash(hashed_password)
+        == True
+    )
+
+
+def test_needs_rehash_when_the_hash_is_not_bcrypt() -> None:
+    password_manager: BcryptPasswordManager = BcryptPasswordManager(rounds=4)
+
+    assert password_manager.needs_rehash(Argon2PasswordManager().hash('senha@123'))
+    assert password_manager.needs_rehash('not-a-hash')
+
+
+def test_verify_password_hashed_with_argon2id() -> None:
+    password_manager: BcryptPasswordManager = BcryptPasswordManager(rounds=4)
+    hashed_password: str = Argon2PasswordManager().hash('senha@123')
+
+    assert password_manager.verify('senha@123', hashed_password) == True
+    assert password_manager.verify('senha@456', hashed_password) == False
+    assert password_manager.verify('senha@123', 'not-a-hash') == False
@@ -0,0 +1,95 @@
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+
+from adapters.security import CachingPasswordManager, CredentialCache
+from ports.security import IAsyncPasswordManager
+
+
+@pytest.fixture
+def inner_password_manager() -> Mock:
+    password_manager: Mock = create_autospec(IAsyncPasswordManager)
+    password_manager.verify = AsyncMock(return_value=True)
+
+    return password_manager
+
+
+@pytest.fixture
+def credential_cache() -> CredentialCache:
+    return CredentialCache(ttl_seconds=60, max_entries=2)
+
+
+@pytest.fixture
+def password_manager(
+    inner_password_manager: Mock, credential_cache: CredentialCache
+) -> CachingPasswordManager:
+    return CachingPasswordManager(inner_password_manager, credential_cache)
+
+
+@pytest.mark.asyncio
+async def test_repeated_verification_is_served_from_the_cache(
+    password_manager: CachingPasswordManager,
+    inner_password_manager: Mock,
+    credential_cache: CredentialCache,
+) -> None:
+    assert await password_manager.verify('senha', 'hash') == True
+    assert await password_manager.verify('senha', 'hash') == True
+
+    inner_password_manager.verify.assert_called_once_with('senha', 'hash')
+    assert credential_cache.hits == 1
+    assert credential_cache.misses == 1
+    assert credential_cache.hit_rate == 0.5
+    assert credential_cache.verify_seconds_saved >= 0
+
+
+@pytest.mark.asyncio
+async def test_failed_verification_is_not_cached(
+    password_manager: CachingPasswordManager,
+    inner_password_manager: Mock,
+    credential_cache: CredentialCache,
+) -> None:
+    inner_password_manager.verify = AsyncMock(return_value=False)
+
+    assert await password_manager.verify('senha', 'hash') == False
+    assert await password_manager.verify('senha', 'hash') == False
+
+    assert inner_password_manager.verify.call_count == 2
+    assert credential_cache.size == 0
+
+
+@pytest.mark.asyncio
+async def test_changing_the_stored_hash_misses_the_cache(
+    password_manager: CachingPasswordManager,
+    inner_password_manager: Mock,
+) -> None:
+    await password_manager.verify('senha', 'hash')
+    await password_manager.verify('senha', 'novo_hash')
+
+    assert inner_password_manager.verify.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(
+    password_manager: CachingPasswordManager,
+    inner_password_manager: Mock,
+    credential_cache: CredentialCache,
+) -> None:
+    await password_manager.verify('senha1', 'hash1')
+    await password_manager.verify('senha2', 'hash2')
+    await password_manager.verify('senha1', 'hash1')
+    await password_manager.verify('senha3', 'hash3')
+
+    assert credential_cache.size == 2
+
+    await password_manager.verify('senha1', 'hash1')
+    await password_manager.verify('senha2', 'hash2')
+
+    assert inner_password_manager.verify.call_count == 4
+
+
+def test_expired_entries_miss_the_cache() -> None:
+    credential_cache: CredentialCache = CredentialCache(ttl_seconds=0, max_entries=2)
+    credential_cache.add('senha', 'hash', verify_seconds=0.2)
+
+    assert credential_cache.contains('senha', 'hash') == False
+    assert credential_cache.size == 0
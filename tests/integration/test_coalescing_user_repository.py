@@ -0,0 +1,90 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+
+from adapters.repositories.user import CoalescingUserRepository
+from domain.entities import User
+from ports.repositories.user import IUserRepository
+
+
+@pytest.fixture
+def inner_repository(user: User) -> Mock:
+    repository: Mock = create_autospec(IUserRepository)
+    repository.get_by_ids = AsyncMock(return_value=[user])
+
+    return repository
+
+
+@pytest.fixture
+def repository(inner_repository: Mock) -> CoalescingUserRepository:
+    return CoalescingUserRepository(inner_repository)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_by_id_calls_are_batched_in_one_query(
+    repository: CoalescingUserRepository, inner_repository: Mock, user: User
+) -> None:
+    results: list[User | None] = await asyncio.gather(
+        repository.get_by_id(user.id),
+        repository.get_by_id(user.id),
+        repository.get_by_id('01JB0C8Y3RSXK2B1N9Q6FMD3ZT'),
+    )
+
+    inner_repository.get_by_ids.assert_called_once_with(
+        [user.id, '01JB0C8Y3RSXK2B1N9Q6FMD3ZT']
+    )
+    inner_repository.get_by_id.assert_not_called()
+
+    first, second, missing = results
+
+    assert first is not None and second is not None
+    assert first.id == second.id == user.id
+    assert first is not second
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_sequential_get_by_id_calls_are_not_batched_together(
+    repository: CoalescingUserRepository, inner_repository: Mock, user: User
+) -> None:
+    await repository.get_by_id(user.id)
+    await repository.get_by_id(user.id)
+
+    assert inner_repository.get_by_ids.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_when_the_batch_fails_each_id_is_loaded_on_its_own(
+    repository: CoalescingUserRepository, inner_repository: Mock, user: User
+) -> None:
+    inner_repository.get_by_ids = AsyncMock(side_effect=ValueError())
+    inner_repository.get_by_id = AsyncMock(
+        side_effect=lambda user_id: user if user_id == user.id else None
+    )
+
+    found, missing = await asyncio.gather(
+        repository.get_by_id(user.id),
+        repository.get_by_id('01JB0C8Y3RSXK2B1N9Q6FMD3ZT'),
+    )
+
+    assert found is user
+    assert missing is None
+    assert inner_repository.get_by_id.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_when_the_database_fails_every_caller_gets_the_error(
+    repository: CoalescingUserRepository, inner_repository: Mock, user: User
+) -> None:
+    error: ConnectionError = ConnectionError('database unavailable')
+    inner_repository.get_by_ids = AsyncMock(side_effect=error)
+
+    results: list[User | BaseException | None] = await asyncio.gather(
+        repository.get_by_id(user.id),
+        repository.get_by_id('01JB0C8Y3RSXK2B1N9Q6FMD3ZT'),
+        return_exceptions=True,
+    )
+
+    assert results == [error, error]
+    inner_repository.get_by_id.assert_not_called()
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+import pytest
+
+from adapters.repositories.lease import InMemoryLeaseRepository
+
+
+@pytest.mark.asyncio
+async def test_the_holder_renews_its_lease() -> None:
+    repository: InMemoryLeaseRepository = InMemoryLeaseRepository()
+
+    assert await repository.acquire('job', timedelta(minutes=1))
+    assert await repository.acquire('job', timedelta(minutes=1))
+    assert await repository.acquire('other_job', timedelta(minutes=1))
+
+
+@pytest.mark.asyncio
+async def test_an_expired_lease_can_be_acquired_again() -> None:
+    repository: InMemoryLeaseRepository = InMemoryLeaseRepository()
+
+    assert await repository.acquire('job', timedelta(seconds=-1))
+    assert await repository.acquire('job', timedelta(minutes=1))
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from adapters.repositories.lease import MongoLeaseRepository
+
+
+@pytest.mark.asyncio
+async def test_a_held_lease_is_only_renewed_by_its_holder(
+    motor_database: AsyncIOMotorDatabase,
+) -> None:
+    holder: MongoLeaseRepository = MongoLeaseRepository(motor_database)
+    other: MongoLeaseRepository = MongoLeaseRepository(motor_database)
+
+    assert await holder.acquire('job', timedelta(minutes=1))
+    assert not await other.acquire('job', timedelta(minutes=1))
+    assert await holder.acquire('job', timedelta(minutes=1))
+    assert await other.acquire('other_job', timedelta(minutes=1))
+
+
+@pytest.mark.asyncio
+async def test_an_expired_lease_is_taken_over(
+    motor_database: AsyncIOMotorDatabase,
+) -> None:
+    holder: MongoLeaseRepository = MongoLeaseRepository(motor_database)
+    other: MongoLeaseRepository = MongoLeaseRepository(motor_database)
+
+    assert await holder.acquire('job', timedelta(seconds=-1))
+    assert await other.acquire('job', timedelta(minutes=1))
+    assert not await holder.acquire('job', timedelta(minutes=1))
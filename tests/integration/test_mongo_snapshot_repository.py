@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from adapters.repositories.snapshot import MongoSnapshotRepository
+from ports.repositories.snapshot import StoredSnapshot
+
+
+@pytest.mark.asyncio
+async def test_the_last_saved_snapshot_is_returned(
+    motor_database: AsyncIOMotorDatabase,
+) -> None:
+    repository: MongoSnapshotRepository = MongoSnapshotRepository(motor_database)
+    first: StoredSnapshot = StoredSnapshot(
+        taken_at=datetime(2024, 10, 28, 12, tzinfo=timezone.utc), data=b'first'
+    )
+    second: StoredSnapshot = StoredSnapshot(
+        taken_at=datetime(2024, 10, 28, 12, 10, tzinfo=timezone.utc), data=b'second'
+    )
+
+    assert await repository.get('user_statistics') is None
+
+    await repository.save('user_statistics', first)
+    await repository.save('user_statistics', second)
+
+    assert await repository.get('user_statistics') == second
@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator, Callable
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
 
 import pytest
 import pytest_asyncio
@@ -9,6 +10,8 @@ from adapters.id import Ulid
 from adapters.repositories.user import MongoUserRepository
 from domain.entities import User
 from domain.value_objects import ColorTheme, Language
+from ports.repositories.exceptions import RepositoryException
+from ports.repositories.user import ExportedUser, UserFilters
 
 
 @pytest_asyncio.fixture
@@ -127,14 +130,15 @@ async def test_update_user_success(
 ) -> None:
     await repository.create(user)
 
-    new_user: User = User(
-        id=user.id,
-        username='Leandro Nogueira',
-        email='leandro@hotmail.com.br',
-        hashed_password='senha_criptografada_2',
-        birth_date=date(year=1984, month=6, day=12),
-        color_theme=ColorTheme.LIGHT,
-        language=Language.PT_PT,
+    new_user: User = user
+    new_user.update_personal_data(
+        new_username='Leandro Nogueira',
+        new_email='leandro@hotmail.com.br',
+        new_birth_date=date(year=1984, month=6, day=12),
+    )
+    new_user.update_password('senha_criptografada_2')
+    new_user.update_preferences(
+        new_color_theme=ColorTheme.LIGHT, new_language=Language.PT_PT
     )
 
     await repository.update(new_user)
@@ -161,3 +165,389 @@ async def test_update_user_success(
     created_at: datetime | None = updated_user.get('created_at')
     assert created_at is not None
     assert normalize_datetime(created_at) == normalize_datetime(new_user.created_at)
+
+
+@pytest.mark.asyncio
+async def test_users_collection_has_a_unique_index_on_email(
+    motor_database: AsyncIOMotorDatabase,
+) -> None:
+    indexes: dict[str, Any] = await motor_database.users.index_information()
+
+    assert indexes['email_unique']['key'] == [('email', 1)]
+    assert indexes['email_unique']['unique'] == True
+
+
+@pytest.mark.asyncio
+async def test_when_try_to_create_user_with_an_email_in_use_raises_AlreadyExists(
+    repository: MongoUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    duplicated_user: User = User(
+        id='01JB0C8Y3RSXK2B1N9Q6FMD3ZT',
+        username='Outro Usuário',
+        email=user.email,
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+
+    with pytest.raises(RepositoryException.AlreadyExists):
+        await repository.create(duplicated_user)
+
+
+@pytest.mark.asyncio
+async def test_update_user_only_sets_the_changed_fields(
+    repository: MongoUserRepository,
+    motor_database: AsyncIOMotorDatabase,
+    user: User,
+) -> None:
+    await repository.create(user)
+    await motor_database.users.update_one(
+        {'_id': bytes(Ulid(user.id))}, {'$set': {'username': 'Alterado por fora'}}
+    )
+
+    user.update_preferences(
+        new_color_theme=ColorTheme.LIGHT, new_language=user.language
+    )
+
+    assert user.changed_fields == {'color_theme'}
+
+    await repository.update(user)
+
+    updated_user = await motor_database.users.find_one({'_id': bytes(Ulid(user.id))})
+
+    assert updated_user is not None
+    assert updated_user.get('color_theme') == ColorTheme.LIGHT
+    assert updated_user.get('username') == 'Alterado por fora'
+    assert user.changed_fields == set()
+
+
+@pytest.mark.asyncio
+async def test_update_user_without_changes_skips_the_write(
+    repository: MongoUserRepository,
+    motor_database: AsyncIOMotorDatabase,
+    user: User,
+) -> None:
+    await repository.create(user)
+    await motor_database.users.delete_one({'_id': bytes(Ulid(user.id))})
+
+    user.update_preferences(
+        new_color_theme=user.color_theme, new_language=user.language
+    )
+
+    await repository.update(user)
+
+    assert await motor_database.users.count_documents({}) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_success(
+    repository: MongoUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    users: list[User] = await repository.get_by_ids(
+        [user.id, '01JB0C8Y3RSXK2B1N9Q6FMD3ZT']
+    )
+
+    assert [found_user.id for found_user in users] == [user.id]
+
+
+@pytest.mark.asyncio
+async def test_list_users_paginates_by_id_with_filters(
+    repository: MongoUserRepository, user: User
+) -> None:
+    other_user: User = User(
+        id='01JB0C8Y3RSXK2B1N9Q6FMD3ZT',
+        username='Outro Usuário',
+        email='outro@gmail.com',
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+    await repository.create(user)
+    await repository.create(other_user)
+
+    first_page: list[User] = await repository.list_users(None, 1, UserFilters())
+    second_page: list[User] = await repository.list_users(
+        first_page[0].id, 1, UserFilters()
+    )
+    filtered: list[User] = await repository.list_users(
+        None, 10, UserFilters(is_active=True, color_theme=ColorTheme.LIGHT)
+    )
+
+    assert [found.id for found in first_page + second_page] == sorted(
+        [user.id, other_user.id]
+    )
+    assert [found.id for found in filtered] == [other_user.id]
+
+
+@pytest.mark.asyncio
+async def test_create_many_users_reports_duplicates(
+    repository: MongoUserRepository, user: User
+) -> None:
+    duplicated_user: User = User(
+        id='01JB0CBQ8M2M4F6DWD8W8S7R3C',
+        username='Outro Usuário',
+        email=user.email,
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+    new_user: User = User(
+        id='01JB0C8Y3RSXK2B1N9Q6FMD3ZT',
+        username='Novo Usuário',
+        email='novo@gmail.com',
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+
+    created: list[bool] = await repository.create_many(
+        [user, duplicated_user, new_user]
+    )
+
+    assert created == [True, False, True]
+    assert await repository.get_by_id(duplicated_user.id) is None
+    assert await repository.get_by_id(new_user.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_export_users_in_id_order_without_the_hashed_password(
+    repository: MongoUserRepository, user: User
+) -> None:
+    first_user: User = User(
+        id='01J0000000000000000000000A',
+        username='Primeiro Usuário',
+        email='primeiro@gmail.com',
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+    await repository.create(user)
+    await repository.create(first_user)
+
+    exported: list[ExportedUser] = [
+        exported_user async for exported_user in repository.export(batch_size=1)
+    ]
+
+    assert [exported_user.id for exported_user in exported] == [
+        first_user.id,
+        user.id,
+    ]
+    assert exported[1].email == user.email
+    assert exported[1].birth_date == user.birth_date
+    assert exported[1].language == user.language
+    assert not hasattr(exported[1], 'hashed_password')
+
+
+@pytest.mark.asyncio
+async def test_update_user_with_a_stale_version_raises_Conflict(
+    repository: MongoUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    stale_user: User | None = await repository.get_by_id(user.id)
+    assert stale_user is not None
+
+    user.update_preferences(
+        new_color_theme=ColorTheme.LIGHT, new_language=user.language
+    )
+    await repository.update(user)
+
+    assert user.version == 1
+
+    stale_user.update_preferences(
+        new_color_theme=stale_user.color_theme, new_language=Language.EN_US
+    )
+
+    with pytest.raises(RepositoryException.Conflict):
+        await repository.update(stale_user)
+
+    stored_user: User | None = await repository.get_by_id(user.id)
+
+    assert stored_user is not None
+    assert stored_user.version == 1
+    assert stored_user.color_theme == ColorTheme.LIGHT
+    assert stored_user.language == user.language
+
+
+@pytest.mark.asyncio
+async def test_update_user_stored_without_a_version_success(
+    repository: MongoUserRepository,
+    motor_database: AsyncIOMotorDatabase,
+    user: User,
+) -> None:
+    await repository.create(user)
+    await motor_database.users.update_one(
+        {'_id': bytes(Ulid(user.id))}, {'$unset': {'version': ''}}
+    )
+
+    stored_user: User | None = await repository.get_by_id(user.id)
+    assert stored_user is not None and stored_user.version == 0
+
+    stored_user.deactivate()
+    await repository.update(stored_user)
+
+    updated_user = await motor_database.users.find_one({'_id': bytes(Ulid(user.id))})
+
+    assert updated_user is not None
+    assert updated_user.get('version') == 1
+    assert updated_user.get('is_active') is False
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_moves_them_to_the_archive(
+    repository: MongoUserRepository,
+    motor_database: AsyncIOMotorDatabase,
+    user: User,
+) -> None:
+    await repository.create(user)
+
+    user.deactivate()
+    await repository.update(user)
+
+    archived: int = await repository.archive_deactivated(
+        datetime.now(timezone.utc) + timedelta(seconds=1), 10
+    )
+
+    assert archived == 1
+    assert await motor_database.users.find_one({}) == {
+        '_id': bytes(Ulid(user.id)),
+        'email': user.email,
+        'archived': True,
+    }
+    assert await motor_database.users_archive.count_documents({}) == 1
+
+    archived_user: User | None = await repository.get_by_email(user.email)
+
+    assert archived_user is not None
+    assert archived_user.id == user.id
+    assert archived_user.is_active == False
+    assert [
+        stored_user.id for stored_user in await repository.get_by_ids([user.id])
+    ] == [user.id]
+
+    with pytest.raises(RepositoryException.AlreadyExists):
+        await repository.create(user)
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_skips_recently_deactivated_ones(
+    repository: MongoUserRepository,
+    motor_database: AsyncIOMotorDatabase,
+    user: User,
+) -> None:
+    await repository.create(user)
+
+    user.deactivate()
+    await repository.update(user)
+
+    archived: int = await repository.archive_deactivated(
+        datetime.now(timezone.utc) - timedelta(days=1), 10
+    )
+
+    assert archived == 0
+    assert await motor_database.users.count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_includes_users_deactivated_without_a_date(
+    repository: MongoUserRepository,
+    motor_database: AsyncIOMotorDatabase,
+    user: User,
+) -> None:
+    await repository.create(user)
+    await motor_database.users.update_one(
+        {'_id': bytes(Ulid(user.id))},
+        {'$set': {'is_active': False}, '$unset': {'deactivated_at': ''}},
+    )
+
+    archived: int = await repository.archive_deactivated(
+        datetime.now(timezone.utc) - timedelta(days=1), 10
+    )
+
+    assert archived == 1
+    assert await motor_database.users.count_documents({'archived': True}) == 1
+    assert await motor_database.users_archive.count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_export_users_includes_the_archive_when_asked(
+    repository: MongoUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    user.deactivate()
+    await repository.update(user)
+    await repository.archive_deactivated(
+        datetime.now(timezone.utc) + timedelta(seconds=1), 10
+    )
+
+    hot: list[ExportedUser] = [
+        exported_user async for exported_user in repository.export(batch_size=1)
+    ]
+    everyone: list[ExportedUser] = [
+        exported_user
+        async for exported_user in repository.export(
+            batch_size=1, include_archived=True
+        )
+    ]
+
+    assert hot == []
+    assert [exported_user.id for exported_user in everyone] == [user.id]
+
+
+@pytest.mark.asyncio
+async def test_count_signups_per_id_range(
+    repository: MongoUserRepository, user: User
+) -> None:
+    other_user: User = User(
+        id='01JB0C8Y3RSXK2B1N9Q6FMD3ZT',
+        username='Leandro Nogueira',
+        email='leandro@hotmail.com.br',
+        hashed_password='senha_criptografada_2',
+        birth_date=date(year=1984, month=6, day=12),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.PT_PT,
+    )
+    await repository.create_many([user, other_user])
+
+    counts: list[int] = await repository.count_signups(
+        [
+            datetime(2024, 10, 24, 17, tzinfo=timezone.utc),
+            datetime(2024, 10, 24, 18, tzinfo=timezone.utc),
+            datetime(2024, 10, 24, 23, tzinfo=timezone.utc),
+            datetime(2024, 10, 25, tzinfo=timezone.utc),
+        ]
+    )
+
+    assert counts == [1, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_count_signups_counts_archived_users_once(
+    repository: MongoUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    user.deactivate()
+    await repository.update(user)
+    await repository.archive_deactivated(
+        datetime.now(timezone.utc) + timedelta(seconds=1), 10
+    )
+
+    counts: list[int] = await repository.count_signups(
+        [
+            datetime(2024, 10, 24, tzinfo=timezone.utc),
+            datetime(2024, 10, 25, tzinfo=timezone.utc),
+        ]
+    )
+
+    assert counts == [1]
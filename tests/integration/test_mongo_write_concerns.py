@@ -0,0 +1,110 @@
+from datetime import date
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo import WriteConcern
+
+from adapters.repositories.mongo import MongoWriteConcerns
+from adapters.repositories.user import MongoUserRepository
+from domain.entities import User
+from domain.value_objects import Language
+
+
+class FakeCollection(MagicMock):
+    def with_options(self, write_concern: WriteConcern) -> MagicMock:
+        writer: MagicMock = MagicMock()
+        writer.write_concern = write_concern
+        writer.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        writer.insert_one = AsyncMock()
+        self.writers.append(writer)
+
+        return writer
+
+
+def fake_collection(name: str) -> FakeCollection:
+    collection: FakeCollection = FakeCollection()
+    collection.name = name
+    collection.writers = []
+    collection.find = MagicMock(
+        return_value=MagicMock(to_list=AsyncMock(return_value=[]))
+    )
+
+    return collection
+
+
+@pytest.fixture
+def db() -> dict[str, Any]:
+    return {
+        'users': fake_collection('users'),
+        'users_archive': fake_collection('users_archive'),
+    }
+
+
+@pytest.fixture
+def repository(db: dict[str, Any]) -> MongoUserRepository:
+    return MongoUserRepository(
+        db,  # type: ignore
+        MongoWriteConcerns(
+            fast=WriteConcern(w=1), durable=WriteConcern(w='majority', j=True)
+        ),
+    )
+
+
+def used_write_concerns(collection: FakeCollection) -> list[dict[str, Any]]:
+    return [
+        writer.write_concern.document
+        for writer in collection.writers
+        if writer.update_one.await_count or writer.insert_one.await_count
+    ]
+
+
+@pytest.mark.asyncio
+async def test_preference_updates_use_the_fast_write_concern(
+    repository: MongoUserRepository, db: dict[str, Any], user: User
+) -> None:
+    user.update_preferences(
+        new_color_theme=user.color_theme, new_language=Language.EN_US
+    )
+
+    await repository.update(user)
+
+    assert used_write_concerns(db['users']) == [{'w': 1}]
+
+
+@pytest.mark.asyncio
+async def test_password_updates_use_the_durable_write_concern(
+    repository: MongoUserRepository, db: dict[str, Any], user: User
+) -> None:
+    user.update_password('nova_senha_criptografada')
+
+    await repository.update(user)
+
+    assert used_write_concerns(db['users']) == [{'w': 'majority', 'j': True}]
+
+
+@pytest.mark.asyncio
+async def test_mixed_updates_use_the_durable_write_concern(
+    repository: MongoUserRepository, db: dict[str, Any], user: User
+) -> None:
+    user.update_preferences(
+        new_color_theme=user.color_theme, new_language=Language.EN_US
+    )
+    user.update_personal_data(
+        new_username='Outro Nome',
+        new_email=user.email,
+        new_birth_date=date(year=1999, month=1, day=1),
+    )
+
+    await repository.update(user)
+
+    assert used_write_concerns(db['users']) == [{'w': 'majority', 'j': True}]
+
+
+@pytest.mark.asyncio
+async def test_creates_use_the_durable_write_concern(
+    repository: MongoUserRepository, db: dict[str, Any], user: User
+) -> None:
+    await repository.create(user)
+
+    assert used_write_concerns(db['users']) == [{'w': 'majority', 'j': True}]
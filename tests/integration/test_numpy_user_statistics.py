@@ -0,0 +1,107 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+import pytest
+from ulid import ULID
+
+from adapters.statistics import NumpyUserStatistics
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.user import ExportedUser
+from ports.statistics import UserStatistics
+
+TODAY: date = date(year=2024, month=10, day=28)
+
+
+def exported_user(birth_date: date, signup_day: date, **fields: Any) -> ExportedUser:
+    created_at: datetime = datetime(
+        year=signup_day.year,
+        month=signup_day.month,
+        day=signup_day.day,
+        hour=12,
+        tzinfo=UTC,
+    )
+
+    return ExportedUser(
+        id=str(ULID.from_datetime(created_at)),
+        username='Usuário',
+        email='usuario@gmail.com',
+        birth_date=birth_date,
+        color_theme=fields.get('color_theme', ColorTheme.DARK),
+        language=fields.get('language', Language.PT_BR),
+        is_active=fields.get('is_active', True),
+        created_at=created_at,
+    )
+
+
+USERS: list[ExportedUser] = [
+    exported_user(date(year=2006, month=10, day=28), TODAY),
+    exported_user(
+        date(year=2006, month=10, day=29),
+        TODAY - timedelta(days=1),
+        language=Language.EN_US,
+    ),
+    exported_user(
+        date(year=1999, month=10, day=28),
+        TODAY - timedelta(days=1),
+        color_theme=ColorTheme.LIGHT,
+    ),
+    exported_user(
+        date(year=1950, month=1, day=1),
+        TODAY - timedelta(days=400),
+        is_active=False,
+    ),
+]
+
+
+async def exported_users() -> AsyncIterator[ExportedUser]:
+    for user in USERS:
+        yield user
+
+
+@pytest.mark.asyncio
+async def test_compute_before_the_first_refresh_returns_None() -> None:
+    assert NumpyUserStatistics().compute(TODAY, 7) is None
+
+
+@pytest.mark.asyncio
+async def test_compute_aggregates_the_snapshot() -> None:
+    statistics: NumpyUserStatistics = NumpyUserStatistics(rows_per_chunk=3)
+    await statistics.refresh(exported_users())
+
+    result: UserStatistics | None = statistics.compute(TODAY, 3)
+
+    assert result is not None
+    assert result.total_users == 4
+    assert result.active_users == 3
+    assert result.users_by_language[Language.PT_BR] == 3
+    assert result.users_by_language[Language.EN_US] == 1
+    assert result.users_by_language[Language.JA_JP] == 0
+    assert result.users_by_color_theme == {ColorTheme.LIGHT: 1, ColorTheme.DARK: 3}
+    assert result.users_by_age_range == {
+        '0-17': 1,
+        '18-24': 1,
+        '25-34': 1,
+        '35-44': 0,
+        '45-54': 0,
+        '55-64': 0,
+        '65+': 1,
+    }
+    assert result.signups_by_day == {
+        TODAY - timedelta(days=2): 0,
+        TODAY - timedelta(days=1): 2,
+        TODAY: 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_a_dumped_snapshot_loads_into_another_instance() -> None:
+    statistics: NumpyUserStatistics = NumpyUserStatistics()
+    await statistics.refresh(exported_users())
+    data: bytes | None = statistics.dump()
+
+    loaded: NumpyUserStatistics = NumpyUserStatistics()
+    assert data is not None
+    loaded.load(data)
+
+    assert loaded.compute(TODAY, 3) == statistics.compute(TODAY, 3)
@@ -0,0 +1,33 @@
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from adapters.security import BcryptPasswordManager, ProcessPoolPasswordManager
+
+
+@pytest.fixture
+def password_manager() -> Generator[ProcessPoolPasswordManager]:
+    executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=1)
+
+    yield ProcessPoolPasswordManager(BcryptPasswordManager(), executor)
+
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_password(password_manager: ProcessPoolPasswordManager) -> None:
+    password: str = 'senha@123'
+    hashed_password: str = await password_manager.hash(password)
+
+    assert hashed_password != password
+
+
+@pytest.mark.asyncio
+async def test_verify_password(password_manager: ProcessPoolPasswordManager) -> None:
+    password: str = 'senha@123'
+    hashed_password: str = await password_manager.hash(password)
+
+    assert hashed_password != password
+    assert await password_manager.verify(password, hashed_password) == True
+    assert await password_manager.verify('senha@456', hashed_password) == False
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from adapters.security import (
+    BcryptPasswordManager,
+    HashingWorkerServer,
+    SocketPasswordManager,
+)
+from ports.security import IPasswordManager
+from ports.security.exceptions import PasswordManagerException
+
+
+class RecordingPasswordManager(IPasswordManager):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.release: threading.Event = threading.Event()
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        self.release.wait()
+        self.calls.append(f'verify:{plain_password}')
+
+        return True
+
+    def hash(self, password: str) -> str:
+        self.release.wait()
+        self.calls.append(f'hash:{password}')
+
+        return password
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return False
+
+
+class FailingPasswordManager(IPasswordManager):
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        raise ValueError('Invalid salt')
+
+    def hash(self, password: str) -> str:
+        raise ValueError('Invalid salt')
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return False
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> str:
+    return str(tmp_path / 'hashing.sock')
+
+
+@pytest_asyncio.fixture
+async def bcrypt_server(socket_path: str) -> AsyncGenerator[HashingWorkerServer]:
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2)
+    server: HashingWorkerServer = HashingWorkerServer(
+        socket_path=socket_path,
+        password_manager=BcryptPasswordManager(rounds=4),
+        executor=executor,
+        concurrency=2,
+    )
+    await server.start()
+
+    yield server
+
+    await server.close()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_through_the_worker(
+    bcrypt_server: HashingWorkerServer, socket_path: str
+) -> None:
+    password_manager: SocketPasswordManager = SocketPasswordManager(
+        socket_path, BcryptPasswordManager(rounds=4)
+    )
+
+    hashed_password: str = await password_manager.hash('senha')
+
+    assert await password_manager.verify('senha', hashed_password) == True
+    assert await password_manager.verify('outra', hashed_password) == False
+    assert password_manager.needs_rehash(hashed_password) == False
+
+
+@pytest.mark.asyncio
+async def test_worker_errors_are_raised_by_the_client(socket_path: str) -> None:
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+    server: HashingWorkerServer = HashingWorkerServer(
+        socket_path=socket_path,
+        password_manager=FailingPasswordManager(),
+        executor=executor,
+        concurrency=1,
+    )
+    await server.start()
+
+    password_manager: SocketPasswordManager = SocketPasswordManager(
+        socket_path, BcryptPasswordManager(rounds=4)
+    )
+
+    try:
+        with pytest.raises(RuntimeError):
+            await password_manager.verify('senha', 'hash_invalido')
+    finally:
+        await server.close()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_when_the_worker_is_down_raises_Overloaded(socket_path: str) -> None:
+    password_manager: SocketPasswordManager = SocketPasswordManager(
+        socket_path, BcryptPasswordManager(rounds=4), retry_after=3
+    )
+
+    with pytest.raises(PasswordManagerException.Overloaded) as exc_info:
+        await password_manager.hash('senha')
+
+    assert exc_info.value.retry_after == 3
+
+
+@pytest.mark.asyncio
+async def test_verifications_are_served_before_queued_hashes(
+    socket_path: str,
+) -> None:
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+    recording_password_manager: RecordingPasswordManager = RecordingPasswordManager()
+    server: HashingWorkerServer = HashingWorkerServer(
+        socket_path=socket_path,
+        password_manager=recording_password_manager,
+        executor=executor,
+        concurrency=1,
+    )
+    await server.start()
+
+    password_manager: SocketPasswordManager = SocketPasswordManager(
+        socket_path, recording_password_manager
+    )
+
+    try:
+        first: asyncio.Task[str] = asyncio.create_task(password_manager.hash('1'))
+        await asyncio.sleep(0.05)
+
+        pending: list[asyncio.Task[str | bool]] = [
+            asyncio.create_task(password_manager.hash('2')),
+            asyncio.create_task(password_manager.verify('3', 'hash')),
+        ]
+        while server.queue_depth < 2:
+            await asyncio.sleep(0.01)
+
+        recording_password_manager.release.set()
+        await asyncio.gather(first, *pending)
+    finally:
+        await server.close()
+        executor.shutdown()
+
+    assert recording_password_manager.calls == ['hash:1', 'verify:3', 'hash:2']
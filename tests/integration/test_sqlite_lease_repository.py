@@ -0,0 +1,42 @@
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from adapters.repositories.lease import SqliteLeaseRepository
+from adapters.repositories.sqlite import SqliteConnectionPool
+
+
+@pytest_asyncio.fixture
+async def pool(tmp_path: Path) -> AsyncGenerator[SqliteConnectionPool]:
+    pool: SqliteConnectionPool = SqliteConnectionPool(str(tmp_path / 'leases.db'), 2)
+    await SqliteLeaseRepository.create_schema(pool)
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_a_held_lease_is_only_renewed_by_its_holder(
+    pool: SqliteConnectionPool,
+) -> None:
+    holder: SqliteLeaseRepository = SqliteLeaseRepository(pool)
+    other: SqliteLeaseRepository = SqliteLeaseRepository(pool)
+
+    assert await holder.acquire('job', timedelta(minutes=1))
+    assert not await other.acquire('job', timedelta(minutes=1))
+    assert await holder.acquire('job', timedelta(minutes=1))
+    assert await other.acquire('other_job', timedelta(minutes=1))
+
+
+@pytest.mark.asyncio
+async def test_an_expired_lease_is_taken_over(pool: SqliteConnectionPool) -> None:
+    holder: SqliteLeaseRepository = SqliteLeaseRepository(pool)
+    other: SqliteLeaseRepository = SqliteLeaseRepository(pool)
+
+    assert await holder.acquire('job', timedelta(seconds=-1))
+    assert await other.acquire('job', timedelta(minutes=1))
+    assert not await holder.acquire('job', timedelta(minutes=1))
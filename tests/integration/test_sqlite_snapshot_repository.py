@@ -0,0 +1,38 @@
+from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from adapters.repositories.snapshot import SqliteSnapshotRepository
+from adapters.repositories.sqlite import SqliteConnectionPool
+from ports.repositories.snapshot import StoredSnapshot
+
+
+@pytest_asyncio.fixture
+async def pool(tmp_path: Path) -> AsyncGenerator[SqliteConnectionPool]:
+    pool: SqliteConnectionPool = SqliteConnectionPool(str(tmp_path / 'snapshots.db'), 1)
+    await SqliteSnapshotRepository.create_schema(pool)
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_the_last_saved_snapshot_is_returned(pool: SqliteConnectionPool) -> None:
+    repository: SqliteSnapshotRepository = SqliteSnapshotRepository(pool)
+    first: StoredSnapshot = StoredSnapshot(
+        taken_at=datetime(2024, 10, 28, 12, tzinfo=timezone.utc), data=b'first'
+    )
+    second: StoredSnapshot = StoredSnapshot(
+        taken_at=datetime(2024, 10, 28, 12, 10, tzinfo=timezone.utc), data=b'second'
+    )
+
+    assert await repository.get('user_statistics') is None
+
+    await repository.save('user_statistics', first)
+    await repository.save('user_statistics', second)
+
+    assert await repository.get('user_statistics') == second
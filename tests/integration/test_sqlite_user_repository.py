@@ -0,0 +1,444 @@
+import asyncio
+import sqlite3
+import threading
+from collections.abc import AsyncGenerator
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from adapters.repositories.sqlite import SqliteConnectionPool
+from adapters.repositories.user import SqliteUserRepository
+from adapters.repositories.user.sqlite_user_repository import SCHEMA
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from ports.repositories.exceptions import RepositoryException
+from ports.repositories.user import ExportedUser, UserFilters
+
+
+@pytest_asyncio.fixture
+async def pool(tmp_path: Path) -> AsyncGenerator[SqliteConnectionPool]:
+    pool: SqliteConnectionPool = SqliteConnectionPool(str(tmp_path / 'users.db'), 2)
+    await SqliteUserRepository.create_schema(pool)
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture
+def repository(pool: SqliteConnectionPool) -> SqliteUserRepository:
+    return SqliteUserRepository(pool)
+
+
+@pytest.fixture
+def other_user() -> User:
+    return User(
+        id='01JB0C8Y3RSXK2B1N9Q6FMD3ZT',
+        username='Leandro Nogueira',
+        email='leandro@hotmail.com.br',
+        hashed_password='senha_criptografada_2',
+        birth_date=date(year=1984, month=6, day=12),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.PT_PT,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_user_success(
+    repository: SqliteUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    by_id: User | None = await repository.get_by_id(user.id)
+    by_email: User | None = await repository.get_by_email(user.email)
+
+    assert by_id is not None and by_email is not None
+    assert by_id.__dict__ == by_email.__dict__ == user.__dict__
+    assert await repository.get_by_id('01JB0C8Y3RSXK2B1N9Q6FMD3ZT') is None
+    assert await repository.get_by_email('ninguem@gmail.com') is None
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_success(
+    repository: SqliteUserRepository, user: User, other_user: User
+) -> None:
+    await repository.create(user)
+    await repository.create(other_user)
+
+    users: list[User] = await repository.get_by_ids(
+        [user.id, other_user.id, '01JB0CBQ8M2M4F6DWD8W8S7R3C']
+    )
+
+    assert sorted(found_user.id for found_user in users) == sorted(
+        [user.id, other_user.id]
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_try_to_create_user_with_an_email_in_use_raises_AlreadyExists(
+    repository: SqliteUserRepository, user: User, other_user: User
+) -> None:
+    await repository.create(user)
+    other_user.update_personal_data(
+        new_username=other_user.username,
+        new_email=user.email,
+        new_birth_date=other_user.birth_date,
+    )
+
+    with pytest.raises(RepositoryException.AlreadyExists) as exc_info:
+        await repository.create(other_user)
+
+    assert exc_info.value.field == 'email'
+
+
+@pytest.mark.asyncio
+async def test_update_user_only_sets_the_changed_fields(
+    repository: SqliteUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    user.update_preferences(
+        new_color_theme=ColorTheme.LIGHT, new_language=user.language
+    )
+    user.update_personal_data(
+        new_username=user.username,
+        new_email=user.email,
+        new_birth_date=date(year=1999, month=12, day=31),
+    )
+    user.deactivate()
+
+    await repository.update(user)
+
+    updated_user: User | None = await repository.get_by_id(user.id)
+
+    assert updated_user is not None
+    assert updated_user.color_theme == ColorTheme.LIGHT
+    assert updated_user.birth_date == date(year=1999, month=12, day=31)
+    assert updated_user.is_active == False
+    assert user.changed_fields == set()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_the_bounded_pool(
+    repository: SqliteUserRepository, pool: SqliteConnectionPool, user: User
+) -> None:
+    await repository.create(user)
+
+    users: list[User | None] = await asyncio.gather(
+        *(repository.get_by_id(user.id) for _ in range(20))
+    )
+
+    assert all(found_user is not None for found_user in users)
+    assert pool.open_connections <= pool.size
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_call_keeps_its_connection_until_the_thread_ends(
+    tmp_path: Path,
+) -> None:
+    pool: SqliteConnectionPool = SqliteConnectionPool(str(tmp_path / 'busy.db'), 1)
+    release: threading.Event = threading.Event()
+    started: threading.Event = threading.Event()
+
+    def block(connection: sqlite3.Connection) -> None:
+        started.set()
+        release.wait()
+
+    blocked: asyncio.Task[None] = asyncio.create_task(pool.run(block))
+    await asyncio.to_thread(started.wait)
+    blocked.cancel()
+
+    waiting: asyncio.Task[int] = asyncio.create_task(
+        pool.run(lambda connection: connection.execute('SELECT 1').fetchone()[0])
+    )
+    await asyncio.sleep(0.05)
+
+    assert not waiting.done()
+
+    release.set()
+
+    assert await waiting == 1
+    assert blocked.cancelled()
+
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_list_users_paginates_by_id_with_filters(
+    repository: SqliteUserRepository, user: User, other_user: User
+) -> None:
+    await repository.create(user)
+    await repository.create(other_user)
+
+    first_page: list[User] = await repository.list_users(None, 1, UserFilters())
+    second_page: list[User] = await repository.list_users(
+        first_page[0].id, 1, UserFilters()
+    )
+    filtered: list[User] = await repository.list_users(
+        None, 10, UserFilters(is_active=True, color_theme=ColorTheme.LIGHT)
+    )
+
+    assert [found.id for found in first_page + second_page] == sorted(
+        [user.id, other_user.id]
+    )
+    assert [found.id for found in filtered] == [other_user.id]
+
+
+@pytest.mark.asyncio
+async def test_create_many_users_reports_duplicates(
+    repository: SqliteUserRepository, user: User
+) -> None:
+    duplicated_user: User = User(
+        id='01JB0CBQ8M2M4F6DWD8W8S7R3C',
+        username='Outro Usuário',
+        email=user.email,
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+    new_user: User = User(
+        id='01JB0C8Y3RSXK2B1N9Q6FMD3ZT',
+        username='Novo Usuário',
+        email='novo@gmail.com',
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+
+    created: list[bool] = await repository.create_many(
+        [user, duplicated_user, new_user]
+    )
+
+    assert created == [True, False, True]
+    assert await repository.get_by_id(duplicated_user.id) is None
+    assert await repository.get_by_id(new_user.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_export_users_in_id_order_without_the_hashed_password(
+    repository: SqliteUserRepository, user: User
+) -> None:
+    first_user: User = User(
+        id='01J0000000000000000000000A',
+        username='Primeiro Usuário',
+        email='primeiro@gmail.com',
+        hashed_password='senha_criptografada',
+        birth_date=date(year=1999, month=1, day=1),
+        color_theme=ColorTheme.LIGHT,
+        language=Language.EN_US,
+    )
+    await repository.create(user)
+    await repository.create(first_user)
+
+    exported: list[ExportedUser] = [
+        exported_user async for exported_user in repository.export(batch_size=1)
+    ]
+
+    assert [exported_user.id for exported_user in exported] == [
+        first_user.id,
+        user.id,
+    ]
+    assert exported[1].email == user.email
+    assert exported[1].birth_date == user.birth_date
+    assert exported[1].language == user.language
+    assert not hasattr(exported[1], 'hashed_password')
+
+
+@pytest.mark.asyncio
+async def test_update_user_with_a_stale_version_raises_Conflict(
+    repository: SqliteUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    stale_user: User | None = await repository.get_by_id(user.id)
+    assert stale_user is not None
+
+    user.update_preferences(
+        new_color_theme=ColorTheme.LIGHT, new_language=user.language
+    )
+    await repository.update(user)
+
+    assert user.version == 1
+
+    stale_user.update_preferences(
+        new_color_theme=stale_user.color_theme, new_language=Language.EN_US
+    )
+
+    with pytest.raises(RepositoryException.Conflict):
+        await repository.update(stale_user)
+
+    stored_user: User | None = await repository.get_by_id(user.id)
+
+    assert stored_user is not None
+    assert stored_user.version == 1
+    assert stored_user.color_theme == ColorTheme.LIGHT
+    assert stored_user.language == user.language
+
+
+@pytest.mark.asyncio
+async def test_create_schema_adds_the_version_column_to_an_existing_table(
+    tmp_path: Path, user: User
+) -> None:
+    pool: SqliteConnectionPool = SqliteConnectionPool(str(tmp_path / 'old.db'), 1)
+    await pool.run(
+        lambda connection: connection.executescript(
+            SCHEMA.replace(',\n    version INTEGER NOT NULL DEFAULT 0', '')
+        )
+    )
+
+    await SqliteUserRepository.create_schema(pool)
+    repository: SqliteUserRepository = SqliteUserRepository(pool)
+    await repository.create(user)
+
+    stored_user: User | None = await repository.get_by_id(user.id)
+
+    pool.close()
+
+    assert stored_user is not None
+    assert stored_user.version == 0
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_keeps_them_reachable(
+    repository: SqliteUserRepository, user: User, other_user: User
+) -> None:
+    await repository.create(user)
+    await repository.create(other_user)
+
+    user.deactivate()
+    await repository.update(user)
+
+    archived: int = await repository.archive_deactivated(
+        datetime.now(timezone.utc) + timedelta(seconds=1), 10
+    )
+
+    assert archived == 1
+    assert [
+        listed_user.id
+        for listed_user in await repository.list_users(None, 10, UserFilters())
+    ] == [other_user.id]
+
+    archived_user: User | None = await repository.get_by_email(user.email)
+
+    assert archived_user is not None
+    assert archived_user.id == user.id
+    assert archived_user.is_active == False
+    assert archived_user.deactivated_at == user.deactivated_at
+    assert [
+        stored_user.id
+        for stored_user in await repository.get_by_ids([user.id, other_user.id])
+    ] == [other_user.id, user.id]
+
+    with pytest.raises(RepositoryException.AlreadyExists) as exc_info:
+        other_user.update_personal_data(
+            new_username=other_user.username,
+            new_email=user.email,
+            new_birth_date=other_user.birth_date,
+        )
+        await repository.update(other_user)
+
+    assert exc_info.value.field == 'email'
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_skips_recently_deactivated_ones(
+    repository: SqliteUserRepository, user: User
+) -> None:
+    await repository.create(user)
+
+    user.deactivate()
+    await repository.update(user)
+
+    archived: int = await repository.archive_deactivated(
+        datetime.now(timezone.utc) - timedelta(days=1), 10
+    )
+
+    assert archived == 0
+    assert len(await repository.list_users(None, 10, UserFilters())) == 1
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_includes_users_deactivated_without_a_date(
+    repository: SqliteUserRepository, user: User, other_user: User
+) -> None:
+    legacy_user: User = User(
+        id='01JB0D2M4QW7Y9R3T5V8X1Z6KA',
+        username='Usuário Antigo',
+        email='antigo@gmail.com',
+        hashed_password='senha_criptografada_3',
+        birth_date=date(year=1970, month=1, day=1),
+        is_active=False,
+        color_theme=ColorTheme.DARK,
+        language=Language.PT_BR,
+    )
+    await repository.create_many([user, other_user, legacy_user])
+
+    user.deactivate()
+    await repository.update(user)
+
+    archived: int = await repository.archive_deactivated(
+        datetime.now(timezone.utc) - timedelta(days=1), 10
+    )
+
+    assert archived == 1
+    assert [
+        listed_user.id
+        for listed_user in await repository.list_users(None, 10, UserFilters())
+    ] == [user.id, other_user.id]
+
+
+@pytest.mark.asyncio
+async def test_export_users_includes_the_archive_when_asked(
+    repository: SqliteUserRepository, user: User, other_user: User
+) -> None:
+    await repository.create_many([user, other_user])
+
+    user.deactivate()
+    await repository.update(user)
+    await repository.archive_deactivated(
+        datetime.now(timezone.utc) + timedelta(seconds=1), 10
+    )
+
+    hot: list[ExportedUser] = [
+        exported_user async for exported_user in repository.export(batch_size=1)
+    ]
+    everyone: list[ExportedUser] = [
+        exported_user
+        async for exported_user in repository.export(
+            batch_size=1, include_archived=True
+        )
+    ]
+
+    assert [exported_user.id for exported_user in hot] == [other_user.id]
+    assert sorted(exported_user.id for exported_user in everyone) == [
+        user.id,
+        other_user.id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_count_signups_per_id_range(
+    repository: SqliteUserRepository, user: User, other_user: User
+) -> None:
+    await repository.create_many([user, other_user])
+
+    user.deactivate()
+    await repository.update(user)
+    await repository.archive_deactivated(
+        datetime.now(timezone.utc) + timedelta(seconds=1), 10
+    )
+
+    counts: list[int] = await repository.count_signups(
+        [
+            datetime(2024, 10, 24, 17, tzinfo=timezone.utc),
+            datetime(2024, 10, 24, 18, tzinfo=timezone.utc),
+            datetime(2024, 10, 24, 23, tzinfo=timezone.utc),
+            datetime(2024, 10, 25, tzinfo=timezone.utc),
+        ]
+    )
+
+    assert counts == [1, 0, 1]
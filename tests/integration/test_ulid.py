@@ -1,5 +1,6 @@
 import base64
 from collections.abc import Callable
+from datetime import datetime, timezone
 
 import pytest
 
@@ -70,3 +71,16 @@ def test_when_try_to_create_ulid_from_bytes_without_16_bytes_raises_ValueError()
 def test_when_try_to_create_ulid_from_dict_raises_TypeError() -> None:
     with pytest.raises(TypeError):
         Ulid({})  # type: ignore
+
+
+def test_ulid_lower_bound_keeps_only_the_timestamp() -> None:
+    ulid: Ulid = Ulid('01JAZR9WGHX847Q382GV068JRS')
+
+    lower_bound: Ulid = Ulid.lower_bound(
+        datetime(2024, 10, 24, 17, 13, 33, 969000, tzinfo=timezone.utc)
+    )
+
+    assert bytes(lower_bound)[:6] == bytes(ulid)[:6]
+    assert bytes(lower_bound)[6:] == bytes(10)
+    assert bytes(lower_bound) <= bytes(ulid)
+    assert str(lower_bound) <= str(ulid)
@@ -1,11 +1,15 @@
 from datetime import date, datetime
 from typing import Any
 
+import bson
 import pytest
+from pymongo import ASCENDING
 
 from adapters.id import Ulid
 from adapters.models import UserModel
+from adapters.models.base import MongoIndex
 from domain.entities import User
+from domain.value_objects import ColorTheme, Language
 
 
 @pytest.fixture
@@ -74,3 +78,40 @@ def test_map_UserModel_from_document_to_User_success(user_document: dict[str, An
     assert user_entity.is_active == user_document.get('is_active')
     assert user_entity.language == user_document.get('language')
     assert user_entity.username == user_document.get('username')
+
+
+def test_UserModel_declares_a_unique_index_on_email():
+    email_indexes: list[MongoIndex] = [
+        index for index in UserModel.indexes if index.keys == (('email', ASCENDING),)
+    ]
+
+    assert len(email_indexes) == 1
+    assert email_indexes[0].unique == True
+
+
+def test_partial_document_from_User_only_contains_the_given_fields(user: User):
+    document: dict[str, Any] = UserModel.partial_document_from_entity(
+        user, {'birth_date', 'color_theme'}
+    )
+
+    assert document == {
+        'birth_date': datetime(
+            year=user.birth_date.year,
+            month=user.birth_date.month,
+            day=user.birth_date.day,
+        ),
+        'color_theme': user.color_theme,
+    }
+
+
+def test_map_document_to_User_with_the_fast_path_matches_the_validated_path(
+    user_document: dict[str, Any],
+):
+    stored_document: dict[str, Any] = bson.decode(bson.encode(user_document))
+
+    validated_user: User = UserModel.from_document(stored_document).to_entity()
+    fast_user: User = UserModel.entity_from_document(stored_document)
+
+    assert fast_user.__dict__ == validated_user.__dict__
+    assert isinstance(fast_user.color_theme, ColorTheme)
+    assert isinstance(fast_user.language, Language)
@@ -8,7 +8,7 @@ from domain.entities import User
 from domain.value_objects import ColorTheme, Language
 from ports.id import IIdManager
 from ports.repositories.user import IUserRepository
-from ports.security import IPasswordManager
+from ports.security import IAsyncPasswordManager
 
 
 @pytest.fixture
@@ -43,7 +43,7 @@ def user_repository() -> Mock:
 
 @pytest.fixture
 def password_manager() -> Mock:
-    return create_autospec(IPasswordManager)
+    return create_autospec(IAsyncPasswordManager)
 
 
 @pytest.fixture
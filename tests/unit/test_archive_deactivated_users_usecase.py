@@ -0,0 +1,92 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+
+from ports.repositories.lease import ILeaseRepository
+from usecases.user import ArchiveDeactivatedUsersUsecase
+
+
+@pytest.fixture
+def lease_repository() -> Mock:
+    repository: Mock = create_autospec(ILeaseRepository)
+    repository.acquire = AsyncMock(return_value=True)
+
+    return repository
+
+
+@pytest.fixture
+def usecase(
+    user_repository: Mock, lease_repository: Mock
+) -> ArchiveDeactivatedUsersUsecase:
+    return ArchiveDeactivatedUsersUsecase(user_repository, lease_repository)
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_in_batches_until_one_is_not_full(
+    usecase: ArchiveDeactivatedUsersUsecase,
+    user_repository: Mock,
+    lease_repository: Mock,
+) -> None:
+    user_repository.archive_deactivated.side_effect = [2, 2, 1]
+
+    before: datetime = datetime.now(UTC) - timedelta(days=30)
+    archived: int = await usecase.execute(timedelta(days=30), 2, 0, timedelta(hours=2))
+    after: datetime = datetime.now(UTC) - timedelta(days=30)
+
+    assert archived == 5
+    assert user_repository.archive_deactivated.call_count == 3
+
+    deactivated_before: datetime = user_repository.archive_deactivated.call_args[0][0]
+
+    assert before <= deactivated_before <= after
+    assert user_repository.archive_deactivated.call_args[0][1] == 2
+    assert lease_repository.acquire.call_count == 3
+    lease_repository.acquire.assert_called_with(
+        ArchiveDeactivatedUsersUsecase.lease_name, timedelta(hours=2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_stops_when_there_is_nothing_to_archive(
+    usecase: ArchiveDeactivatedUsersUsecase, user_repository: Mock
+) -> None:
+    user_repository.archive_deactivated.return_value = 0
+
+    archived: int = await usecase.execute(
+        timedelta(days=30), 100, 0, timedelta(hours=2)
+    )
+
+    assert archived == 0
+    user_repository.archive_deactivated.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_is_skipped_when_another_worker_holds_the_lease(
+    usecase: ArchiveDeactivatedUsersUsecase,
+    user_repository: Mock,
+    lease_repository: Mock,
+) -> None:
+    lease_repository.acquire = AsyncMock(return_value=False)
+
+    archived: int = await usecase.execute(
+        timedelta(days=30), 100, 0, timedelta(hours=2)
+    )
+
+    assert archived == 0
+    user_repository.archive_deactivated.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_archive_deactivated_users_stops_when_the_lease_is_lost(
+    usecase: ArchiveDeactivatedUsersUsecase,
+    user_repository: Mock,
+    lease_repository: Mock,
+) -> None:
+    user_repository.archive_deactivated.return_value = 2
+    lease_repository.acquire = AsyncMock(side_effect=[True, True, False])
+
+    archived: int = await usecase.execute(timedelta(days=30), 2, 0, timedelta(hours=2))
+
+    assert archived == 4
+    assert user_repository.archive_deactivated.call_count == 2
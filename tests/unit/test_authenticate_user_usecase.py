@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -28,7 +29,8 @@ async def test_authenticate_user_success(
     original_user: User = user_list[0]
     user_repository.get_by_email = AsyncMock(return_value=original_user)
 
-    password_manager.verify = Mock(return_value=True)
+    password_manager.verify = AsyncMock(return_value=True)
+    password_manager.needs_rehash = Mock(return_value=False)
 
     authenticated_user: User = await usecase.execute(dto)
 
@@ -46,6 +48,40 @@ async def test_authenticate_user_success(
     password_manager.verify.assert_called_once_with(
         dto.password, original_user.hashed_password
     )
+    password_manager.needs_rehash.assert_called_once_with(original_user.hashed_password)
+    password_manager.hash.assert_not_called()
+    user_repository.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_when_authenticate_user_with_outdated_hash_rehashes_the_password(
+    usecase: AuthenticateUserUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    user_list: list[User],
+) -> None:
+    dto: LoginDto = LoginDto(
+        email='adriano@locaweb.com',
+        password='Windows#123',
+    )
+
+    original_user: User = user_list[0]
+    original_hashed_password: str = original_user.hashed_password
+    user_repository.get_by_email = AsyncMock(return_value=original_user)
+
+    password_manager.verify = AsyncMock(return_value=True)
+    password_manager.needs_rehash = Mock(return_value=True)
+    password_manager.hash = AsyncMock(return_value='rehashed_password')
+
+    authenticated_user: User = await usecase.execute(dto)
+
+    await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+
+    assert authenticated_user.hashed_password == password_manager.hash.return_value
+
+    password_manager.needs_rehash.assert_called_once_with(original_hashed_password)
+    password_manager.hash.assert_called_once_with(dto.password)
+    user_repository.update.assert_called_once_with(authenticated_user)
 
 
 @pytest.mark.asyncio
@@ -80,7 +116,7 @@ async def test_when_try_to_authenticate_user_with_invalid_password_raises_Invali
 
     original_user: User = user_list[0]
     user_repository.get_by_email = AsyncMock(return_value=original_user)
-    password_manager.verify = Mock(return_value=False)
+    password_manager.verify = AsyncMock(return_value=False)
 
     with pytest.raises(AuthException.InvalidCredentials):
         await usecase.execute(dto)
@@ -6,6 +6,7 @@ import pytest
 
 from domain.entities import User
 from domain.value_objects import ColorTheme, Language
+from ports.repositories.exceptions import RepositoryException
 from usecases.dto.user import CreateUserDto
 from usecases.exceptions import UserException
 from usecases.user import CreateUserUsecase
@@ -34,10 +35,8 @@ async def test_create_user_success(
         language=Language.PT_PT,
     )
 
-    user_repository.get_by_email = AsyncMock(return_value=None)
-
     hashed_password: str = 'new_password'
-    password_manager.hash = Mock(return_value=hashed_password)
+    password_manager.hash = AsyncMock(return_value=hashed_password)
 
     new_id: str = 'newid'
     id_manager.generate = Mock(return_value=new_id)
@@ -54,7 +53,7 @@ async def test_create_user_success(
     assert created_user.id == new_id
     assert isinstance(created_user.created_at, datetime)
 
-    user_repository.get_by_email.assert_called_once_with(dto.email)
+    user_repository.get_by_email.assert_not_called()
     user_repository.create.assert_called_once_with(created_user)
     password_manager.hash.assert_called_once_with(dto.password)
     id_manager.generate.assert_called_once()
@@ -62,7 +61,7 @@ async def test_create_user_success(
 
 @pytest.mark.asyncio
 async def test_when_try_to_create_user_that_already_exists_raises_UserAlreadyExists(
-    usecase: CreateUserUsecase, user_repository: Mock, user_list: list[User]
+    usecase: CreateUserUsecase, user_repository: Mock, password_manager: Mock
 ) -> None:
     dto: CreateUserDto = CreateUserDto(
         birth_date=date(year=1989, month=6, day=27),
@@ -73,12 +72,17 @@ async def test_when_try_to_create_user_that_already_exists_raises_UserAlreadyExi
         language=Language.EN_US,
     )
 
+    password_manager.hash = AsyncMock(return_value='new_password')
+
     with pytest.raises(UserException.UserAlreadyExists):
-        user_repository.get_by_email = AsyncMock(return_value=user_list[0])
+        user_repository.create = AsyncMock(
+            side_effect=RepositoryException.AlreadyExists('email')
+        )
 
         await usecase.execute(dto)
 
-    user_repository.get_by_email.assert_called_once_with(dto.email)
+    user_repository.get_by_email.assert_not_called()
+    user_repository.create.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -96,9 +100,7 @@ async def test_when_try_to_create_a_underage_user_raises_UserIsUnderAge(
         language=Language.EN_US,
     )
 
-    user_repository.get_by_email = AsyncMock(return_value=None)
-
     with pytest.raises(UserException.UserIsUnderage):
         await usecase.execute(dto)
 
-    user_repository.get_by_email.assert_called_once_with(dto.email)
+    user_repository.create.assert_not_called()
@@ -28,5 +28,7 @@ async def test_deactivate_user_success(
     assert deactivated_user.language == original_user.language
     assert deactivated_user.id == original_user.id
     assert deactivated_user.created_at == original_user.created_at
+    assert deactivated_user.deactivated_at is not None
+    assert deactivated_user.changed_fields == {'is_active', 'deactivated_at'}
 
     user_repository.update.assert_called_once_with(deactivated_user)
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from usecases.dto.user import SignupBucketDto, SignupTimelineDto
+from usecases.user import GetSignupTimelineUsecase
+from usecases.user.get_signup_timeline_usecase import count_buckets
+
+
+@pytest.mark.asyncio
+async def test_get_signup_timeline_by_day_aligns_the_buckets(
+    user_repository: Mock,
+) -> None:
+    user_repository.count_signups.return_value = [3, 0, 5]
+
+    buckets: list[SignupBucketDto] = await GetSignupTimelineUsecase(
+        user_repository
+    ).execute(
+        SignupTimelineDto(
+            granularity='day',
+            since=datetime(2024, 10, 26, 15, 30, tzinfo=timezone.utc),
+            until=datetime(2024, 10, 28, 9, tzinfo=timezone.utc),
+        )
+    )
+
+    boundaries: list[datetime] = [
+        datetime(2024, 10, 26, tzinfo=timezone.utc) + timedelta(days=day)
+        for day in range(4)
+    ]
+    user_repository.count_signups.assert_called_once_with(boundaries)
+    assert buckets == [
+        SignupBucketDto(start=boundaries[0], count=3),
+        SignupBucketDto(start=boundaries[1], count=0),
+        SignupBucketDto(start=boundaries[2], count=5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_signup_timeline_by_week_starts_on_monday(
+    user_repository: Mock,
+) -> None:
+    user_repository.count_signups.return_value = [7]
+
+    buckets: list[SignupBucketDto] = await GetSignupTimelineUsecase(
+        user_repository
+    ).execute(
+        SignupTimelineDto(
+            granularity='week',
+            since=datetime(2024, 10, 24, 12, tzinfo=timezone.utc),
+            until=datetime(2024, 10, 25, tzinfo=timezone.utc),
+        )
+    )
+
+    user_repository.count_signups.assert_called_once_with(
+        [
+            datetime(2024, 10, 21, tzinfo=timezone.utc),
+            datetime(2024, 10, 28, tzinfo=timezone.utc),
+        ]
+    )
+    assert buckets == [
+        SignupBucketDto(start=datetime(2024, 10, 21, tzinfo=timezone.utc), count=7)
+    ]
+
+
+def test_count_buckets_counts_from_the_aligned_start() -> None:
+    since: datetime = datetime(2024, 10, 26, 15, 30, tzinfo=timezone.utc)
+
+    assert count_buckets('hour', since, since + timedelta(hours=1000)) == 1001
+    assert (
+        count_buckets('day', since, datetime(2024, 10, 28, 9, tzinfo=timezone.utc)) == 3
+    )
+    assert count_buckets('day', since, since + timedelta(minutes=1)) == 1
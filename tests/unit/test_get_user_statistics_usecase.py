@@ -0,0 +1,42 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from ports.statistics import IUserStatistics, UserStatistics
+from usecases.exceptions import StatisticsException
+from usecases.user import GetUserStatisticsUsecase
+
+
+@pytest.fixture
+def statistics() -> Mock:
+    return create_autospec(IUserStatistics, instance=True)
+
+
+@pytest.mark.asyncio
+async def test_get_user_statistics_success(statistics: Mock) -> None:
+    user_statistics: UserStatistics = UserStatistics(
+        snapshot_at=datetime.now(UTC),
+        total_users=0,
+        active_users=0,
+        users_by_language={},
+        users_by_color_theme={},
+        users_by_age_range={},
+        signups_by_day={},
+    )
+    statistics.compute = Mock(return_value=user_statistics)
+
+    result: UserStatistics = await GetUserStatisticsUsecase(statistics).execute(7)
+
+    assert result is user_statistics
+    statistics.compute.assert_called_once_with(datetime.now(UTC).date(), 7)
+
+
+@pytest.mark.asyncio
+async def test_when_the_snapshot_is_not_ready_raises_SnapshotNotReady(
+    statistics: Mock,
+) -> None:
+    statistics.compute = Mock(return_value=None)
+
+    with pytest.raises(StatisticsException.SnapshotNotReady):
+        await GetUserStatisticsUsecase(statistics).execute(7)
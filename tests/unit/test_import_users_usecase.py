@@ -0,0 +1,174 @@
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from ports.security.exceptions import PasswordManagerException
+from usecases.dto.user import CreateUserDto
+from usecases.exceptions import UserException
+from usecases.user import ImportUsersUsecase
+
+
+@pytest.fixture
+def usecase(
+    user_repository: Mock, password_manager: Mock, id_manager: Mock
+) -> ImportUsersUsecase:
+    return ImportUsersUsecase(user_repository, password_manager, id_manager)
+
+
+def create_user_dto(email: str, birth_date: date) -> CreateUserDto:
+    return CreateUserDto(
+        birth_date=birth_date,
+        email=email,
+        password='Windows#123',
+        username='Adriano Lombardi',
+        color_theme=ColorTheme.DARK,
+        language=Language.PT_PT,
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_users_reports_a_result_per_user(
+    usecase: ImportUsersUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    id_manager: Mock,
+) -> None:
+    dtos: list[CreateUserDto] = [
+        create_user_dto('adriano@locaweb.com', date(year=1989, month=6, day=27)),
+        create_user_dto('crianca@locaweb.com', date.today()),
+        create_user_dto('repetido@locaweb.com', date(year=1990, month=1, day=1)),
+    ]
+
+    password_manager.hash = AsyncMock(return_value='hashed_password')
+    id_manager.generate = Mock(side_effect=['id1', 'id2'])
+    user_repository.create_many = AsyncMock(return_value=[True, False])
+
+    results = await usecase.execute(dtos, 2, 5)
+
+    assert isinstance(results[0], User)
+    assert results[0].id == 'id1'
+    assert results[0].hashed_password == 'hashed_password'
+    assert isinstance(results[1], UserException.UserIsUnderage)
+    assert isinstance(results[2], UserException.UserAlreadyExists)
+
+    assert password_manager.hash.call_count == 2
+    user_repository.create_many.assert_called_once()
+    assert [user.email for user in user_repository.create_many.call_args.args[0]] == [
+        'adriano@locaweb.com',
+        'repetido@locaweb.com',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_users_retries_hashing_when_the_password_manager_is_overloaded(
+    usecase: ImportUsersUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    id_manager: Mock,
+) -> None:
+    password_manager.hash = AsyncMock(
+        side_effect=[PasswordManagerException.Overloaded(0), 'hashed_password']
+    )
+    id_manager.generate = Mock(return_value='id1')
+    user_repository.create_many = AsyncMock(return_value=[True])
+
+    results = await usecase.execute(
+        [create_user_dto('adriano@locaweb.com', date(year=1989, month=6, day=27))],
+        2,
+        5,
+    )
+
+    assert isinstance(results[0], User)
+    assert results[0].hashed_password == 'hashed_password'
+    assert password_manager.hash.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_import_users_gives_up_on_a_user_after_the_max_hash_attempts(
+    usecase: ImportUsersUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    id_manager: Mock,
+) -> None:
+    password_manager.hash = AsyncMock(
+        side_effect=PasswordManagerException.Overloaded(0)
+    )
+    user_repository.create_many = AsyncMock(return_value=[])
+
+    results = await usecase.execute(
+        [create_user_dto('adriano@locaweb.com', date(year=1989, month=6, day=27))],
+        2,
+        3,
+    )
+
+    assert isinstance(results[0], UserException.PasswordHashingOverloaded)
+    assert password_manager.hash.call_count == 3
+    user_repository.create_many.assert_called_once_with([])
+
+
+@pytest.mark.asyncio
+async def test_import_users_bounds_the_concurrent_hashes(
+    usecase: ImportUsersUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    id_manager: Mock,
+) -> None:
+    running: int = 0
+    peak: int = 0
+
+    async def hash(_: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+        return 'hashed_password'
+
+    password_manager.hash = hash
+    id_manager.generate = Mock(side_effect=[f'id{index}' for index in range(8)])
+    user_repository.create_many = AsyncMock(return_value=[True] * 8)
+
+    await usecase.execute(
+        [
+            create_user_dto(
+                f'user{index}@locaweb.com', date(year=1989, month=6, day=27)
+            )
+            for index in range(8)
+        ],
+        2,
+        5,
+    )
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_import_users_reports_a_hashing_failure_on_its_line_only(
+    usecase: ImportUsersUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    id_manager: Mock,
+) -> None:
+    password_manager.hash = AsyncMock(
+        side_effect=[ConnectionRefusedError(), 'hashed_password']
+    )
+    id_manager.generate = Mock(return_value='id1')
+    user_repository.create_many = AsyncMock(return_value=[True])
+
+    results = await usecase.execute(
+        [
+            create_user_dto('adriano@locaweb.com', date(year=1989, month=6, day=27)),
+            create_user_dto('leandro@locaweb.com', date(year=1990, month=1, day=1)),
+        ],
+        1,
+        5,
+    )
+
+    assert isinstance(results[0], UserException.PasswordHashingFailed)
+    assert isinstance(results[1], User)
+    assert results[1].email == 'leandro@locaweb.com'
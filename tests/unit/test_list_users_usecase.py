@@ -0,0 +1,45 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from domain.entities import User
+from domain.value_objects import Language
+from ports.repositories.user import UserFilters
+from usecases.dto.user import ListUsersDto, UserPageDto
+from usecases.user import ListUsersUsecase
+
+
+@pytest.fixture
+def usecase(user_repository: Mock) -> ListUsersUsecase:
+    return ListUsersUsecase(user_repository)
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_more_pages_returns_the_next_after_id(
+    usecase: ListUsersUsecase, user_repository: Mock, user_list: list[User]
+) -> None:
+    user_repository.list_users = AsyncMock(return_value=user_list)
+    dto: ListUsersDto = ListUsersDto(
+        after_id='id0', limit=1, is_active=True, language=Language.EN_UK
+    )
+
+    page: UserPageDto = await usecase.execute(dto)
+
+    assert page.users == user_list[:1]
+    assert page.next_after_id == user_list[0].id
+
+    user_repository.list_users.assert_called_once_with(
+        'id0', 2, UserFilters(is_active=True, language=Language.EN_UK)
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_users_last_page_has_no_next_after_id(
+    usecase: ListUsersUsecase, user_repository: Mock, user_list: list[User]
+) -> None:
+    user_repository.list_users = AsyncMock(return_value=user_list)
+
+    page: UserPageDto = await usecase.execute(ListUsersDto(after_id=None, limit=2))
+
+    assert page.users == user_list
+    assert page.next_after_id is None
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+
+from ports.repositories.lease import ILeaseRepository
+from ports.repositories.snapshot import ISnapshotRepository, StoredSnapshot
+from ports.statistics import IUserStatistics
+from usecases.user import RefreshUserStatisticsUsecase
+
+
+@pytest.fixture
+def statistics() -> Mock:
+    statistics: Mock = create_autospec(IUserStatistics, instance=True)
+    statistics.dump = Mock(return_value=b'snapshot')
+
+    return statistics
+
+
+@pytest.fixture
+def lease_repository() -> Mock:
+    repository: Mock = create_autospec(ILeaseRepository, instance=True)
+    repository.acquire = AsyncMock(return_value=True)
+
+    return repository
+
+
+@pytest.fixture
+def snapshot_repository() -> Mock:
+    repository: Mock = create_autospec(ISnapshotRepository, instance=True)
+    repository.get = AsyncMock(return_value=None)
+
+    return repository
+
+
+@pytest.fixture
+def usecase(
+    user_repository: Mock,
+    statistics: Mock,
+    lease_repository: Mock,
+    snapshot_repository: Mock,
+) -> RefreshUserStatisticsUsecase:
+    return RefreshUserStatisticsUsecase(
+        user_repository, statistics, lease_repository, snapshot_repository
+    )
+
+
+@pytest.mark.asyncio
+async def test_the_lease_holder_refreshes_from_every_user_and_shares_the_snapshot(
+    usecase: RefreshUserStatisticsUsecase,
+    user_repository: Mock,
+    statistics: Mock,
+    snapshot_repository: Mock,
+) -> None:
+    await usecase.execute(100, timedelta(minutes=10))
+
+    user_repository.export.assert_called_once_with(100, include_archived=True)
+    statistics.refresh.assert_called_once()
+    snapshot_repository.save.assert_called_once()
+    assert snapshot_repository.save.call_args.args[1].data == b'snapshot'
+
+
+@pytest.mark.asyncio
+async def test_without_the_lease_the_shared_snapshot_is_loaded_once(
+    usecase: RefreshUserStatisticsUsecase,
+    statistics: Mock,
+    lease_repository: Mock,
+    snapshot_repository: Mock,
+) -> None:
+    snapshot_repository.get = AsyncMock(
+        return_value=StoredSnapshot(
+            taken_at=datetime.now(timezone.utc) - timedelta(hours=1), data=b'shared'
+        )
+    )
+    lease_repository.acquire = AsyncMock(return_value=False)
+
+    await usecase.execute(100, timedelta(minutes=10))
+    await usecase.execute(100, timedelta(minutes=10))
+
+    statistics.refresh.assert_not_called()
+    statistics.load.assert_called_once_with(b'shared')
+
+
+@pytest.mark.asyncio
+async def test_a_fresh_shared_snapshot_is_loaded_without_taking_the_lease(
+    usecase: RefreshUserStatisticsUsecase,
+    statistics: Mock,
+    lease_repository: Mock,
+    snapshot_repository: Mock,
+) -> None:
+    snapshot_repository.get = AsyncMock(
+        return_value=StoredSnapshot(taken_at=datetime.now(timezone.utc), data=b'fresh')
+    )
+
+    await usecase.execute(100, timedelta(minutes=10))
+
+    lease_repository.acquire.assert_not_called()
+    statistics.refresh.assert_not_called()
+    statistics.load.assert_called_once_with(b'fresh')
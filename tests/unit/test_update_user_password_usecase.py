@@ -1,9 +1,10 @@
 from copy import deepcopy
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from domain.entities import User
+from ports.repositories.exceptions import RepositoryException
 from usecases.dto.user import UpdateUserPasswordDto
 from usecases.exceptions import UserException
 from usecases.user import UpdateUserPasswordUsecase
@@ -29,8 +30,8 @@ async def test_update_user_password_success(
         confirm_new_password='new_password',
     )
 
-    password_manager.verify = Mock(return_value=True)
-    password_manager.hash = Mock(return_value='nova_senha_criptografada')
+    password_manager.verify = AsyncMock(return_value=True)
+    password_manager.hash = AsyncMock(return_value='nova_senha_criptografada')
 
     updated_user: User = await usecase.execute(original_user, dto)
 
@@ -65,7 +66,7 @@ async def test_when_try_to_update_user_password_with_old_password_that_does_not_
         confirm_new_password='new_password',
     )
 
-    password_manager.verify = Mock(return_value=False)
+    password_manager.verify = AsyncMock(return_value=False)
 
     with pytest.raises(UserException.OldPasswordDoesntMatch):
         await usecase.execute(original_user, dto)
@@ -85,7 +86,7 @@ async def test_when_try_to_update_user_password_with_confirm_new_password_that_d
         confirm_new_password='new_password2',
     )
 
-    password_manager.verify = Mock(return_value=True)
+    password_manager.verify = AsyncMock(return_value=True)
 
     with pytest.raises(UserException.NewPasswordConfirmationMismatch):
         await usecase.execute(original_user, dto)
@@ -105,7 +106,66 @@ async def test_when_try_to_update_user_password_with_new_password_being_same_as_
         confirm_new_password='hashedpassword',
     )
 
-    password_manager.verify = Mock(return_value=True)
+    password_manager.verify = AsyncMock(return_value=True)
 
     with pytest.raises(UserException.NewPasswordCantBeSameAsOld):
         await usecase.execute(original_user, dto)
+
+
+@pytest.mark.asyncio
+async def test_update_user_password_verifies_the_old_password_again_after_a_rehash(
+    usecase: UpdateUserPasswordUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    user_list: list[User],
+) -> None:
+    stale_user: User = deepcopy(user_list[0])
+    rehashed_user: User = deepcopy(stale_user)
+    rehashed_user.update_password('senha_recriptografada')
+    dto: UpdateUserPasswordDto = UpdateUserPasswordDto(
+        old_password='hashedpassword',
+        new_password='new_password',
+        confirm_new_password='new_password',
+    )
+
+    password_manager.verify = AsyncMock(return_value=True)
+    password_manager.hash = AsyncMock(return_value='nova_senha_criptografada')
+    user_repository.update = AsyncMock(
+        side_effect=[RepositoryException.Conflict(stale_user.id), None]
+    )
+    user_repository.get_by_id = AsyncMock(return_value=rehashed_user)
+
+    updated_user: User = await usecase.execute(stale_user, dto)
+
+    assert updated_user is rehashed_user
+    assert updated_user.hashed_password == 'nova_senha_criptografada'
+    password_manager.verify.assert_called_with(
+        dto.old_password, 'senha_recriptografada'
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_the_password_changes_concurrently_raises_OldPasswordDoesntMatch(
+    usecase: UpdateUserPasswordUsecase,
+    user_repository: Mock,
+    password_manager: Mock,
+    user_list: list[User],
+) -> None:
+    stale_user: User = deepcopy(user_list[0])
+    changed_user: User = deepcopy(stale_user)
+    changed_user.update_password('outra_senha_criptografada')
+    dto: UpdateUserPasswordDto = UpdateUserPasswordDto(
+        old_password='hashedpassword',
+        new_password='new_password',
+        confirm_new_password='new_password',
+    )
+
+    password_manager.verify = AsyncMock(side_effect=[True, False])
+    password_manager.hash = AsyncMock(return_value='nova_senha_criptografada')
+    user_repository.update = AsyncMock(
+        side_effect=RepositoryException.Conflict(stale_user.id)
+    )
+    user_repository.get_by_id = AsyncMock(return_value=changed_user)
+
+    with pytest.raises(UserException.OldPasswordDoesntMatch):
+        await usecase.execute(stale_user, dto)
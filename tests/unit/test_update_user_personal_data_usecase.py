@@ -1,9 +1,10 @@
 from datetime import date
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from domain.entities import User
+from ports.repositories.exceptions import RepositoryException
 from usecases.dto.user import UpdateUserPersonalDataDto
 from usecases.exceptions import UserException
 from usecases.user import UpdateUserPersonalDataUsecase
@@ -57,3 +58,26 @@ async def test_when_try_to_update_user_personal_data_with_underage_birth_date_ra
 
     with pytest.raises(UserException.UserIsUnderage):
         await usecase.execute(original_user, dto)
+
+    user_repository.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_when_try_to_update_user_email_to_one_already_in_use_raises_UserAlreadyExists(
+    usecase: UpdateUserPersonalDataUsecase,
+    user_repository: Mock,
+    user_list: list[User],
+) -> None:
+    original_user: User = user_list[0]
+    dto: UpdateUserPersonalDataDto = UpdateUserPersonalDataDto(
+        username='Novo nome da silva',
+        email=user_list[1].email,
+        birth_date=date(year=2005, month=2, day=27),
+    )
+
+    user_repository.update = AsyncMock(
+        side_effect=RepositoryException.AlreadyExists('email')
+    )
+
+    with pytest.raises(UserException.UserAlreadyExists):
+        await usecase.execute(original_user, dto)
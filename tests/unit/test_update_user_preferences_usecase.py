@@ -1,12 +1,15 @@
-from unittest.mock import Mock
+from copy import deepcopy
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from domain.entities import User
 from domain.value_objects import ColorTheme, Language
+from ports.repositories.exceptions import RepositoryException
 from usecases.dto.user import UpdateUserPreferencesDto
 from usecases.exceptions import UserException
 from usecases.user import UpdateUserPreferencesUsecase
+from usecases.user.optimistic_update import OptimisticUpdate
 
 
 @pytest.fixture
@@ -39,3 +42,54 @@ async def test_update_user_preferences_success(
     assert updated_user.created_at == original_user.created_at
 
     user_repository.update.assert_called_once_with(updated_user)
+
+
+@pytest.mark.asyncio
+async def test_update_user_preferences_retries_on_a_version_conflict(
+    usecase: UpdateUserPreferencesUsecase,
+    user_repository: Mock,
+    user_list: list[User],
+) -> None:
+    stale_user: User = user_list[0]
+    current_user: User = deepcopy(stale_user)
+    current_user.increment_version()
+    dto: UpdateUserPreferencesDto = UpdateUserPreferencesDto(
+        color_theme=ColorTheme.DARK,
+        language=Language.PT_BR,
+    )
+
+    user_repository.update = AsyncMock(
+        side_effect=[RepositoryException.Conflict(stale_user.id), None]
+    )
+    user_repository.get_by_id = AsyncMock(return_value=current_user)
+
+    updated_user: User = await usecase.execute(stale_user, dto)
+
+    assert updated_user is current_user
+    assert updated_user.color_theme == dto.color_theme
+    assert updated_user.language == dto.language
+    assert user_repository.update.call_count == 2
+    user_repository.get_by_id.assert_called_once_with(stale_user.id)
+
+
+@pytest.mark.asyncio
+async def test_when_conflicts_persist_raises_UserUpdateConflict(
+    usecase: UpdateUserPreferencesUsecase,
+    user_repository: Mock,
+    user_list: list[User],
+) -> None:
+    user: User = user_list[0]
+    dto: UpdateUserPreferencesDto = UpdateUserPreferencesDto(
+        color_theme=ColorTheme.DARK,
+        language=Language.PT_BR,
+    )
+
+    user_repository.update = AsyncMock(
+        side_effect=RepositoryException.Conflict(user.id)
+    )
+    user_repository.get_by_id = AsyncMock(side_effect=lambda _: deepcopy(user))
+
+    with pytest.raises(UserException.UserUpdateConflict):
+        await usecase.execute(user, dto)
+
+    assert user_repository.update.call_count == OptimisticUpdate.max_attempts
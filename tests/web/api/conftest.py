@@ -8,6 +8,7 @@ from httpx import ASGITransport, AsyncClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from web.app import create_app
+from web.db import MongoIndexes
 from web.di import Di
 
 
@@ -24,6 +25,7 @@ async def app_client() -> AsyncGenerator[AsyncClient]:
 @pytest_asyncio.fixture(scope='function', loop_scope='function')
 async def mongo_database() -> AsyncGenerator[AsyncIOMotorDatabase]:
     db: AsyncIOMotorDatabase = Di.get_raw(AsyncIOMotorDatabase)
+    await MongoIndexes.ensure(db)
 
     yield db
 
@@ -0,0 +1,278 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from adapters.repositories.user import InMemoryUserRepository
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from ports.id import IIdManager
+from ports.repositories.user import IUserRepository
+from ports.statistics import IUserStatistics
+from web.di import Di
+
+ADMIN_HEADERS: dict[str, str] = {'X-Admin-Key': 'admin'}
+
+
+async def create_users(amount: int) -> list[User]:
+    id_manager: IIdManager = Di.get_raw(IIdManager)
+    repository: IUserRepository = Di.get_raw(IUserRepository)
+    users: list[User] = [
+        User(
+            id=id_manager.generate(),
+            username=f'Usuário {number}',
+            email=f'usuario{number}@gmail.com',
+            birth_date=date(year=1990, month=1, day=1),
+            hashed_password='senha_criptografada',
+            color_theme=ColorTheme.DARK if number % 2 else ColorTheme.LIGHT,
+            language=Language.PT_BR,
+        )
+        for number in range(amount)
+    ]
+
+    for user in sorted(users, key=lambda user: user.id):
+        await repository.create(user)
+
+    return sorted(users, key=lambda user: user.id)
+
+
+@pytest.mark.asyncio
+async def test_list_users_paginates_with_cursor_OK(
+    app_client: AsyncClient, mongo_database: AsyncIOMotorDatabase
+) -> None:
+    users: list[User] = await create_users(5)
+    seen_ids: list[str] = []
+    cursor: str | None = None
+
+    while True:
+        params: dict[str, Any] = {'limit': 2}
+        if cursor is not None:
+            params['cursor'] = cursor
+
+        response = await app_client.get(
+            '/admin/users', params=params, headers=ADMIN_HEADERS
+        )
+        response_data: dict[str, Any] = response.json()
+
+        assert response.status_code == HTTPStatus.OK
+
+        seen_ids.extend(user['id'] for user in response_data['users'])
+        cursor = response_data['next_cursor']
+
+        if cursor is None:
+            break
+
+    assert seen_ids == [user.id for user in users]
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_filters_OK(
+    app_client: AsyncClient, mongo_database: AsyncIOMotorDatabase
+) -> None:
+    users: list[User] = await create_users(4)
+
+    response = await app_client.get(
+        '/admin/users',
+        params={'color_theme': 'dark', 'language': 'pt_br', 'is_active': True},
+        headers=ADMIN_HEADERS,
+    )
+    response_data: dict[str, Any] = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert [user['id'] for user in response_data['users']] == [
+        user.id for user in users if user.color_theme == ColorTheme.DARK
+    ]
+    assert response_data['next_cursor'] is None
+
+
+@pytest.mark.asyncio
+async def test_list_users_without_admin_key_UNAUTHORIZED(
+    app_client: AsyncClient,
+) -> None:
+    response = await app_client.get('/admin/users')
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json()['name'] == 'MissingAdminKey'
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_wrong_admin_key_FORBIDDEN(
+    app_client: AsyncClient,
+) -> None:
+    response = await app_client.get('/admin/users', headers={'X-Admin-Key': 'errada'})
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json()['name'] == 'InvalidAdminKey'
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_invalid_cursor_BAD_REQUEST(
+    app_client: AsyncClient,
+) -> None:
+    response = await app_client.get(
+        '/admin/users', params={'cursor': 'invalido'}, headers=ADMIN_HEADERS
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['name'] == 'InvalidDataSent'
+
+
+@pytest.mark.asyncio
+async def test_import_users_reports_each_line_OK(
+    app_client: AsyncClient, mongo_database: AsyncIOMotorDatabase
+) -> None:
+    user_line: str = (
+        '{"username": "Adriano Lombardi", "email": "adriano@locaweb.com",'
+        ' "password": "Windows#123", "birth_date": "1989-06-27",'
+        ' "color_theme": "dark", "language": "pt_pt"}'
+    )
+    body: str = '\n'.join([user_line, 'não é json', user_line]) + '\n'
+
+    response = await app_client.post(
+        '/admin/users/import',
+        content=body.encode(),
+        headers={**ADMIN_HEADERS, 'Content-Type': 'application/x-ndjson'},
+    )
+    results: list[dict[str, Any]] = [
+        json.loads(line) for line in response.text.splitlines()
+    ]
+
+    assert response.status_code == HTTPStatus.OK
+    assert [result['status'] for result in results] == [
+        'created',
+        'invalid',
+        'failed',
+    ]
+    assert [result['line'] for result in results] == [1, 2, 3]
+    assert await mongo_database['users'].count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_export_users_streams_gzipped_ndjson_OK(
+    app_client: AsyncClient, mongo_database: AsyncIOMotorDatabase
+) -> None:
+    users: list[User] = await create_users(3)
+
+    response = await app_client.get(
+        '/admin/users/export', params={'gzip': True}, headers=ADMIN_HEADERS
+    )
+    exported: list[dict[str, Any]] = [
+        json.loads(line) for line in response.text.splitlines()
+    ]
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-encoding'] == 'gzip'
+    assert [user['id'] for user in exported] == [user.id for user in users]
+    assert all('hashed_password' not in user for user in exported)
+
+
+@pytest.mark.asyncio
+async def test_get_user_statistics_OK(app_client: AsyncClient) -> None:
+    users: list[User] = [
+        User(
+            id=Di.get_raw(IIdManager).generate(),
+            username='Usuário',
+            email='usuario@gmail.com',
+            birth_date=date(year=1990, month=1, day=1),
+            hashed_password='senha_criptografada',
+            color_theme=ColorTheme.DARK,
+            language=Language.PT_BR,
+        )
+    ]
+    repository: InMemoryUserRepository = InMemoryUserRepository()
+    await repository.create_many(users)
+    await Di.get_raw(IUserStatistics).refresh(repository.export(batch_size=10))
+
+    response = await app_client.get(
+        '/admin/users/statistics',
+        params={'signup_days': 2},
+        headers=ADMIN_HEADERS,
+    )
+    response_data: dict[str, Any] = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert response_data['total_users'] == 1
+    assert response_data['active_users'] == 1
+    assert response_data['users_by_language']['pt_br'] == 1
+    assert response_data['users_by_color_theme'] == {'light': 0, 'dark': 1}
+    assert sum(response_data['users_by_age_range'].values()) == 1
+    assert list(response_data['signups_by_day'].values()) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_signup_timeline_OK(app_client: AsyncClient) -> None:
+    users: list[User] = await create_users(3)
+
+    response = await app_client.get(
+        '/admin/users/signups',
+        params={
+            'granularity': 'hour',
+            'since': (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat(),
+        },
+        headers=ADMIN_HEADERS,
+    )
+    response_data: dict[str, Any] = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert response_data['granularity'] == 'hour'
+    assert response_data['total'] == len(users)
+    assert len(response_data['buckets']) == 3
+    assert response_data['buckets'][-1]['count'] == len(users)
+
+
+@pytest.mark.asyncio
+async def test_when_the_signup_timeline_has_too_many_buckets_returns_BAD_REQUEST(
+    app_client: AsyncClient,
+) -> None:
+    response = await app_client.get(
+        '/admin/users/signups',
+        params={
+            'granularity': 'hour',
+            'since': '2020-01-01T00:00:00Z',
+            'until': '2024-01-01T00:00:00Z',
+        },
+        headers=ADMIN_HEADERS,
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'since, until',
+    [
+        ('9999-12-31T22:30:00', '9999-12-31T23:59:00'),
+        ('1969-12-31T23:00:00', '1970-01-01T01:00:00'),
+    ],
+)
+async def test_when_the_signup_timeline_is_out_of_range_returns_BAD_REQUEST(
+    app_client: AsyncClient, since: str, until: str
+) -> None:
+    response = await app_client.get(
+        '/admin/users/signups',
+        params={'granularity': 'hour', 'since': since, 'until': until},
+        headers=ADMIN_HEADERS,
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_when_the_aligned_signup_timeline_has_too_many_buckets_returns_BAD_REQUEST(
+    app_client: AsyncClient,
+) -> None:
+    response = await app_client.get(
+        '/admin/users/signups',
+        params={
+            'granularity': 'hour',
+            'since': '2024-01-01T00:30:00Z',
+            'until': '2024-02-11T16:30:00Z',
+        },
+        headers=ADMIN_HEADERS,
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,51 @@
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+ADMIN_HEADERS: dict[str, str] = {'X-Admin-Key': 'admin'}
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_success_OK(app_client: AsyncClient) -> None:
+    response = await app_client.get('/metrics/', headers=ADMIN_HEADERS)
+    response_data: dict[str, Any] = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['server-timing'].startswith('db;dur=')
+
+    assert response_data['password_hashing'] == {
+        'max_concurrency': 4,
+        'max_queue_size': 64,
+        'queue_depth': 0,
+        'in_flight': 0,
+        'admitted_count': response_data['password_hashing']['admitted_count'],
+        'rejected_count': 0,
+    }
+    assert isinstance(response_data['password_hash_cost']['rounds'], int)
+    assert set(response_data['password_hash_cost']) == {
+        'rounds',
+        'target_ms',
+        'measurements_ms',
+    }
+    assert response_data['credential_cache'] == {
+        'enabled': False,
+        'ttl_seconds': 0,
+        'max_entries': 10_000,
+        'size': 0,
+        'hits': 0,
+        'misses': 0,
+        'hit_rate': 0,
+        'verify_seconds_saved': 0,
+    }
+    assert isinstance(response_data['mongo_commands'], list)
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_without_admin_key_UNAUTHORIZED(
+    app_client: AsyncClient,
+) -> None:
+    response = await app_client.get('/metrics/')
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
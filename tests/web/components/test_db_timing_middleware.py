@@ -0,0 +1,38 @@
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from web.utils.monitoring import DbTimingMiddleware
+
+
+async def app(_: Scope, __: Receive, send: Send) -> None:
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def request(middleware: DbTimingMiddleware) -> list[Message]:
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(
+        {'type': 'http', 'method': 'GET', 'path': '/', 'headers': []}, receive, send
+    )
+
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_the_server_timing_header_is_only_sent_when_enabled() -> None:
+    hidden: list[Message] = await request(
+        DbTimingMiddleware(app, command_warning_count=50, server_timing=False)
+    )
+    shown: list[Message] = await request(
+        DbTimingMiddleware(app, command_warning_count=50, server_timing=True)
+    )
+
+    assert hidden[0]['headers'] == []
+    assert [name for name, _ in shown[0]['headers']] == [b'server-timing']
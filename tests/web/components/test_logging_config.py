@@ -0,0 +1,30 @@
+import io
+import logging
+
+from web.config import configure_logging
+from web.config.logging_config import HANDLER_NAME
+
+
+def test_app_records_are_emitted_at_info_without_a_root_handler() -> None:
+    configure_logging('INFO')
+    configure_logging('INFO')
+
+    handlers: list[logging.Handler] = [
+        handler
+        for handler in logging.getLogger('web').handlers
+        if handler.name == HANDLER_NAME
+    ]
+    stream: io.StringIO = io.StringIO()
+
+    assert len(handlers) == 1
+
+    previous_stream = handlers[0].setStream(stream)  # type: ignore
+
+    try:
+        logging.getLogger('web.db.mongo_indexes').info('building index email_unique')
+        logging.getLogger('web.db.mongo_indexes').debug('index already exists')
+    finally:
+        handlers[0].setStream(previous_stream)  # type: ignore
+
+    assert 'INFO web.db.mongo_indexes: building index email_unique' in stream.getvalue()
+    assert 'index already exists' not in stream.getvalue()
@@ -0,0 +1,107 @@
+import logging
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pymongo.monitoring import (
+    CommandFailedEvent,
+    CommandStartedEvent,
+    CommandSucceededEvent,
+)
+
+from adapters.monitoring import LatencyHistogram, MongoCommandMonitor, QueryStats
+
+ADDRESS: tuple[str, int] = ('localhost', 27017)
+
+
+def run_command(
+    monitor: MongoCommandMonitor,
+    command: dict[str, Any],
+    duration_ms: float,
+    *,
+    request_id: int = 1,
+    failed: bool = False,
+) -> None:
+    command_name: str = next(iter(command))
+    duration: timedelta = timedelta(milliseconds=duration_ms)
+
+    monitor.started(CommandStartedEvent(command, 'test', request_id, ADDRESS, 1))
+
+    if failed:
+        monitor.failed(
+            CommandFailedEvent(duration, {}, command_name, request_id, ADDRESS, 1)
+        )
+    else:
+        monitor.succeeded(
+            CommandSucceededEvent(duration, {}, command_name, request_id, ADDRESS, 1)
+        )
+
+
+def test_latencies_are_recorded_per_command_and_collection() -> None:
+    monitor: MongoCommandMonitor = MongoCommandMonitor(slow_command_ms=100)
+
+    run_command(monitor, {'find': 'users', 'filter': {}}, 0.5, request_id=1)
+    run_command(monitor, {'find': 'users', 'filter': {}}, 30, request_id=2)
+    run_command(
+        monitor, {'getMore': 123, 'collection': 'users'}, 3, request_id=3, failed=True
+    )
+
+    find: LatencyHistogram = monitor.histograms[('find', 'users')]
+    get_more: LatencyHistogram = monitor.histograms[('getMore', 'users')]
+
+    assert find.count == 2
+    assert find.total_ms == pytest.approx(30.5)
+    assert find.max_ms == pytest.approx(30)
+    assert find.buckets['1'] == 1
+    assert find.buckets['50'] == 1
+    assert get_more.count == 1
+
+
+def test_slow_commands_are_logged_with_the_filter_shape_only(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monitor: MongoCommandMonitor = MongoCommandMonitor(slow_command_ms=10)
+    command: dict[str, Any] = {
+        'update': 'users',
+        'updates': [
+            {
+                'q': {'_id': b'secret-id', 'version': 3},
+                'u': {'$set': {'email': 'alberto@gmail.com'}, '$inc': {'version': 1}},
+            }
+        ],
+    }
+
+    with caplog.at_level(logging.WARNING):
+        run_command(monitor, {'find': 'users', 'filter': {'email': 'x'}}, 5)
+        run_command(monitor, command, 50, request_id=2)
+
+    assert len(caplog.records) == 1
+    assert 'slow mongo command update on users' in caplog.text
+    assert 'alberto@gmail.com' not in caplog.text
+    assert 'secret-id' not in caplog.text
+    assert MongoCommandMonitor.shape(command) == {
+        'updates': [
+            {
+                'q': {'_id': '?', 'version': '?'},
+                'u': {'$set': {'email': '?'}, '$inc': {'version': '?'}},
+            }
+        ]
+    }
+
+
+def test_commands_are_counted_on_the_current_query_stats() -> None:
+    monitor: MongoCommandMonitor = MongoCommandMonitor(slow_command_ms=100)
+
+    run_command(monitor, {'find': 'users', 'filter': {}}, 1)
+
+    stats, token = QueryStats.start()
+
+    try:
+        run_command(monitor, {'find': 'users', 'filter': {}}, 2, request_id=2)
+        run_command(monitor, {'insert': 'users', 'documents': []}, 3, request_id=3)
+    finally:
+        QueryStats.stop(token)
+
+    assert QueryStats.current() is None
+    assert stats.count == 2
+    assert stats.total_ms == pytest.approx(5)
@@ -0,0 +1,63 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from adapters.repositories.mongo import MongoWriteConcerns
+from web.config.settings import TestSettings
+from web.config.settings.base import Settings
+from web.db import MongoConnection
+
+
+def test_mongo_client_is_created_with_the_pool_and_compression_settings() -> None:
+    settings: Settings = TestSettings(
+        mongo_app_name='user-system-test',
+        mongo_compressors=['zlib'],
+        mongo_max_idle_time_ms=60_000,
+        mongo_max_pool_size=20,
+        mongo_min_pool_size=5,
+        mongo_wait_queue_timeout_ms=500,
+    )  # type: ignore
+
+    client: AsyncIOMotorClient = MongoConnection.get_client(
+        settings, MongoConnection.get_command_monitor(settings)
+    )
+
+    assert client.options.pool_options.max_pool_size == 20
+    assert client.options.pool_options.min_pool_size == 5
+    assert client.options.pool_options.max_idle_time_seconds == 60
+    assert client.options.pool_options.wait_queue_timeout == 0.5
+    assert client.options.pool_options.metadata['application'] == {
+        'name': 'user-system-test'
+    }
+
+    client.close()
+
+
+def test_mongo_client_is_created_with_the_default_settings() -> None:
+    settings: Settings = TestSettings()  # type: ignore
+    client: AsyncIOMotorClient = MongoConnection.get_client(
+        settings, MongoConnection.get_command_monitor(settings)
+    )
+
+    assert client.options.pool_options.max_pool_size == 100
+    assert client.options.pool_options.min_pool_size == 0
+
+    client.close()
+
+
+def test_write_concern_profiles_are_created_from_the_settings() -> None:
+    settings: Settings = TestSettings(
+        mongo_write_concerns={'fast': {'w': 0}, 'durable': {'w': 2, 'j': True}}
+    )  # type: ignore
+
+    write_concerns: MongoWriteConcerns = MongoConnection.get_write_concerns(settings)
+
+    assert write_concerns.fast.document == {'w': 0}
+    assert write_concerns.durable.document == {'w': 2, 'j': True}
+
+
+def test_write_concern_profiles_default_to_w1_and_journaled_majority() -> None:
+    write_concerns: MongoWriteConcerns = MongoConnection.get_write_concerns(
+        TestSettings()  # type: ignore
+    )
+
+    assert write_concerns.fast.document == {'w': 1}
+    assert write_concerns.durable.document == {'w': 'majority', 'j': True}
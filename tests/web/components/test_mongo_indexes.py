@@ -0,0 +1,58 @@
+from typing import Any
+
+import pymongo
+import pytest
+from pymongo.errors import OperationFailure
+
+from adapters.models.base import MongoIndex
+from web.db import MongoIndexes
+
+
+class FakeCollection:
+    name: str = 'users'
+
+    def __init__(self, error: OperationFailure | None = None) -> None:
+        self.error: OperationFailure | None = error
+        self.timeouts: list[float | None] = []
+
+    async def create_indexes(self, _: list[Any]) -> list[str]:
+        self.timeouts.append(pymongo._csot.get_timeout())
+
+        if self.error is not None:
+            raise self.error
+
+        return ['email_unique']
+
+
+index: MongoIndex = MongoIndex(name='email_unique', keys=(('email', 1),), unique=True)
+
+
+@pytest.mark.asyncio
+async def test_indexes_are_built_with_their_own_timeout() -> None:
+    collection: FakeCollection = FakeCollection()
+
+    await MongoIndexes._build(None, collection, index)  # type: ignore
+
+    assert collection.timeouts == [MongoIndexes.build_timeout_seconds]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_values_fail_the_unique_index_build_with_a_clear_error() -> (
+    None
+):
+    collection: FakeCollection = FakeCollection(
+        OperationFailure('E11000 duplicate key error', code=11000)
+    )
+
+    with pytest.raises(RuntimeError, match='duplicate values'):
+        await MongoIndexes._build(None, collection, index)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_other_build_failures_are_raised() -> None:
+    collection: FakeCollection = FakeCollection(
+        OperationFailure('not authorized', code=13)
+    )
+
+    with pytest.raises(OperationFailure):
+        await MongoIndexes._build(None, collection, index)  # type: ignore
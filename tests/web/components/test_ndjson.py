@@ -0,0 +1,34 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from web.utils.streaming import Ndjson
+
+
+async def chunks(*values: bytes) -> AsyncIterator[bytes]:
+    for value in values:
+        yield value
+
+
+@pytest.mark.asyncio
+async def test_lines_are_rebuilt_across_chunks_and_numbered() -> None:
+    lines = [
+        line
+        async for line in Ndjson.lines(
+            chunks(b'{"a"', b': 1}\n\n{"b": 2}', b'\n{"c": 3}')
+        )
+    ]
+
+    assert lines == [(1, b'{"a": 1}'), (3, b'{"b": 2}'), (4, b'{"c": 3}')]
+
+
+@pytest.mark.asyncio
+async def test_lines_longer_than_the_limit_are_reported_as_None() -> None:
+    lines = [
+        line
+        async for line in Ndjson.lines(
+            chunks(b'x' * 10, b'x' * 10, b'\n{"a": 1}\n'), max_line_bytes=15
+        )
+    ]
+
+    assert lines == [(1, None), (2, b'{"a": 1}')]
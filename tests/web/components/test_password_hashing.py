@@ -0,0 +1,67 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from adapters.security import (
+    AdmissionController,
+    BcryptCalibration,
+    BcryptPasswordManager,
+    CredentialCache,
+)
+from ports.security import IAsyncPasswordManager
+from web.config.settings import TestSettings
+from web.config.settings.base import Settings
+from web.di import Di
+from web.security.hashing import PasswordHashing
+
+
+def test_socket_mode_does_not_create_the_process_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    get_raw: MagicMock = MagicMock(side_effect=AssertionError('pool created'))
+    monkeypatch.setattr(Di, 'get_raw', get_raw)
+
+    password_manager: IAsyncPasswordManager = (
+        PasswordHashing.get_async_password_manager(
+            TestSettings(password_hashing_socket_path='/tmp/hashing.sock'),  # type: ignore
+            BcryptPasswordManager(rounds=4),
+            AdmissionController(max_concurrency=1, max_queue_size=1, retry_after=1),
+            CredentialCache(ttl_seconds=0, max_entries=1),
+        )
+    )
+
+    assert password_manager is not None
+    get_raw.assert_not_called()
+
+
+def test_in_socket_mode_the_api_uses_the_cost_calibrated_by_the_worker(
+    tmp_path: Path,
+) -> None:
+    settings: Settings = TestSettings(
+        bcrypt_calibration_path=str(tmp_path / 'bcrypt-calibration.json'),
+        bcrypt_calibration_samples=1,
+        bcrypt_calibration_target_ms=60_000,
+        bcrypt_calibration_wait_seconds=0,
+        bcrypt_max_rounds=5,
+        bcrypt_min_rounds=4,
+        password_hashing_socket_path='/tmp/hashing.sock',
+    )  # type: ignore
+
+    worker_calibration: BcryptCalibration = PasswordHashing.calibrate(
+        settings, hashing_worker=True
+    )
+    api_calibration: BcryptCalibration = PasswordHashing.calibrate(settings)
+
+    assert worker_calibration.rounds == 5
+    assert api_calibration == worker_calibration
+
+
+def test_in_socket_mode_calibration_requires_a_shared_path() -> None:
+    settings: Settings = TestSettings(
+        bcrypt_calibration_target_ms=150,
+        password_hashing_socket_path='/tmp/hashing.sock',
+    )  # type: ignore
+
+    with pytest.raises(RuntimeError, match='BCRYPT_CALIBRATION_PATH'):
+        PasswordHashing.calibrate(settings, hashing_worker=True)
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+from adapters.repositories.lease import SqliteLeaseRepository
+from adapters.repositories.snapshot import SqliteSnapshotRepository
+from adapters.repositories.user import (
+    CoalescingUserRepository,
+    InMemoryUserRepository,
+    SqliteUserRepository,
+)
+from web.config.settings import TestSettings
+from web.db import Repositories
+
+
+def test_user_repository_is_mongo_backed_by_default() -> None:
+    repository = Repositories.get_user_repository(
+        TestSettings(), MagicMock(), MagicMock(), MagicMock()  # type: ignore
+    )
+
+    assert isinstance(repository, CoalescingUserRepository)
+
+
+def test_user_repository_can_be_switched_to_memory() -> None:
+    repository = Repositories.get_user_repository(
+        TestSettings(user_repository='memory'),  # type: ignore
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+    )
+
+    assert isinstance(repository, InMemoryUserRepository)
+
+
+def test_user_repository_can_be_switched_to_sqlite() -> None:
+    repository = Repositories.get_user_repository(
+        TestSettings(user_repository='sqlite'),  # type: ignore
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+    )
+
+    assert isinstance(repository, SqliteUserRepository)
+
+
+def test_lease_repository_follows_the_user_repository() -> None:
+    repository = Repositories.get_lease_repository(
+        TestSettings(user_repository='sqlite'),  # type: ignore
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+    )
+
+    assert isinstance(repository, SqliteLeaseRepository)
+
+
+def test_snapshot_repository_follows_the_user_repository() -> None:
+    repository = Repositories.get_snapshot_repository(
+        TestSettings(user_repository='sqlite'),  # type: ignore
+        MagicMock(),
+        MagicMock(),
+    )
+
+    assert isinstance(repository, SqliteSnapshotRepository)
@@ -0,0 +1,73 @@
+import gzip
+import json
+from datetime import date
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+from adapters.repositories.user import InMemoryUserRepository
+from domain.entities import User
+from domain.value_objects import ColorTheme, Language
+from usecases.user import ExportUsersUsecase
+from web.utils.streaming import UserExportStream
+
+
+@pytest_asyncio.fixture
+async def stream() -> UserExportStream:
+    repository: InMemoryUserRepository = InMemoryUserRepository()
+
+    for number in range(3):
+        await repository.create(
+            User(
+                id=f'01JB0C8Y3RSXK2B1N9Q6FMD3Z{number}',
+                username=f'Usuário {number}',
+                email=f'usuario{number}@gmail.com',
+                hashed_password='senha_criptografada',
+                birth_date=date(year=1990, month=1, day=1),
+                color_theme=ColorTheme.DARK,
+                language=Language.PT_BR,
+            )
+        )
+
+    return UserExportStream(ExportUsersUsecase(repository), batch_size=2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('compress', [False, True])
+async def test_chunks_are_ndjson_lines_without_the_hashed_password(
+    stream: UserExportStream, compress: bool
+) -> None:
+    body: bytes = b''.join([chunk async for chunk in stream.chunks(compress=compress)])
+
+    if compress:
+        body = gzip.decompress(body)
+
+    users: list[dict[str, Any]] = [json.loads(line) for line in body.splitlines()]
+
+    assert [user['email'] for user in users] == [
+        'usuario0@gmail.com',
+        'usuario1@gmail.com',
+        'usuario2@gmail.com',
+    ]
+    assert users[0] == {
+        'id': '01JB0C8Y3RSXK2B1N9Q6FMD3Z0',
+        'username': 'Usuário 0',
+        'email': 'usuario0@gmail.com',
+        'birth_date': '1990-01-01',
+        'color_theme': 'dark',
+        'language': 'pt_br',
+        'is_active': True,
+        'created_at': users[0]['created_at'],
+    }
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_flushed_once_the_buffer_is_full(
+    stream: UserExportStream,
+) -> None:
+    stream.chunk_size = 1
+
+    chunks: list[bytes] = [chunk async for chunk in stream.chunks()]
+
+    assert len(chunks) == 3
@@ -1,23 +1,30 @@
+import asyncio
+import logging
+
 from domain.entities import User
+from ports.repositories.exceptions import RepositoryException
 from ports.repositories.user import IUserRepository
-from ports.security import IPasswordManager
+from ports.security import IAsyncPasswordManager
 from usecases.dto.auth import LoginDto
 from usecases.exceptions import AuthException, UserException
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class AuthenticateUserUsecase:
     def __init__(
         self,
         repository: IUserRepository,
-        password_manager: IPasswordManager,
+        password_manager: IAsyncPasswordManager,
     ) -> None:
         self._repository: IUserRepository = repository
-        self._password_manager: IPasswordManager = password_manager
+        self._password_manager: IAsyncPasswordManager = password_manager
+        self._rehash_tasks: set[asyncio.Task[None]] = set()
 
     async def execute(self, dto: LoginDto) -> User:
         user: User | None = await self._repository.get_by_email(dto.email)
 
-        if user is None or not self._password_manager.verify(
+        if user is None or not await self._password_manager.verify(
             dto.password, user.hashed_password
         ):
             raise AuthException.InvalidCredentials()
@@ -25,4 +32,24 @@ class AuthenticateUserUsecase:
         if not user.is_active:
             raise UserException.UserIsDeactivated(user.email)
 
+        if self._password_manager.needs_rehash(user.hashed_password):
+            self._schedule_rehash(user, dto.password)
+
         return user
+
+    def _schedule_rehash(self, user: User, password: str) -> None:
+        task: asyncio.Task[None] = asyncio.create_task(self._rehash(user, password))
+
+        self._rehash_tasks.add(task)
+        task.add_done_callback(self._rehash_tasks.discard)
+
+    async def _rehash(self, user: User, password: str) -> None:
+        try:
+            user.update_password(await self._password_manager.hash(password))
+
+            await self._repository.update(user)
+        except RepositoryException.Conflict:
+            # the user changed meanwhile; the next login rehashes again
+            logger.info('Skipped the rehash of user %s after a conflict', user.id)
+        except Exception:
+            logger.exception('Failed to rehash the password of user %s', user.id)
@@ -1,4 +1,7 @@
 from .create_user_dto import CreateUserDto
+from .list_users_dto import ListUsersDto
+from .signup_timeline_dto import SignupBucketDto, SignupGranularity, SignupTimelineDto
 from .update_user_password_dto import UpdateUserPasswordDto
 from .update_user_personal_data_dto import UpdateUserPersonalDataDto
 from .update_user_preferences_dto import UpdateUserPreferencesDto
+from .user_page_dto import UserPageDto
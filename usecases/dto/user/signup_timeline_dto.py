@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+SignupGranularity = Literal['hour', 'day', 'week']
+
+
+@dataclass(frozen=True, kw_only=True)
+class SignupTimelineDto:
+    granularity: SignupGranularity
+    since: datetime
+    until: datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class SignupBucketDto:
+    start: datetime
+    count: int
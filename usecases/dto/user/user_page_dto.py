@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from domain.entities import User
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserPageDto:
+    users: list[User]
+    next_after_id: str | None
@@ -1,2 +1,3 @@
 from .auth_exception import AuthException
+from .statistics_exception import StatisticsException
 from .user_exception import UserException
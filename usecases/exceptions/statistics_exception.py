@@ -0,0 +1,9 @@
+from usecases.exceptions.base import AppException
+
+
+class StatisticsException:
+    class SnapshotNotReady(AppException):
+        def __init__(self) -> None:
+            super().__init__(
+                message='The user statistics snapshot is still being built'
+            )
@@ -6,6 +6,12 @@ class UserException:
         def __init__(self, email: str) -> None:
             super().__init__(message=f'The user {email} already exists')
 
+    class UserUpdateConflict(AppException):
+        def __init__(self, user_id: str) -> None:
+            super().__init__(
+                message=f'The user {user_id} is being changed concurrently, try again'
+            )
+
     class UserNotFound(AppException):
         def __init__(self, user_id: str) -> None:
             super().__init__(message=f'The user {user_id} wasn\'t found')
@@ -32,6 +38,18 @@ class UserException:
                 message='The old password provided does not match the real one'
             )
 
+    class PasswordHashingFailed(AppException):
+        def __init__(self) -> None:
+            super().__init__(
+                message='The password couldn\'t be hashed, try importing the user again'
+            )
+
+    class PasswordHashingOverloaded(AppException):
+        def __init__(self) -> None:
+            super().__init__(
+                message='The password manager is overloaded, try importing the user again'
+            )
+
     class UserIsUnderage(AppException):
         def __init__(self) -> None:
             super().__init__(message='The user is underage')
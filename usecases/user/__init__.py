@@ -1,6 +1,13 @@
+from .archive_deactivated_users_usecase import ArchiveDeactivatedUsersUsecase
 from .create_user_usecase import CreateUserUsecase
 from .deactivate_user_usecase import DeactivateUserUsecase
+from .export_users_usecase import ExportUsersUsecase
 from .get_active_user_usecase import GetActiveUserUsecase
+from .get_signup_timeline_usecase import GetSignupTimelineUsecase
+from .get_user_statistics_usecase import GetUserStatisticsUsecase
+from .import_users_usecase import ImportUsersUsecase
+from .list_users_usecase import ListUsersUsecase
+from .refresh_user_statistics_usecase import RefreshUserStatisticsUsecase
 from .update_user_password_usecase import UpdateUserPasswordUsecase
 from .update_user_personal_data_usecase import UpdateUserPersonalDataUsecase
 from .update_user_preferences_usecase import UpdateUserPreferencesUsecase
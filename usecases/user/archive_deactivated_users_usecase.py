@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from ports.repositories.lease import ILeaseRepository
+from ports.repositories.user import IUserRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ArchiveDeactivatedUsersUsecase:
+    lease_name: str = 'archive_deactivated_users'
+
+    def __init__(
+        self, repository: IUserRepository, lease_repository: ILeaseRepository
+    ) -> None:
+        self._repository: IUserRepository = repository
+        self._lease_repository: ILeaseRepository = lease_repository
+
+    async def execute(
+        self,
+        deactivated_for: timedelta,
+        batch_size: int,
+        pause_seconds: float,
+        lease_ttl: timedelta,
+    ) -> int:
+        deactivated_before: datetime = datetime.now(timezone.utc) - deactivated_for
+        archived: int = 0
+
+        # every worker schedules the job, only the lease holder runs it; the lease is
+        # renewed before each batch, so a lost lease stops the run
+        while await self._lease_repository.acquire(self.lease_name, lease_ttl):
+            batch: int = await self._repository.archive_deactivated(
+                deactivated_before, batch_size
+            )
+            archived += batch
+
+            if batch < batch_size:
+                break
+
+            await asyncio.sleep(pause_seconds)
+
+        if archived:
+            logger.info('Archived %d deactivated users', archived)
+
+        return archived
@@ -2,8 +2,9 @@ from datetime import date
 
 from domain.entities import User
 from ports.id import IIdManager
+from ports.repositories.exceptions import RepositoryException
 from ports.repositories.user import IUserRepository
-from ports.security import IPasswordManager
+from ports.security import IAsyncPasswordManager
 from usecases.dto.user import CreateUserDto
 from usecases.exceptions import UserException
 
@@ -12,21 +13,18 @@ class CreateUserUsecase:
     def __init__(
         self,
         repository: IUserRepository,
-        password_manager: IPasswordManager,
+        password_manager: IAsyncPasswordManager,
         id_manager: IIdManager,
     ) -> None:
         self._repository: IUserRepository = repository
-        self._password_manager: IPasswordManager = password_manager
+        self._password_manager: IAsyncPasswordManager = password_manager
         self._id_manager: IIdManager = id_manager
 
     async def execute(self, dto: CreateUserDto) -> User:
-        if await self._is_user_already_created(dto.email):
-            raise UserException.UserAlreadyExists(dto.email)
-
         if self._is_user_underage(dto.birth_date):
             raise UserException.UserIsUnderage()
 
-        hashed_password: str = self._password_manager.hash(dto.password)
+        hashed_password: str = await self._password_manager.hash(dto.password)
 
         user: User = User(
             id=self._id_manager.generate(),
@@ -38,13 +36,13 @@ class CreateUserUsecase:
             language=dto.language,
         )
 
-        await self._repository.create(user)
+        try:
+            await self._repository.create(user)
+        except RepositoryException.AlreadyExists as e:
+            raise UserException.UserAlreadyExists(dto.email) from e
 
         return user
 
-    async def _is_user_already_created(self, email: str) -> bool:
-        return bool(await self._repository.get_by_email(email))
-
     def _is_user_underage(self, birth_date: date) -> bool:
         legal_age_date: date = (today := date.today()).replace(
             year=today.year - 18,
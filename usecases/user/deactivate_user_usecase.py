@@ -1,5 +1,6 @@
 from domain.entities import User
 from ports.repositories.user import IUserRepository
+from usecases.user.optimistic_update import OptimisticUpdate
 
 
 class DeactivateUserUsecase:
@@ -7,8 +8,6 @@ class DeactivateUserUsecase:
         self._repository: IUserRepository = repository
 
     async def execute(self, active_user: User) -> User:
-        active_user.deactivate()
-
-        await self._repository.update(active_user)
-
-        return active_user
+        return await OptimisticUpdate.apply(
+            self._repository, active_user, lambda user: user.deactivate()
+        )
@@ -0,0 +1,11 @@
+from collections.abc import AsyncIterator
+
+from ports.repositories.user import ExportedUser, IUserRepository
+
+
+class ExportUsersUsecase:
+    def __init__(self, repository: IUserRepository) -> None:
+        self._repository: IUserRepository = repository
+
+    def execute(self, batch_size: int) -> AsyncIterator[ExportedUser]:
+        return self._repository.export(batch_size)
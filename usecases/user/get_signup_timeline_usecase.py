@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta, timezone
+
+from ports.repositories.user import IUserRepository
+from usecases.dto.user import SignupBucketDto, SignupGranularity, SignupTimelineDto
+
+BUCKET_SIZES: dict[SignupGranularity, timedelta] = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+}
+
+
+def bucket_start(moment: datetime, granularity: SignupGranularity) -> datetime:
+    start: datetime = moment.astimezone(timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+    if granularity == 'hour':
+        return start
+
+    start = start.replace(hour=0)
+
+    if granularity == 'day':
+        return start
+
+    return start - timedelta(days=start.weekday())
+
+
+def count_buckets(
+    granularity: SignupGranularity, since: datetime, until: datetime
+) -> int:
+    # ceiling division from the aligned start, the same buckets execute builds
+    return max(
+        1, -((bucket_start(since, granularity) - until) // BUCKET_SIZES[granularity])
+    )
+
+
+class GetSignupTimelineUsecase:
+    def __init__(self, repository: IUserRepository) -> None:
+        self._repository: IUserRepository = repository
+
+    async def execute(self, dto: SignupTimelineDto) -> list[SignupBucketDto]:
+        bucket_size: timedelta = BUCKET_SIZES[dto.granularity]
+        boundaries: list[datetime] = [bucket_start(dto.since, dto.granularity)]
+
+        while len(boundaries) < 2 or boundaries[-1] < dto.until:
+            boundaries.append(boundaries[-1] + bucket_size)
+
+        counts: list[int] = await self._repository.count_signups(boundaries)
+
+        return [
+            SignupBucketDto(start=start, count=count)
+            for start, count in zip(boundaries, counts)
+        ]
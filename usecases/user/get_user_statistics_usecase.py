@@ -0,0 +1,19 @@
+from datetime import UTC, datetime
+
+from ports.statistics import IUserStatistics, UserStatistics
+from usecases.exceptions import StatisticsException
+
+
+class GetUserStatisticsUsecase:
+    def __init__(self, statistics: IUserStatistics) -> None:
+        self._statistics: IUserStatistics = statistics
+
+    async def execute(self, signup_days: int) -> UserStatistics:
+        statistics: UserStatistics | None = self._statistics.compute(
+            datetime.now(UTC).date(), signup_days
+        )
+
+        if statistics is None:
+            raise StatisticsException.SnapshotNotReady()
+
+        return statistics
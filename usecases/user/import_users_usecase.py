@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from datetime import date
+
+from domain.entities import User
+from ports.id import IIdManager
+from ports.repositories.user import IUserRepository
+from ports.security import IAsyncPasswordManager
+from ports.security.exceptions import PasswordManagerException
+from usecases.dto.user import CreateUserDto
+from usecases.exceptions import UserException
+from usecases.exceptions.base import AppException
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ImportUsersUsecase:
+    def __init__(
+        self,
+        repository: IUserRepository,
+        password_manager: IAsyncPasswordManager,
+        id_manager: IIdManager,
+    ) -> None:
+        self._repository: IUserRepository = repository
+        self._password_manager: IAsyncPasswordManager = password_manager
+        self._id_manager: IIdManager = id_manager
+
+    async def execute(
+        self,
+        dtos: Sequence[CreateUserDto],
+        hash_concurrency: int,
+        max_hash_attempts: int,
+    ) -> list[User | AppException]:
+        results: list[User | AppException | None] = [
+            (
+                UserException.UserIsUnderage()
+                if self._is_user_underage(dto.birth_date)
+                else None
+            )
+            for dto in dtos
+        ]
+        pending: list[int] = [
+            index for index, result in enumerate(results) if result is None
+        ]
+
+        # the import shares the admission controller with logins, so it only
+        # takes a few of its slots and gives up on a user after a few rejections
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(hash_concurrency)
+        hashed_passwords: list[str | AppException] = await asyncio.gather(
+            *(
+                self._hash(dtos[index].password, semaphore, max_hash_attempts)
+                for index in pending
+            )
+        )
+
+        for index, hashed_password in zip(pending, hashed_passwords):
+            if isinstance(hashed_password, AppException):
+                results[index] = hashed_password
+
+        hashed: list[tuple[int, str]] = [
+            (index, hashed_password)
+            for index, hashed_password in zip(pending, hashed_passwords)
+            if isinstance(hashed_password, str)
+        ]
+        users: list[User] = [
+            User(
+                id=self._id_manager.generate(),
+                birth_date=dtos[index].birth_date,
+                email=dtos[index].email,
+                hashed_password=hashed_password,
+                username=dtos[index].username,
+                color_theme=dtos[index].color_theme,
+                language=dtos[index].language,
+            )
+            for index, hashed_password in hashed
+        ]
+
+        created: list[bool] = await self._repository.create_many(users)
+
+        for (index, _), user, was_created in zip(hashed, users, created):
+            results[index] = (
+                user if was_created else UserException.UserAlreadyExists(user.email)
+            )
+
+        return results  # type: ignore
+
+    async def _hash(
+        self, password: str, semaphore: asyncio.Semaphore, max_attempts: int
+    ) -> str | AppException:
+        async with semaphore:
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await self._password_manager.hash(password)
+                except PasswordManagerException.Overloaded as e:
+                    if attempt < max_attempts:
+                        await asyncio.sleep(e.retry_after)
+                except Exception:
+                    # one failed line must not cut the rest of the import off
+                    logger.exception('Hashing an imported password failed')
+
+                    return UserException.PasswordHashingFailed()
+
+        return UserException.PasswordHashingOverloaded()
+
+    def _is_user_underage(self, birth_date: date) -> bool:
+        legal_age_date: date = (today := date.today()).replace(
+            year=today.year - 18,
+            day=28 if (today.month, today.day) == (2, 29) else today.day,
+        )
+
+        return birth_date > legal_age_date
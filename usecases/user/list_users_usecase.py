@@ -0,0 +1,25 @@
+from domain.entities import User
+from ports.repositories.user import IUserRepository, UserFilters
+from usecases.dto.user import ListUsersDto, UserPageDto
+
+
+class ListUsersUsecase:
+    def __init__(self, repository: IUserRepository) -> None:
+        self._repository: IUserRepository = repository
+
+    async def execute(self, dto: ListUsersDto) -> UserPageDto:
+        users: list[User] = await self._repository.list_users(
+            dto.after_id,
+            dto.limit + 1,
+            UserFilters(
+                is_active=dto.is_active,
+                language=dto.language,
+                color_theme=dto.color_theme,
+            ),
+        )
+        page: list[User] = users[: dto.limit]
+
+        return UserPageDto(
+            users=page,
+            next_after_id=page[-1].id if len(users) > dto.limit else None,
+        )
@@ -0,0 +1,39 @@
+from collections.abc import Awaitable, Callable
+from inspect import isawaitable
+
+from domain.entities import User
+from ports.repositories.exceptions import RepositoryException
+from ports.repositories.user import IUserRepository
+from usecases.exceptions import UserException
+
+
+class OptimisticUpdate:
+    max_attempts: int = 3
+
+    @classmethod
+    async def apply(
+        cls,
+        repository: IUserRepository,
+        user: User,
+        change: Callable[[User], Awaitable[None] | None],
+    ) -> User:
+        for attempt in range(1, cls.max_attempts + 1):
+            if isawaitable(changed := change(user)):
+                await changed
+
+            try:
+                await repository.update(user)
+            except RepositoryException.Conflict:
+                if attempt == cls.max_attempts:
+                    break
+
+                reloaded_user: User | None = await repository.get_by_id(user.id)
+
+                if reloaded_user is None:
+                    raise UserException.UserNotFound(user.id)
+
+                user = reloaded_user
+            else:
+                return user
+
+        raise UserException.UserUpdateConflict(user.id)
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+
+from ports.repositories.lease import ILeaseRepository
+from ports.repositories.snapshot import ISnapshotRepository, StoredSnapshot
+from ports.repositories.user import IUserRepository
+from ports.statistics import IUserStatistics
+
+
+class RefreshUserStatisticsUsecase:
+    lease_name: str = 'refresh_user_statistics'
+    snapshot_name: str = 'user_statistics'
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        statistics: IUserStatistics,
+        lease_repository: ILeaseRepository,
+        snapshot_repository: ISnapshotRepository,
+    ) -> None:
+        self._repository: IUserRepository = repository
+        self._statistics: IUserStatistics = statistics
+        self._lease_repository: ILeaseRepository = lease_repository
+        self._snapshot_repository: ISnapshotRepository = snapshot_repository
+        self._loaded_at: datetime | None = None
+
+    async def execute(self, batch_size: int, max_age: timedelta) -> None:
+        stored: StoredSnapshot | None = await self._snapshot_repository.get(
+            self.snapshot_name
+        )
+        now: datetime = datetime.now(timezone.utc)
+
+        # one worker scans the users for the whole deployment, the others load
+        # the snapshot it shares
+        if (
+            stored is None or now - stored.taken_at >= max_age
+        ) and await self._lease_repository.acquire(self.lease_name, max_age):
+            await self._statistics.refresh(
+                self._repository.export(batch_size, include_archived=True)
+            )
+            stored = StoredSnapshot(
+                # the stored timestamp keeps milliseconds only
+                taken_at=now.replace(microsecond=now.microsecond // 1000 * 1000),
+                data=self._statistics.dump(),  # type: ignore
+            )
+            await self._snapshot_repository.save(self.snapshot_name, stored)
+            self._loaded_at = stored.taken_at
+
+            return
+
+        if stored is not None and stored.taken_at != self._loaded_at:
+            self._statistics.load(stored.data)
+            self._loaded_at = stored.taken_at
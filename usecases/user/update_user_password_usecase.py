@@ -1,19 +1,20 @@
 from domain.entities import User
 from ports.repositories.user import IUserRepository
-from ports.security import IPasswordManager
+from ports.security import IAsyncPasswordManager
 from usecases.dto.user import UpdateUserPasswordDto
 from usecases.exceptions import UserException
+from usecases.user.optimistic_update import OptimisticUpdate
 
 
 class UpdateUserPasswordUsecase:
     def __init__(
-        self, repository: IUserRepository, password_manager: IPasswordManager
+        self, repository: IUserRepository, password_manager: IAsyncPasswordManager
     ) -> None:
         self._repository: IUserRepository = repository
-        self._password_manager: IPasswordManager = password_manager
+        self._password_manager: IAsyncPasswordManager = password_manager
 
     async def execute(self, active_user: User, dto: UpdateUserPasswordDto) -> User:
-        if not self._password_manager.verify(
+        if not await self._password_manager.verify(
             dto.old_password, active_user.hashed_password
         ):
             raise UserException.OldPasswordDoesntMatch()
@@ -24,8 +25,22 @@ class UpdateUserPasswordUsecase:
         if dto.new_password == dto.old_password:
             raise UserException.NewPasswordCantBeSameAsOld(active_user.email)
 
-        active_user.update_password(self._password_manager.hash(dto.new_password))
+        verified_hashed_passwords: set[str] = {active_user.hashed_password}
+        new_hashed_password: str = await self._password_manager.hash(dto.new_password)
 
-        await self._repository.update(active_user)
+        async def change_password(user: User) -> None:
+            # a background rehash also changes the hash, so a different one is
+            # verified again instead of being taken as a concurrent password change
+            if user.hashed_password not in verified_hashed_passwords:
+                if not await self._password_manager.verify(
+                    dto.old_password, user.hashed_password
+                ):
+                    raise UserException.OldPasswordDoesntMatch()
 
-        return active_user
+                verified_hashed_passwords.add(user.hashed_password)
+
+            user.update_password(new_hashed_password)
+
+        return await OptimisticUpdate.apply(
+            self._repository, active_user, change_password
+        )
@@ -1,9 +1,11 @@
 from datetime import date
 
 from domain.entities import User
+from ports.repositories.exceptions import RepositoryException
 from ports.repositories.user import IUserRepository
 from usecases.dto.user import UpdateUserPersonalDataDto
 from usecases.exceptions import UserException
+from usecases.user.optimistic_update import OptimisticUpdate
 
 
 class UpdateUserPersonalDataUsecase:
@@ -14,15 +16,18 @@ class UpdateUserPersonalDataUsecase:
         if self._is_user_underage(dto.birth_date):
             raise UserException.UserIsUnderage()
 
-        active_user.update_personal_data(
-            new_username=dto.username,
-            new_email=dto.email,
-            new_birth_date=dto.birth_date,
-        )
-
-        await self._repository.update(active_user)
-
-        return active_user
+        try:
+            return await OptimisticUpdate.apply(
+                self._repository,
+                active_user,
+                lambda user: user.update_personal_data(
+                    new_username=dto.username,
+                    new_email=dto.email,
+                    new_birth_date=dto.birth_date,
+                ),
+            )
+        except RepositoryException.AlreadyExists as e:
+            raise UserException.UserAlreadyExists(dto.email) from e
 
     def _is_user_underage(self, birth_date: date) -> bool:
         legal_age_date: date = (today := date.today()).replace(
@@ -1,6 +1,7 @@
 from domain.entities import User
 from ports.repositories.user import IUserRepository
 from usecases.dto.user import UpdateUserPreferencesDto
+from usecases.user.optimistic_update import OptimisticUpdate
 
 
 class UpdateUserPreferencesUsecase:
@@ -8,11 +9,11 @@ class UpdateUserPreferencesUsecase:
         self._repository: IUserRepository = repository
 
     async def execute(self, active_user: User, dto: UpdateUserPreferencesDto) -> User:
-        active_user.update_preferences(
-            new_color_theme=dto.color_theme,
-            new_language=dto.language,
+        return await OptimisticUpdate.apply(
+            self._repository,
+            active_user,
+            lambda user: user.update_preferences(
+                new_color_theme=dto.color_theme,
+                new_language=dto.language,
+            ),
         )
-
-        await self._repository.update(active_user)
-
-        return active_user
@@ -1,15 +1,19 @@
 from fastapi import FastAPI
 
+from adapters.security import BcryptCalibration
 from web.config import (
     add_error_handlers,
     add_middlewares,
     add_routes,
     config_di,
+    configure_logging,
     is_app_in_production_mode,
+    lifespan,
 )
 from web.config.settings.base import Settings
 from web.di import Di
 from web.docs.api import api_info
+from web.security.hashing import PasswordHashing
 
 
 def create_app() -> FastAPI:
@@ -17,6 +21,14 @@ def create_app() -> FastAPI:
     config_di(test=is_in_test)
 
     settings: Settings = Di.get_raw(Settings)
+    configure_logging(settings.log_level)
+
+    Di.map(
+        BcryptCalibration,
+        to=PasswordHashing.calibrate(settings),
+        singleton=True,
+    )
+
     app: FastAPI = FastAPI(
         title=settings.api_title,
         debug=is_in_test,
@@ -24,6 +36,7 @@ def create_app() -> FastAPI:
         version=api_info.version,
         contact=api_info.contact,
         license_info=api_info.license_info,
+        lifespan=lifespan,
     )
 
     add_error_handlers(app)
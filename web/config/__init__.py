@@ -1,5 +1,7 @@
 from .config_di import config_di
 from .environment import is_app_in_production_mode
 from .error_handlers import add_error_handlers
+from .lifespan import lifespan
+from .logging_config import configure_logging
 from .middleware import add_middlewares
 from .routes import add_routes
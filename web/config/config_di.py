@@ -1,25 +1,41 @@
+from concurrent.futures import ProcessPoolExecutor
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from adapters.id import UlidManager
-from adapters.repositories.user import MongoUserRepository
-from adapters.security import BcryptPasswordManager
+from adapters.monitoring import MongoCommandMonitor
+from adapters.repositories.mongo import MongoWriteConcerns
+from adapters.repositories.sqlite import SqliteConnectionPool
+from adapters.security import AdmissionController, CredentialCache
+from adapters.statistics import NumpyUserStatistics
 from ports.id import IIdManager
+from ports.repositories.lease import ILeaseRepository
+from ports.repositories.snapshot import ISnapshotRepository
 from ports.repositories.user import IUserRepository
-from ports.security import IPasswordManager
+from ports.security import IAsyncPasswordManager, IPasswordManager
+from ports.statistics import IUserStatistics
 from usecases.auth import AuthenticateUserUsecase
 from usecases.user import (
+    ArchiveDeactivatedUsersUsecase,
     CreateUserUsecase,
     DeactivateUserUsecase,
+    ExportUsersUsecase,
     GetActiveUserUsecase,
+    GetSignupTimelineUsecase,
+    GetUserStatisticsUsecase,
+    ImportUsersUsecase,
+    ListUsersUsecase,
+    RefreshUserStatisticsUsecase,
     UpdateUserPasswordUsecase,
     UpdateUserPersonalDataUsecase,
     UpdateUserPreferencesUsecase,
 )
 from web.config.settings import ProdSettings, TestSettings
 from web.config.settings.base import Settings
-from web.db import MongoConnection
+from web.db import MongoConnection, Repositories
 from web.di import Di
 from web.security import IJwtManager
+from web.security.hashing import PasswordHashing
 from web.security.impl import PyJwtManager
 
 
@@ -31,6 +47,11 @@ def config_di(*, test: bool) -> None:
     )
 
     # db connection
+    Di.map(
+        MongoCommandMonitor,
+        to=MongoConnection.get_command_monitor,
+        singleton=True,
+    )
     Di.map(
         AsyncIOMotorClient,
         to=MongoConnection.get_client,
@@ -41,6 +62,34 @@ def config_di(*, test: bool) -> None:
         to=MongoConnection.get_db,
         singleton=True,
     )
+    Di.map(
+        MongoWriteConcerns,
+        to=MongoConnection.get_write_concerns,
+        singleton=True,
+    )
+
+    Di.map(
+        SqliteConnectionPool,
+        to=Repositories.get_sqlite_pool,
+        singleton=True,
+    )
+
+    # password hashing pool
+    Di.map(
+        ProcessPoolExecutor,
+        to=PasswordHashing.get_executor,
+        singleton=True,
+    )
+    Di.map(
+        AdmissionController,
+        to=PasswordHashing.get_admission_controller,
+        singleton=True,
+    )
+    Di.map(
+        CredentialCache,
+        to=PasswordHashing.get_credential_cache,
+        singleton=True,
+    )
 
     # objects
     if test:
@@ -57,14 +106,34 @@ def config_di(*, test: bool) -> None:
         )
 
     # ports adapters
+    Di.map(
+        ILeaseRepository,
+        to=Repositories.get_lease_repository,
+        singleton=True,
+    )
+    Di.map(
+        ISnapshotRepository,
+        to=Repositories.get_snapshot_repository,
+        singleton=True,
+    )
     Di.map(
         IUserRepository,
-        to=MongoUserRepository,
+        to=Repositories.get_user_repository,
         singleton=True,
     )
     Di.map(
         IPasswordManager,
-        to=BcryptPasswordManager,
+        to=PasswordHashing.get_password_manager,
+        singleton=True,
+    )
+    Di.map(
+        IAsyncPasswordManager,
+        to=PasswordHashing.get_async_password_manager,
+        singleton=True,
+    )
+    Di.map(
+        IUserStatistics,
+        to=NumpyUserStatistics(),
         singleton=True,
     )
     Di.map(
@@ -74,6 +143,11 @@ def config_di(*, test: bool) -> None:
     )
 
     # usecases
+    Di.map(
+        ArchiveDeactivatedUsersUsecase,
+        to=ArchiveDeactivatedUsersUsecase,
+        singleton=True,
+    )
     Di.map(
         AuthenticateUserUsecase,
         to=AuthenticateUserUsecase,
@@ -89,11 +163,41 @@ def config_di(*, test: bool) -> None:
         to=DeactivateUserUsecase,
         singleton=True,
     )
+    Di.map(
+        ExportUsersUsecase,
+        to=ExportUsersUsecase,
+        singleton=True,
+    )
     Di.map(
         GetActiveUserUsecase,
         to=GetActiveUserUsecase,
         singleton=True,
     )
+    Di.map(
+        GetSignupTimelineUsecase,
+        to=GetSignupTimelineUsecase,
+        singleton=True,
+    )
+    Di.map(
+        GetUserStatisticsUsecase,
+        to=GetUserStatisticsUsecase,
+        singleton=True,
+    )
+    Di.map(
+        ImportUsersUsecase,
+        to=ImportUsersUsecase,
+        singleton=True,
+    )
+    Di.map(
+        ListUsersUsecase,
+        to=ListUsersUsecase,
+        singleton=True,
+    )
+    Di.map(
+        RefreshUserStatisticsUsecase,
+        to=RefreshUserStatisticsUsecase,
+        singleton=True,
+    )
     Di.map(
         UpdateUserPasswordUsecase,
         to=UpdateUserPasswordUsecase,
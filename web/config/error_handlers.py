@@ -5,7 +5,8 @@ from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic_core import ValidationError
 
-from usecases.exceptions import AuthException, UserException
+from ports.security.exceptions import PasswordManagerException
+from usecases.exceptions import AuthException, StatisticsException, UserException
 from web.exceptions import (
     ApiGeneralException,
     ApiSecurityException,
@@ -17,6 +18,7 @@ from web.http_error_responses import (
     Forbidden,
     MethodNotAllowed,
     NotFound,
+    ServiceUnavailable,
     Unauthorized,
     UnprocessableEntity,
 )
@@ -31,6 +33,12 @@ def add_error_handlers(app: FastAPI) -> None:
     ) -> Response:
         return Conflict(e).json()
 
+    @app.exception_handler(UserException.UserUpdateConflict)
+    def user_update_conflict_handler(
+        _: Request, e: UserException.UserUpdateConflict
+    ) -> Response:
+        return Conflict(e).json()
+
     @app.exception_handler(AuthException.InvalidCredentials)
     def invalid_credentials_handler(
         _: Request, e: AuthException.InvalidCredentials
@@ -71,6 +79,23 @@ def add_error_handlers(app: FastAPI) -> None:
     ) -> Response:
         return BadRequest(e).json()
 
+    @app.exception_handler(StatisticsException.SnapshotNotReady)
+    def statistics_snapshot_not_ready_handler(
+        _: Request, e: StatisticsException.SnapshotNotReady
+    ) -> Response:
+        return ServiceUnavailable(e).json()
+
+    # port exceptions
+
+    @app.exception_handler(PasswordManagerException.Overloaded)
+    def password_manager_overloaded_handler(
+        _: Request, e: PasswordManagerException.Overloaded
+    ) -> Response:
+        return ServiceUnavailable(
+            ApiGeneralException.ServiceOverloaded(e.retry_after),
+            headers={'Retry-After': str(e.retry_after)},
+        ).json()
+
     # api errors
 
     @app.exception_handler(ApiSecurityException.InvalidJwt)
@@ -81,6 +106,18 @@ def add_error_handlers(app: FastAPI) -> None:
     def expired_jwt_handler(_: Request, e: ApiSecurityException.ExpiredJwt) -> Response:
         return Unauthorized(e, headers={"WWW-Authenticate": "Bearer"}).json()
 
+    @app.exception_handler(ApiSecurityException.MissingAdminKey)
+    def missing_admin_key_handler(
+        _: Request, e: ApiSecurityException.MissingAdminKey
+    ) -> Response:
+        return Unauthorized(e).json()
+
+    @app.exception_handler(ApiSecurityException.InvalidAdminKey)
+    def invalid_admin_key_handler(
+        _: Request, e: ApiSecurityException.InvalidAdminKey
+    ) -> Response:
+        return Forbidden(e).json()
+
     # override fastapi error handlers
 
     @app.exception_handler(RequestValidationError)
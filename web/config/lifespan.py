@@ -0,0 +1,80 @@
+from collections.abc import AsyncGenerator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+from fastapi import FastAPI
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from adapters.repositories.lease import SqliteLeaseRepository
+from adapters.repositories.snapshot import SqliteSnapshotRepository
+from adapters.repositories.sqlite import SqliteConnectionPool
+from adapters.repositories.user import SqliteUserRepository
+from usecases.user import ArchiveDeactivatedUsersUsecase, RefreshUserStatisticsUsecase
+from web.config.settings.base import Settings
+from web.db import MongoConnection, MongoIndexes
+from web.di import Di
+from web.utils.tasks import PeriodicTask
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
+    settings: Settings = Di.get_raw(Settings)
+
+    if settings.user_repository == 'mongo':
+        await MongoConnection.warm_up(Di.get_raw(AsyncIOMotorClient), settings)
+        await MongoIndexes.ensure(Di.get_raw(AsyncIOMotorDatabase))
+
+    if settings.user_repository == 'sqlite':
+        await SqliteUserRepository.create_schema(Di.get_raw(SqliteConnectionPool))
+        await SqliteLeaseRepository.create_schema(Di.get_raw(SqliteConnectionPool))
+        await SqliteSnapshotRepository.create_schema(Di.get_raw(SqliteConnectionPool))
+
+    statistics_refresh: PeriodicTask | None = None
+
+    if settings.statistics_refresh_seconds > 0:
+        refresh_statistics: RefreshUserStatisticsUsecase = Di.get_raw(
+            RefreshUserStatisticsUsecase
+        )
+        statistics_refresh = PeriodicTask(
+            'user statistics refresh',
+            settings.statistics_sync_seconds,
+            lambda: refresh_statistics.execute(
+                settings.export_batch_size,
+                timedelta(seconds=settings.statistics_refresh_seconds),
+            ),
+            settings.statistics_refresh_jitter_seconds,
+        )
+        statistics_refresh.start()
+
+    archiving: PeriodicTask | None = None
+
+    if settings.archive_interval_seconds > 0:
+        archive_users: ArchiveDeactivatedUsersUsecase = Di.get_raw(
+            ArchiveDeactivatedUsersUsecase
+        )
+        archiving = PeriodicTask(
+            'deactivated users archiving',
+            settings.archive_interval_seconds,
+            lambda: archive_users.execute(
+                timedelta(days=settings.archive_after_days),
+                settings.archive_batch_size,
+                settings.archive_batch_pause_seconds,
+                timedelta(seconds=2 * settings.archive_interval_seconds),
+            ),
+        )
+        archiving.start()
+
+    yield
+
+    if archiving is not None:
+        await archiving.stop()
+
+    if statistics_refresh is not None:
+        await statistics_refresh.stop()
+
+    if settings.password_hashing_socket_path is None:
+        Di.get_raw(ProcessPoolExecutor).shutdown(cancel_futures=True)
+
+    if settings.user_repository == 'sqlite':
+        Di.get_raw(SqliteConnectionPool).close()
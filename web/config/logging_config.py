@@ -0,0 +1,20 @@
+import logging
+
+APP_LOGGERS: tuple[str, ...] = ('adapters', 'usecases', 'web')
+HANDLER_NAME: str = 'app'
+
+
+def configure_logging(level: str) -> None:
+    # uvicorn only configures its own loggers, so records from the app would
+    # reach a root logger without handlers and be dropped below WARNING
+    for name in APP_LOGGERS:
+        logger: logging.Logger = logging.getLogger(name)
+        logger.setLevel(level)
+
+        if not any(handler.name == HANDLER_NAME for handler in logger.handlers):
+            handler: logging.Handler = logging.StreamHandler()
+            handler.name = HANDLER_NAME
+            handler.setFormatter(
+                logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+            )
+            logger.addHandler(handler)
@@ -6,10 +6,19 @@ from typing import Any
 from fastapi import FastAPI, Request, Response, UploadFile
 from starlette.concurrency import iterate_in_threadpool
 
+from web.config.settings.base import Settings
+from web.di import Di
 from web.utils.logger import HttpLogger
+from web.utils.monitoring import DbTimingMiddleware
 
 
 def add_middlewares(app: FastAPI, *, test: bool) -> None:
+    app.add_middleware(
+        DbTimingMiddleware,
+        command_warning_count=Di.get_raw(Settings).mongo_request_command_warning_count,
+        server_timing=test,
+    )
+
     if test:
 
         @app.middleware('http')
@@ -41,7 +50,7 @@ def add_middlewares(app: FastAPI, *, test: bool) -> None:
                     iter(response_body_data)
                 )
                 response_body = json.loads(b"".join(response_body_data))
-            except json.decoder.JSONDecodeError:
+            except (json.decoder.JSONDecodeError, UnicodeDecodeError):
                 pass
 
             HttpLogger(
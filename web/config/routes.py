@@ -1,8 +1,15 @@
 from fastapi import FastAPI
 
-from web.controllers import AuthController, UserController
+from web.controllers import (
+    AdminController,
+    AuthController,
+    MetricsController,
+    UserController,
+)
 
 
 def add_routes(app: FastAPI) -> None:
     app.include_router(UserController.router)
     app.include_router(AuthController.router)
+    app.include_router(MetricsController.router)
+    app.include_router(AdminController.router)
@@ -1 +1,5 @@
+from .mongo_write_concern_settings import (
+    MongoWriteConcernProfilesSettings,
+    MongoWriteConcernSettings,
+)
 from .settings import Settings
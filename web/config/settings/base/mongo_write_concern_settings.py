@@ -0,0 +1,13 @@
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+
+class MongoWriteConcernSettings(BaseModel):
+    w: Annotated[int, Field(ge=0)] | Literal['majority']
+    j: bool | None = None
+
+
+class MongoWriteConcernProfilesSettings(BaseModel):
+    fast: MongoWriteConcernSettings = MongoWriteConcernSettings(w=1)
+    durable: MongoWriteConcernSettings = MongoWriteConcernSettings(w='majority', j=True)
@@ -1,10 +1,61 @@
+from typing import Annotated, Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from .mongo_write_concern_settings import MongoWriteConcernProfilesSettings
+
 
 class Settings(BaseSettings):
+    admin_api_key: str | None = None
     api_title: str
     access_token_expire_minutes: int = 180
+    archive_after_days: Annotated[int, Field(ge=1)] = 90
+    archive_batch_pause_seconds: Annotated[float, Field(ge=0)] = 0.5
+    archive_batch_size: Annotated[int, Field(ge=1, le=10_000)] = 500
+    archive_interval_seconds: Annotated[float, Field(ge=0)] = 3600
+    argon2_memory_cost: int = 65536
+    argon2_parallelism: int = 4
+    argon2_time_cost: int = 3
+    bcrypt_calibration_path: str | None = None
+    bcrypt_calibration_samples: Annotated[int, Field(ge=1)] = 3
+    bcrypt_calibration_target_ms: float | None = None
+    bcrypt_calibration_wait_seconds: Annotated[float, Field(ge=0)] = 120
+    bcrypt_max_rounds: int = 14
+    bcrypt_min_rounds: int = 10
+    bcrypt_rounds: int = 12
+    bulk_import_batch_size: Annotated[int, Field(ge=1, le=1000)] = 32
+    bulk_import_hash_concurrency: Annotated[int, Field(ge=1)] = 2
+    bulk_import_max_hash_attempts: Annotated[int, Field(ge=1)] = 5
+    credential_cache_max_entries: int = 10_000
+    credential_cache_ttl_seconds: Annotated[float, Field(ge=0, le=300)] = 0
+    export_batch_size: Annotated[int, Field(ge=1, le=10_000)] = 1000
     jwt_algorithm: str = 'HS256'
+    log_level: Literal['DEBUG', 'INFO', 'WARNING', 'ERROR'] = 'INFO'
+    mongo_app_name: str = 'clean-architecture-user-system'
+    mongo_compressors: list[Literal['zstd', 'snappy', 'zlib']] = []
     mongo_database: str
+    mongo_max_idle_time_ms: int | None = None
+    mongo_max_pool_size: Annotated[int, Field(ge=1)] = 100
+    mongo_min_pool_size: Annotated[int, Field(ge=0)] = 0
+    mongo_request_command_warning_count: Annotated[int, Field(ge=1)] = 20
+    mongo_slow_command_ms: Annotated[float, Field(ge=0)] = 100
+    mongo_timeout_ms: int = 3000
     mongo_uri: str
+    mongo_wait_queue_timeout_ms: int | None = None
+    mongo_write_concerns: MongoWriteConcernProfilesSettings = (
+        MongoWriteConcernProfilesSettings()
+    )
+    password_hash_algorithm: Literal['bcrypt', 'argon2id'] = 'bcrypt'
+    password_hashing_max_concurrency: int = 4
+    password_hashing_max_queue_size: int = 64
+    password_hashing_retry_after_seconds: int = 1
+    password_hashing_socket_path: str | None = None
+    password_hashing_workers: int = 2
     secret_key: str
+    sqlite_path: str = 'users.db'
+    sqlite_pool_size: Annotated[int, Field(ge=1)] = 4
+    statistics_refresh_jitter_seconds: Annotated[float, Field(ge=0)] = 5
+    statistics_refresh_seconds: Annotated[float, Field(ge=0)] = 600
+    statistics_sync_seconds: Annotated[float, Field(gt=0)] = 30
+    user_repository: Literal['mongo', 'memory', 'sqlite'] = 'mongo'
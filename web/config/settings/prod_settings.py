@@ -3,4 +3,5 @@ from web.config.settings.base import Settings
 
 class ProdSettings(Settings):
     api_title: str = 'Frigatto - PRODUÇÃO'
+    bcrypt_calibration_target_ms: float | None = 150
     mongo_database: str = 'frigatto_app'
@@ -2,6 +2,7 @@ from web.config.settings.base import Settings
 
 
 class TestSettings(Settings):
+    admin_api_key: str | None = 'admin'
     api_title: str = 'Frigatto - TESTE'
     mongo_database: str = 'test'
     secret_key: str = 'key'
@@ -1,2 +1,4 @@
+from .admin_controller import AdminController
 from .auth_controller import AuthController
+from .metrics_controller import MetricsController
 from .user_controller import UserController
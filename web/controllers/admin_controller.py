@@ -0,0 +1,133 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ports.statistics import UserStatistics
+from usecases.dto.user import SignupBucketDto, UserPageDto
+from usecases.user import (
+    ExportUsersUsecase,
+    GetSignupTimelineUsecase,
+    GetUserStatisticsUsecase,
+    ImportUsersUsecase,
+    ListUsersUsecase,
+)
+from web.config.settings.base import Settings
+from web.di import Di
+from web.docs.endpoints.admin import admin_endpoints
+from web.schemes.admin import (
+    ListUsersScheme,
+    SignupTimelineOutScheme,
+    SignupTimelineScheme,
+    UserPageOutScheme,
+    UserStatisticsOutScheme,
+)
+from web.utils.auth import AuthUtils
+from web.utils.streaming import (
+    DuplexStreamingResponse,
+    Ndjson,
+    UserExportStream,
+    UserImportStream,
+)
+
+
+class AdminController:
+    router: APIRouter = APIRouter(
+        prefix='/admin',
+        tags=['Admin'],
+        dependencies=[Depends(AuthUtils.require_admin)],
+    )
+
+    @staticmethod
+    @router.get(
+        '/users',
+        status_code=HTTPStatus.OK,
+        description=admin_endpoints.list_users_description,
+    )
+    async def list_users(
+        query: Annotated[ListUsersScheme, Query()],
+        usecase: ListUsersUsecase = Di.inject(ListUsersUsecase),
+    ) -> UserPageOutScheme:
+        page: UserPageDto = await usecase.execute(query.to_dto())
+
+        return UserPageOutScheme.from_page(page)
+
+    @staticmethod
+    @router.post(
+        '/users/import',
+        status_code=HTTPStatus.OK,
+        description=admin_endpoints.import_users_description,
+        response_class=DuplexStreamingResponse,
+        openapi_extra={
+            'requestBody': {
+                'required': True,
+                'content': {Ndjson.media_type: {'schema': {'type': 'string'}}},
+            }
+        },
+    )
+    async def import_users(
+        request: Request,
+        settings: Settings = Di.inject(Settings),
+        usecase: ImportUsersUsecase = Di.inject(ImportUsersUsecase),
+    ) -> DuplexStreamingResponse:
+        return DuplexStreamingResponse(
+            UserImportStream(
+                usecase,
+                settings.bulk_import_batch_size,
+                settings.bulk_import_hash_concurrency,
+                settings.bulk_import_max_hash_attempts,
+            ).results(request.stream()),
+            media_type=Ndjson.media_type,
+        )
+
+    @staticmethod
+    @router.get(
+        '/users/export',
+        status_code=HTTPStatus.OK,
+        description=admin_endpoints.export_users_description,
+        response_class=StreamingResponse,
+        responses={
+            HTTPStatus.OK: {
+                'content': {Ndjson.media_type: {'schema': {'type': 'string'}}}
+            }
+        },
+    )
+    async def export_users(
+        gzip: bool = False,
+        settings: Settings = Di.inject(Settings),
+        usecase: ExportUsersUsecase = Di.inject(ExportUsersUsecase),
+    ) -> StreamingResponse:
+        return StreamingResponse(
+            UserExportStream(usecase, settings.export_batch_size).chunks(compress=gzip),
+            media_type=Ndjson.media_type,
+            headers={'Content-Encoding': 'gzip'} if gzip else None,
+        )
+
+    @staticmethod
+    @router.get(
+        '/users/statistics',
+        status_code=HTTPStatus.OK,
+        description=admin_endpoints.get_user_statistics_description,
+    )
+    async def get_user_statistics(
+        signup_days: Annotated[int, Query(ge=1, le=365)] = 30,
+        usecase: GetUserStatisticsUsecase = Di.inject(GetUserStatisticsUsecase),
+    ) -> UserStatisticsOutScheme:
+        statistics: UserStatistics = await usecase.execute(signup_days)
+
+        return UserStatisticsOutScheme.from_entity(statistics)
+
+    @staticmethod
+    @router.get(
+        '/users/signups',
+        status_code=HTTPStatus.OK,
+        description=admin_endpoints.get_signup_timeline_description,
+    )
+    async def get_signup_timeline(
+        query: Annotated[SignupTimelineScheme, Query()],
+        usecase: GetSignupTimelineUsecase = Di.inject(GetSignupTimelineUsecase),
+    ) -> SignupTimelineOutScheme:
+        buckets: list[SignupBucketDto] = await usecase.execute(query.to_dto())
+
+        return SignupTimelineOutScheme.from_buckets(query.granularity, buckets)
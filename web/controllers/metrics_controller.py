@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends
+
+from adapters.monitoring import MongoCommandMonitor
+from adapters.security import AdmissionController, BcryptCalibration, CredentialCache
+from web.di import Di
+from web.docs.endpoints.metrics import metrics_endpoints
+from web.schemes.metrics import (
+    CredentialCacheMetricsOutScheme,
+    MetricsOutScheme,
+    MongoCommandMetricsOutScheme,
+    PasswordHashCostMetricsOutScheme,
+    PasswordHashingMetricsOutScheme,
+)
+from web.utils.auth import AuthUtils
+
+
+class MetricsController:
+    router: APIRouter = APIRouter(
+        prefix='/metrics',
+        tags=['Metrics'],
+        dependencies=[Depends(AuthUtils.require_admin)],
+    )
+
+    @staticmethod
+    @router.get(
+        '/',
+        status_code=HTTPStatus.OK,
+        description=metrics_endpoints.get_metrics_description,
+    )
+    async def get_metrics(
+        admission_controller: AdmissionController = Di.inject(AdmissionController),
+        calibration: BcryptCalibration = Di.inject(BcryptCalibration),
+        credential_cache: CredentialCache = Di.inject(CredentialCache),
+        command_monitor: MongoCommandMonitor = Di.inject(MongoCommandMonitor),
+    ) -> MetricsOutScheme:
+        return MetricsOutScheme(
+            password_hashing=PasswordHashingMetricsOutScheme.from_admission_controller(
+                admission_controller
+            ),
+            password_hash_cost=PasswordHashCostMetricsOutScheme.from_entity(
+                calibration
+            ),
+            credential_cache=CredentialCacheMetricsOutScheme.from_credential_cache(
+                credential_cache
+            ),
+            mongo_commands=[
+                MongoCommandMetricsOutScheme.from_histogram(
+                    command, collection, histogram
+                )
+                for (command, collection), histogram in sorted(
+                    command_monitor.histograms.items()
+                )
+            ],
+        )
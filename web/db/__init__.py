@@ -1 +1,3 @@
 from .mongo_connection import MongoConnection
+from .mongo_indexes import MongoIndexes
+from .repositories import Repositories
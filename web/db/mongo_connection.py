@@ -1,14 +1,43 @@
+import asyncio
+import logging
+import time
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import WriteConcern
+
+from adapters.monitoring import MongoCommandMonitor
+from adapters.repositories.mongo import MongoWriteConcerns
+from web.config.settings.base import MongoWriteConcernSettings, Settings
 
-from web.config.settings.base import Settings
+logger: logging.Logger = logging.getLogger(__name__)
 
 
 class MongoConnection:
     @classmethod
-    def get_client(cls, settings: Settings) -> AsyncIOMotorClient:
+    def get_command_monitor(cls, settings: Settings) -> MongoCommandMonitor:
+        return MongoCommandMonitor(settings.mongo_slow_command_ms)
+
+    @classmethod
+    def get_write_concerns(cls, settings: Settings) -> MongoWriteConcerns:
+        return MongoWriteConcerns(
+            fast=cls._write_concern(settings.mongo_write_concerns.fast),
+            durable=cls._write_concern(settings.mongo_write_concerns.durable),
+        )
+
+    @classmethod
+    def get_client(
+        cls, settings: Settings, command_monitor: MongoCommandMonitor
+    ) -> AsyncIOMotorClient:
         return AsyncIOMotorClient(
             settings.mongo_uri,
-            timeoutMS=3000,
+            event_listeners=[command_monitor],
+            appname=settings.mongo_app_name,
+            compressors=settings.mongo_compressors,
+            maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            timeoutMS=settings.mongo_timeout_ms,
+            waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,
         )
 
     @classmethod
@@ -18,3 +47,24 @@ class MongoConnection:
         db: AsyncIOMotorDatabase = client[settings.mongo_database]
 
         return db
+
+    @classmethod
+    async def warm_up(cls, client: AsyncIOMotorClient, settings: Settings) -> None:
+        if settings.mongo_min_pool_size == 0:
+            return
+
+        start: float = time.perf_counter()
+
+        await asyncio.gather(
+            *(client.admin.command('ping') for _ in range(settings.mongo_min_pool_size))
+        )
+
+        logger.info(
+            'mongo pool warmed up with %d connections in %.0f ms',
+            settings.mongo_min_pool_size,
+            (time.perf_counter() - start) * 1000,
+        )
+
+    @classmethod
+    def _write_concern(cls, settings: MongoWriteConcernSettings) -> WriteConcern:
+        return WriteConcern(w=settings.w, j=settings.j)
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+import pymongo
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+
+from adapters.models import ArchivedUserModel, UserModel
+from adapters.models.base import MongoIndex, MongoModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class MongoIndexes:
+    models: tuple[type[MongoModel], ...] = (UserModel, ArchivedUserModel)
+    progress_interval_seconds: float = 5
+    build_timeout_seconds: float = 24 * 60 * 60
+    duplicate_key_error_code: int = 11000
+
+    @classmethod
+    async def ensure(cls, db: AsyncIOMotorDatabase) -> None:
+        for model in cls.models:
+            collection: AsyncIOMotorCollection = db[model.collection_name]
+            existing_indexes: dict[str, Any] = await collection.index_information()
+
+            for index in model.indexes:
+                if index.name in existing_indexes:
+                    logger.debug(
+                        'index %s on %s already exists',
+                        index.name,
+                        model.collection_name,
+                    )
+                    continue
+
+                await cls._build(db, collection, index)
+
+    @classmethod
+    async def _build(
+        cls,
+        db: AsyncIOMotorDatabase,
+        collection: AsyncIOMotorCollection,
+        index: MongoIndex,
+    ) -> None:
+        logger.info('building index %s on %s', index.name, collection.name)
+
+        start: float = time.perf_counter()
+
+        # the task copies this context, so the build escapes the client timeoutMS
+        with pymongo.timeout(cls.build_timeout_seconds):
+            build: asyncio.Task[list[str]] = asyncio.create_task(
+                collection.create_indexes([index.to_index_model()])
+            )
+
+        while True:
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(build), timeout=cls.progress_interval_seconds
+                )
+                break
+            except asyncio.TimeoutError:
+                await cls._log_progress(db, collection, index)
+            except OperationFailure as error:
+                if index.unique and error.code == cls.duplicate_key_error_code:
+                    logger.error(
+                        'cannot build unique index %s on %s: the collection has '
+                        'duplicate values for %s, remove them and restart',
+                        index.name,
+                        collection.name,
+                        ', '.join(field for field, _ in index.keys),
+                    )
+                    raise RuntimeError(
+                        f'duplicate values prevent building index {index.name} '
+                        f'on {collection.name}'
+                    ) from None
+
+                raise
+
+        logger.info(
+            'index %s on %s built in %.1f s',
+            index.name,
+            collection.name,
+            time.perf_counter() - start,
+        )
+
+    @classmethod
+    async def _log_progress(
+        cls,
+        db: AsyncIOMotorDatabase,
+        collection: AsyncIOMotorCollection,
+        index: MongoIndex,
+    ) -> None:
+        try:
+            operations: list[dict[str, Any]] = await db.client.admin.aggregate(
+                [
+                    {'$currentOp': {}},
+                    {
+                        '$match': {
+                            'command.createIndexes': collection.name,
+                            'progress': {'$exists': True},
+                        }
+                    },
+                ]
+            ).to_list(length=None)
+        except OperationFailure:
+            operations = []
+
+        for operation in operations:
+            logger.info(
+                'building index %s on %s: %s',
+                index.name,
+                collection.name,
+                operation.get('msg', operation['progress']),
+            )
+
+        if not operations:
+            logger.info('still building index %s on %s', index.name, collection.name)
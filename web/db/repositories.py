@@ -0,0 +1,77 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from adapters.repositories.lease import (
+    InMemoryLeaseRepository,
+    MongoLeaseRepository,
+    SqliteLeaseRepository,
+)
+from adapters.repositories.mongo import MongoWriteConcerns
+from adapters.repositories.snapshot import (
+    InMemorySnapshotRepository,
+    MongoSnapshotRepository,
+    SqliteSnapshotRepository,
+)
+from adapters.repositories.sqlite import SqliteConnectionPool
+from adapters.repositories.user import (
+    CoalescingUserRepository,
+    InMemoryUserRepository,
+    MongoUserRepository,
+    SqliteUserRepository,
+)
+from ports.repositories.lease import ILeaseRepository
+from ports.repositories.snapshot import ISnapshotRepository
+from ports.repositories.user import IUserRepository
+from web.config.settings.base import Settings
+
+
+class Repositories:
+    @classmethod
+    def get_sqlite_pool(cls, settings: Settings) -> SqliteConnectionPool:
+        return SqliteConnectionPool(settings.sqlite_path, settings.sqlite_pool_size)
+
+    @classmethod
+    def get_user_repository(
+        cls,
+        settings: Settings,
+        db: AsyncIOMotorDatabase,
+        sqlite_pool: SqliteConnectionPool,
+        write_concerns: MongoWriteConcerns,
+    ) -> IUserRepository:
+        if settings.user_repository == 'memory':
+            return InMemoryUserRepository()
+
+        if settings.user_repository == 'sqlite':
+            return SqliteUserRepository(sqlite_pool)
+
+        return CoalescingUserRepository(MongoUserRepository(db, write_concerns))
+
+    @classmethod
+    def get_lease_repository(
+        cls,
+        settings: Settings,
+        db: AsyncIOMotorDatabase,
+        sqlite_pool: SqliteConnectionPool,
+        write_concerns: MongoWriteConcerns,
+    ) -> ILeaseRepository:
+        if settings.user_repository == 'memory':
+            return InMemoryLeaseRepository()
+
+        if settings.user_repository == 'sqlite':
+            return SqliteLeaseRepository(sqlite_pool)
+
+        return MongoLeaseRepository(db, write_concerns)
+
+    @classmethod
+    def get_snapshot_repository(
+        cls,
+        settings: Settings,
+        db: AsyncIOMotorDatabase,
+        sqlite_pool: SqliteConnectionPool,
+    ) -> ISnapshotRepository:
+        if settings.user_repository == 'memory':
+            return InMemorySnapshotRepository()
+
+        if settings.user_repository == 'sqlite':
+            return SqliteSnapshotRepository(sqlite_pool)
+
+        return MongoSnapshotRepository(db)
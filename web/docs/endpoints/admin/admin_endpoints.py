@@ -0,0 +1,101 @@
+list_users_description: str = """
+Lista os usuários cadastrados, paginados pela ordem de criação.
+
+Este endpoint é restrito a administradores e exige o header `X-Admin-Key`.
+
+A paginação é feita por cursor: para obter a próxima página, envie o `next_cursor` da resposta anterior no parâmetro `cursor`. O custo de qualquer página é o mesmo da primeira.
+
+- **Query**:
+    - **limit** (integer) - Quantidade de usuários por página, de 1 a 100. Padrão: 50.
+    - **cursor** (string) - Cursor opaco retornado pela página anterior.
+    - **is_active** (boolean) - Filtra por usuários ativos ou desativados.
+    - **language** (string) - Filtra pelo idioma do usuário.
+    - **color_theme** (string) - Filtra pelo tema de cores do usuário.
+
+- **Response**: página de usuários.
+    - **users** (array) - Usuários da página.
+    - **next_cursor** (string | null) - Cursor da próxima página; `null` se esta for a última.
+"""
+
+import_users_description: str = """
+Importa usuários em massa a partir de um corpo NDJSON.
+
+Este endpoint é restrito a administradores e exige o header `X-Admin-Key`.
+
+Cada linha do corpo é um objeto JSON com os mesmos campos do cadastro de usuário. As linhas são lidas conforme chegam, validadas e gravadas em lotes, com as senhas criptografadas em paralelo.
+
+- **Body** (`application/x-ndjson`): um usuário por linha.
+    - **username** (string) - Nome do usuário.
+    - **email** (string) - Email do usuário.
+    - **password** (string) - Senha do usuário.
+    - **birth_date** (string) - Data de nascimento do usuário.
+    - **color_theme** (string) - Tema de cores do usuário.
+    - **language** (string) - Idioma do usuário.
+
+- **Response** (`application/x-ndjson`): um resultado por linha recebida, transmitido conforme cada lote é processado.
+    - **line** (integer) - Número da linha no corpo enviado.
+    - **status** (string) - `created`, `failed` (ex.: email duplicado ou usuário menor de idade) ou `invalid` (linha inválida).
+    - **id** (string | null) - ID do usuário criado.
+    - **error** (object | null) - Nome, mensagem e detalhes do erro.
+"""
+
+export_users_description: str = """
+Exporta todos os usuários cadastrados em NDJSON, sem a senha criptografada.
+
+Este endpoint é restrito a administradores e exige o header `X-Admin-Key`.
+
+Os usuários são lidos do banco em lotes e transmitidos conforme são serializados, então o consumo de memória do servidor não depende da quantidade de usuários.
+
+- **Query**:
+    - **gzip** (boolean) - Comprime a resposta com gzip e envia o header `Content-Encoding: gzip`. Padrão: `false`.
+
+- **Response** (`application/x-ndjson`): um usuário por linha, na ordem de criação.
+    - **id** (string) - ID do usuário.
+    - **username** (string) - Nome do usuário.
+    - **email** (string) - Email do usuário.
+    - **birth_date** (string) - Data de nascimento do usuário.
+    - **color_theme** (string) - Tema de cores do usuário.
+    - **language** (string) - Idioma do usuário.
+    - **is_active** (boolean) - Indica se o usuário está ativo.
+    - **created_at** (string) - Data de criação do usuário.
+"""
+
+get_user_statistics_description: str = """
+Retorna estatísticas agregadas dos usuários cadastrados.
+
+Este endpoint é restrito a administradores e exige o header `X-Admin-Key`.
+
+As estatísticas são calculadas sobre um snapshot em memória da base de usuários, atualizado periodicamente em segundo plano (`STATISTICS_REFRESH_SECONDS`), e não consultam o banco a cada requisição. Enquanto o primeiro snapshot não estiver pronto, a resposta é `503`.
+
+- **Query**:
+    - **signup_days** (integer) - Quantidade de dias da curva de cadastros, de 1 a 365. Padrão: 30.
+
+- **Response**: estatísticas dos usuários.
+    - **snapshot_at** (string) - Data e hora em que o snapshot foi gerado.
+    - **total_users** (integer) - Quantidade total de usuários.
+    - **active_users** (integer) - Quantidade de usuários ativos.
+    - **users_by_language** (object) - Quantidade de usuários por idioma.
+    - **users_by_color_theme** (object) - Quantidade de usuários por tema de cores.
+    - **users_by_age_range** (object) - Quantidade de usuários por faixa etária.
+    - **signups_by_day** (object) - Quantidade de cadastros por dia, nos últimos `signup_days` dias.
+"""
+
+get_signup_timeline_description: str = """
+Retorna a quantidade de cadastros por intervalo de tempo (hora, dia ou semana).
+
+Este endpoint é restrito a administradores e exige o header `X-Admin-Key`.
+
+O instante de criação é lido do próprio ID (ULID) de cada usuário, então cada intervalo é uma contagem sobre uma faixa do índice de `_id`, sem índice extra e sem varrer a coleção. Usuários arquivados também são contados.
+
+- **Query**:
+    - **granularity** (string) - Tamanho de cada intervalo: `hour`, `day` ou `week`. Padrão: `day`. As semanas começam na segunda-feira, em UTC.
+    - **since** (string) - Data e hora inicial. É arredondada para o início do intervalo que a contém.
+    - **until** (string) - Data e hora final. Padrão: agora. O período pode ter no máximo 1000 intervalos.
+
+- **Response**: linha do tempo de cadastros.
+    - **granularity** (string) - Tamanho de cada intervalo.
+    - **total** (integer) - Quantidade total de cadastros no período.
+    - **buckets** (array) - Intervalos em ordem cronológica.
+        - **start** (string) - Início do intervalo, em UTC.
+        - **count** (integer) - Quantidade de cadastros no intervalo.
+"""
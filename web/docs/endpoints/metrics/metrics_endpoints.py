@@ -0,0 +1,36 @@
+get_metrics_description: str = """
+Obtém as métricas operacionais da API.
+
+Este endpoint retorna contadores internos úteis para dimensionar os limites da aplicação.
+
+Este endpoint é restrito a administradores e exige o header `X-Admin-Key`.
+
+- **Response**: métricas da API.
+    - **password_hashing** (object) - Controle de admissão do hashing de senhas.
+        - **max_concurrency** (integer) - Quantidade máxima de operações de hashing simultâneas.
+        - **max_queue_size** (integer) - Tamanho máximo da fila de espera.
+        - **queue_depth** (integer) - Quantidade de operações aguardando na fila.
+        - **in_flight** (integer) - Quantidade de operações em execução.
+        - **admitted_count** (integer) - Total de operações admitidas.
+        - **rejected_count** (integer) - Total de operações rejeitadas com `503`.
+    - **password_hash_cost** (object) - Custo do bcrypt escolhido na inicialização.
+        - **rounds** (integer) - Custo em uso.
+        - **target_ms** (number | null) - Latência alvo da calibração; `null` se a calibração estiver desligada.
+        - **measurements_ms** (object) - Tempo medido, em milissegundos, para cada custo testado.
+    - **credential_cache** (object) - Cache de credenciais verificadas recentemente.
+        - **enabled** (boolean) - Indica se o cache está ligado.
+        - **ttl_seconds** (number) - Tempo de vida de cada entrada.
+        - **max_entries** (integer) - Quantidade máxima de entradas.
+        - **size** (integer) - Quantidade atual de entradas.
+        - **hits** (integer) - Verificações atendidas pelo cache.
+        - **misses** (integer) - Verificações que precisaram calcular o hash.
+        - **hit_rate** (number) - Proporção de verificações atendidas pelo cache.
+        - **verify_seconds_saved** (number) - Estimativa de segundos de hashing evitados.
+    - **mongo_commands** (array) - Latência dos comandos enviados ao MongoDB, por comando e coleção.
+        - **command** (string) - Nome do comando (`find`, `update`, `insert`...).
+        - **collection** (string) - Coleção alvo do comando.
+        - **count** (integer) - Quantidade de comandos executados.
+        - **total_ms** (number) - Tempo total gasto, em milissegundos.
+        - **max_ms** (number) - Maior latência observada, em milissegundos.
+        - **buckets_ms** (object) - Histograma de latência: quantidade de comandos até cada limite, em milissegundos, sem acumular os limites anteriores.
+"""
@@ -0,0 +1,61 @@
+from typing import Any
+
+from web.docs.examples.schemes.user_schemes import UserOutScheme_example
+
+ListUsersScheme_example: dict[str, Any] = {
+    'limit': 50,
+    'cursor': 'MDFKQjhHVDEyNFk4R0o4RkRRR1dSOTFYM0o',
+    'is_active': True,
+    'language': 'pt_br',
+    'color_theme': 'dark',
+}
+
+UserPageOutScheme_example: dict[str, Any] = {
+    'users': [UserOutScheme_example],
+    'next_cursor': 'MDFKQjhHVDEyNFk4R0o4RkRRR1dSOTFYM0o',
+}
+
+ImportUserResultOutScheme_example: dict[str, Any] = {
+    'line': 1,
+    'status': 'created',
+    'id': '01JB8GT124Y8GJ8FDQGWR91X3J',
+    'error': None,
+}
+
+UserStatisticsOutScheme_example: dict[str, Any] = {
+    'snapshot_at': '2024-10-28T14:30:00Z',
+    'total_users': 1520,
+    'active_users': 1404,
+    'users_by_language': {'pt_br': 980, 'en_us': 412, 'es_es': 128},
+    'users_by_color_theme': {'light': 610, 'dark': 910},
+    'users_by_age_range': {
+        '0-17': 0,
+        '18-24': 302,
+        '25-34': 655,
+        '35-44': 361,
+        '45-54': 139,
+        '55-64': 48,
+        '65+': 15,
+    },
+    'signups_by_day': {'2024-10-27': 12, '2024-10-28': 9},
+}
+
+SignupTimelineScheme_example: dict[str, Any] = {
+    'granularity': 'day',
+    'since': '2024-10-21T00:00:00Z',
+    'until': '2024-10-28T00:00:00Z',
+}
+
+SignupBucketOutScheme_example: dict[str, Any] = {
+    'start': '2024-10-27T00:00:00Z',
+    'count': 12,
+}
+
+SignupTimelineOutScheme_example: dict[str, Any] = {
+    'granularity': 'day',
+    'total': 21,
+    'buckets': [
+        SignupBucketOutScheme_example,
+        {'start': '2024-10-28T00:00:00Z', 'count': 9},
+    ],
+}
@@ -0,0 +1,56 @@
+from typing import Any
+
+PasswordHashingMetricsOutScheme_example: dict[str, Any] = {
+    'max_concurrency': 4,
+    'max_queue_size': 64,
+    'queue_depth': 12,
+    'in_flight': 4,
+    'admitted_count': 10382,
+    'rejected_count': 17,
+}
+
+PasswordHashCostMetricsOutScheme_example: dict[str, Any] = {
+    'rounds': 11,
+    'target_ms': 150,
+    'measurements_ms': {10: 61.2, 11: 121.8, 12: 243.5},
+}
+
+CredentialCacheMetricsOutScheme_example: dict[str, Any] = {
+    'enabled': True,
+    'ttl_seconds': 60,
+    'max_entries': 10000,
+    'size': 87,
+    'hits': 4120,
+    'misses': 311,
+    'hit_rate': 0.9298,
+    'verify_seconds_saved': 1012.4,
+}
+
+MongoCommandMetricsOutScheme_example: dict[str, Any] = {
+    'command': 'find',
+    'collection': 'users',
+    'count': 5210,
+    'total_ms': 4630.2,
+    'max_ms': 118.4,
+    'buckets_ms': {
+        '1': 4502,
+        '2': 611,
+        '5': 70,
+        '10': 18,
+        '25': 6,
+        '50': 2,
+        '100': 0,
+        '250': 1,
+        '500': 0,
+        '1000': 0,
+        '2500': 0,
+        'inf': 0,
+    },
+}
+
+MetricsOutScheme_example: dict[str, Any] = {
+    'password_hashing': PasswordHashingMetricsOutScheme_example,
+    'password_hash_cost': PasswordHashCostMetricsOutScheme_example,
+    'credential_cache': CredentialCacheMetricsOutScheme_example,
+    'mongo_commands': [MongoCommandMetricsOutScheme_example],
+}
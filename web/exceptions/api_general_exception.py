@@ -11,3 +11,9 @@ class ApiGeneralException:
             super().__init__(
                 message=f'The {method} method isn\'t allowed for the endpoint {endpoint}'
             )
+
+    class ServiceOverloaded(ApiException):
+        def __init__(self, retry_after: int) -> None:
+            super().__init__(
+                message=f'The service is overloaded, try again in {retry_after} seconds'
+            )
@@ -13,3 +13,11 @@ class ApiSecurityException:
     class ExpiredJwt(ApiException):
         def __init__(self) -> None:
             super().__init__(message='Expired JWT token')
+
+    class MissingAdminKey(ApiException):
+        def __init__(self) -> None:
+            super().__init__(message='Admin API key not provided')
+
+    class InvalidAdminKey(ApiException):
+        def __init__(self) -> None:
+            super().__init__(message='Invalid admin API key')
@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import logging
+import sys
+from typing import BinaryIO, Literal
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from adapters.exporters import ArrowUserSnapshotWriter
+from adapters.repositories.sqlite import SqliteConnectionPool
+from usecases.user import ExportUsersUsecase
+from web.config import is_app_in_production_mode
+from web.config.settings import ProdSettings, TestSettings
+from web.config.settings.base import Settings
+from web.db import MongoConnection, Repositories
+from web.utils.streaming import UserExportStream
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def get_usecase(
+    settings: Settings, client: AsyncIOMotorClient, sqlite_pool: SqliteConnectionPool
+) -> ExportUsersUsecase:
+    return ExportUsersUsecase(
+        Repositories.get_user_repository(
+            settings,
+            MongoConnection.get_db(client, settings),
+            sqlite_pool,
+            MongoConnection.get_write_concerns(settings),
+        )
+    )
+
+
+async def export(settings: Settings, output: BinaryIO, compress: bool) -> None:
+    client: AsyncIOMotorClient = MongoConnection.get_client(
+        settings, MongoConnection.get_command_monitor(settings)
+    )
+    sqlite_pool: SqliteConnectionPool = Repositories.get_sqlite_pool(settings)
+    stream: UserExportStream = UserExportStream(
+        get_usecase(settings, client, sqlite_pool), settings.export_batch_size
+    )
+    written: int = 0
+
+    try:
+        async for chunk in stream.chunks(compress=compress):
+            output.write(chunk)
+            written += len(chunk)
+    finally:
+        client.close()
+        sqlite_pool.close()
+
+    output.flush()
+
+    logger.info('exported users: %d bytes written', written)
+
+
+async def export_snapshot(
+    settings: Settings, path: str, format: Literal['arrow', 'parquet']
+) -> None:
+    client: AsyncIOMotorClient = MongoConnection.get_client(
+        settings, MongoConnection.get_command_monitor(settings)
+    )
+    sqlite_pool: SqliteConnectionPool = Repositories.get_sqlite_pool(settings)
+    usecase: ExportUsersUsecase = get_usecase(settings, client, sqlite_pool)
+
+    try:
+        rows: int = await ArrowUserSnapshotWriter(path, format).write(
+            usecase.execute(settings.export_batch_size)
+        )
+    finally:
+        client.close()
+        sqlite_pool.close()
+
+    logger.info('exported users: %d rows written to %s', rows, path)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='python -m web.export_users',
+        description='Export all users, without their hashed passwords.',
+    )
+    parser.add_argument(
+        '-o', '--output', help='file to write to (default: standard output)'
+    )
+    parser.add_argument(
+        '-f',
+        '--format',
+        choices=['ndjson', 'arrow', 'parquet'],
+        default='ndjson',
+        help='output format; arrow and parquet require --output (default: ndjson)',
+    )
+    parser.add_argument(
+        '--gzip', action='store_true', help='gzip the output (ndjson only)'
+    )
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.format != 'ndjson' and args.output is None:
+        parser.error(f'--output is required for the {args.format} format')
+
+    settings: Settings = (
+        ProdSettings() if is_app_in_production_mode() else TestSettings()  # type: ignore
+    )
+
+    if args.format != 'ndjson':
+        asyncio.run(export_snapshot(settings, args.output, args.format))
+        return
+
+    if args.output is None:
+        asyncio.run(export(settings, sys.stdout.buffer, args.gzip))
+        return
+
+    with open(args.output, 'wb') as output:
+        asyncio.run(export(settings, output, args.gzip))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import asyncio
+import logging
+
+from adapters.security import HashingWorkerServer
+from web.config import is_app_in_production_mode
+from web.config.settings import ProdSettings, TestSettings
+from web.config.settings.base import Settings
+from web.security.hashing import PasswordHashing
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def serve(settings: Settings) -> None:
+    if settings.password_hashing_socket_path is None:
+        raise RuntimeError('PASSWORD_HASHING_SOCKET_PATH must be set')
+
+    server: HashingWorkerServer = HashingWorkerServer(
+        socket_path=settings.password_hashing_socket_path,
+        password_manager=PasswordHashing.get_password_manager(
+            settings, PasswordHashing.calibrate(settings, hashing_worker=True)
+        ),
+        executor=PasswordHashing.get_executor(settings),
+        concurrency=settings.password_hashing_workers,
+    )
+
+    logger.info(
+        'hashing worker listening on %s with %d processes',
+        settings.password_hashing_socket_path,
+        settings.password_hashing_workers,
+    )
+
+    await server.serve_forever()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    settings: Settings = (
+        ProdSettings() if is_app_in_production_mode() else TestSettings()  # type: ignore
+    )
+
+    try:
+        asyncio.run(serve(settings))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
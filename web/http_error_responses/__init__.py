@@ -3,5 +3,6 @@ from .conflict import Conflict
 from .forbidden import Forbidden
 from .method_not_allowed import MethodNotAllowed
 from .not_found import NotFound
+from .service_unavailable import ServiceUnavailable
 from .unauthorized import Unauthorized
 from .unprocessable_entity import UnprocessableEntity
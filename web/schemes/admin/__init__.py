@@ -0,0 +1,7 @@
+from .import_user_result_out_scheme import ImportUserResultOutScheme
+from .list_users_scheme import ListUsersScheme
+from .signup_bucket_out_scheme import SignupBucketOutScheme
+from .signup_timeline_out_scheme import SignupTimelineOutScheme
+from .signup_timeline_scheme import SignupTimelineScheme
+from .user_page_out_scheme import UserPageOutScheme
+from .user_statistics_out_scheme import UserStatisticsOutScheme
@@ -0,0 +1,59 @@
+from typing import Any, Literal, Self
+
+from pydantic import ValidationError
+
+from domain.entities import User
+from usecases.exceptions.base import AppException
+from web.docs.examples.schemes.admin_schemes import ImportUserResultOutScheme_example
+from web.schemes.base import OutScheme
+
+
+class ImportUserResultOutScheme(OutScheme):
+    line: int
+    status: Literal['created', 'failed', 'invalid']
+    id: str | None = None
+    error: dict[str, Any] | None = None
+
+    @classmethod
+    def from_result(cls, line: int, result: User | AppException) -> Self:
+        if isinstance(result, AppException):
+            return cls(
+                line=line,
+                status='failed',
+                error={'name': result.name, 'message': result.message},
+            )
+
+        return cls(line=line, status='created', id=result.id)
+
+    @classmethod
+    def from_validation_error(cls, line: int, error: ValidationError) -> Self:
+        return cls(
+            line=line,
+            status='invalid',
+            error={
+                'name': 'InvalidDataSent',
+                'message': 'Invalid data sent',
+                'detail': [
+                    {
+                        'loc': item['loc'],
+                        'message': item['msg'],
+                        'type': item['type'],
+                    }
+                    for item in error.errors(include_url=False)
+                ],
+            },
+        )
+
+    @classmethod
+    def from_line_too_long(cls, line: int) -> Self:
+        return cls(
+            line=line,
+            status='invalid',
+            error={'name': 'LineTooLong', 'message': 'The line is too long'},
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [ImportUserResultOutScheme_example],
+        }
+    }
@@ -0,0 +1,43 @@
+from typing import Annotated, Any
+
+from pydantic import Field, field_validator
+
+from domain.value_objects import ColorTheme, Language
+from usecases.dto.user import ListUsersDto
+from web.docs.examples.schemes.admin_schemes import ListUsersScheme_example
+from web.schemes.base import InputScheme
+from web.utils.pagination import Cursor
+
+
+class ListUsersScheme(InputScheme):
+    limit: Annotated[int, Field(ge=1, le=100)] = 50
+    cursor: str | None = None
+    is_active: bool | None = None
+    language: Language | None = None
+    color_theme: ColorTheme | None = None
+
+    @field_validator('cursor')
+    @classmethod
+    def validate_cursor(cls, cursor: str | None) -> str | None:
+        if cursor is not None:
+            try:
+                Cursor.decode(cursor)
+            except ValueError:
+                raise ValueError('Invalid cursor')
+
+        return cursor
+
+    def to_dto(self) -> ListUsersDto:
+        return ListUsersDto(
+            after_id=None if self.cursor is None else Cursor.decode(self.cursor),
+            limit=self.limit,
+            is_active=self.is_active,
+            language=self.language,
+            color_theme=self.color_theme,
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [ListUsersScheme_example],
+        }
+    }
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Any
+
+from web.docs.examples.schemes.admin_schemes import SignupBucketOutScheme_example
+from web.schemes.base import OutScheme
+
+
+class SignupBucketOutScheme(OutScheme):
+    start: datetime
+    count: int
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [SignupBucketOutScheme_example],
+        }
+    }
@@ -0,0 +1,28 @@
+from typing import Any, Self
+
+from usecases.dto.user import SignupBucketDto, SignupGranularity
+from web.docs.examples.schemes.admin_schemes import SignupTimelineOutScheme_example
+from web.schemes.admin.signup_bucket_out_scheme import SignupBucketOutScheme
+from web.schemes.base import OutScheme
+
+
+class SignupTimelineOutScheme(OutScheme):
+    granularity: SignupGranularity
+    total: int
+    buckets: list[SignupBucketOutScheme]
+
+    @classmethod
+    def from_buckets(
+        cls, granularity: SignupGranularity, buckets: list[SignupBucketDto]
+    ) -> Self:
+        return cls(
+            granularity=granularity,
+            total=sum(bucket.count for bucket in buckets),
+            buckets=[SignupBucketOutScheme.from_entity(bucket) for bucket in buckets],
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [SignupTimelineOutScheme_example],
+        }
+    }
@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from typing import Any, Self
+
+from pydantic import field_validator, model_validator
+
+from adapters.id.ulid import EPOCH
+from usecases.dto.user import SignupGranularity, SignupTimelineDto
+from usecases.user.get_signup_timeline_usecase import BUCKET_SIZES, count_buckets
+from web.docs.examples.schemes.admin_schemes import SignupTimelineScheme_example
+from web.schemes.base import InputScheme
+
+MAX_BUCKETS: int = 1000
+
+
+class SignupTimelineScheme(InputScheme):
+    granularity: SignupGranularity = 'day'
+    since: datetime
+    until: datetime | None = None
+
+    @field_validator('since', 'until')
+    @classmethod
+    def assume_utc(cls, moment: datetime | None) -> datetime | None:
+        if moment is not None and moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+
+        return moment
+
+    @model_validator(mode='after')
+    def validate_range(self) -> Self:
+        now: datetime = datetime.now(timezone.utc)
+        until: datetime = self.until or now
+
+        # signup ids carry ULID timestamps, which start at the Unix epoch
+        if self.since < EPOCH:
+            raise ValueError('since must not be earlier than 1970-01-01')
+
+        if until > now + BUCKET_SIZES[self.granularity]:
+            raise ValueError('until must not be later than the current bucket')
+
+        if self.since >= until:
+            raise ValueError('since must be earlier than until')
+
+        if count_buckets(self.granularity, self.since, until) > MAX_BUCKETS:
+            raise ValueError(f'The range spans more than {MAX_BUCKETS} buckets')
+
+        return self
+
+    def to_dto(self) -> SignupTimelineDto:
+        return SignupTimelineDto(
+            granularity=self.granularity,
+            since=self.since,
+            until=self.until or datetime.now(timezone.utc),
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [SignupTimelineScheme_example],
+        }
+    }
@@ -0,0 +1,29 @@
+from typing import Any, Self
+
+from usecases.dto.user import UserPageDto
+from web.docs.examples.schemes.admin_schemes import UserPageOutScheme_example
+from web.schemes.base import OutScheme
+from web.schemes.user import UserOutScheme
+from web.utils.pagination import Cursor
+
+
+class UserPageOutScheme(OutScheme):
+    users: list[UserOutScheme]
+    next_cursor: str | None
+
+    @classmethod
+    def from_page(cls, page: UserPageDto) -> Self:
+        return cls(
+            users=[UserOutScheme.from_entity(user) for user in page.users],
+            next_cursor=(
+                None
+                if page.next_after_id is None
+                else Cursor.encode(page.next_after_id)
+            ),
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [UserPageOutScheme_example],
+        }
+    }
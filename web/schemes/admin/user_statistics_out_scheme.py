@@ -0,0 +1,22 @@
+from datetime import date, datetime
+from typing import Any
+
+from domain.value_objects import ColorTheme, Language
+from web.docs.examples.schemes.admin_schemes import UserStatisticsOutScheme_example
+from web.schemes.base import OutScheme
+
+
+class UserStatisticsOutScheme(OutScheme):
+    snapshot_at: datetime
+    total_users: int
+    active_users: int
+    users_by_language: dict[Language, int]
+    users_by_color_theme: dict[ColorTheme, int]
+    users_by_age_range: dict[str, int]
+    signups_by_day: dict[date, int]
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [UserStatisticsOutScheme_example],
+        }
+    }
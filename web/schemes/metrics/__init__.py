@@ -0,0 +1,5 @@
+from .credential_cache_metrics_out_scheme import CredentialCacheMetricsOutScheme
+from .metrics_out_scheme import MetricsOutScheme
+from .mongo_command_metrics_out_scheme import MongoCommandMetricsOutScheme
+from .password_hash_cost_metrics_out_scheme import PasswordHashCostMetricsOutScheme
+from .password_hashing_metrics_out_scheme import PasswordHashingMetricsOutScheme
@@ -0,0 +1,37 @@
+from typing import Any, Self
+
+from adapters.security import CredentialCache
+from web.docs.examples.schemes.metrics_schemes import (
+    CredentialCacheMetricsOutScheme_example,
+)
+from web.schemes.base import OutScheme
+
+
+class CredentialCacheMetricsOutScheme(OutScheme):
+    enabled: bool
+    ttl_seconds: float
+    max_entries: int
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float
+    verify_seconds_saved: float
+
+    @classmethod
+    def from_credential_cache(cls, credential_cache: CredentialCache) -> Self:
+        return cls(
+            enabled=credential_cache.enabled,
+            ttl_seconds=credential_cache.ttl_seconds,
+            max_entries=credential_cache.max_entries,
+            size=credential_cache.size,
+            hits=credential_cache.hits,
+            misses=credential_cache.misses,
+            hit_rate=credential_cache.hit_rate,
+            verify_seconds_saved=credential_cache.verify_seconds_saved,
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [CredentialCacheMetricsOutScheme_example],
+        }
+    }
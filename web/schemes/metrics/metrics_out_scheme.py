@@ -0,0 +1,29 @@
+from typing import Any
+
+from web.docs.examples.schemes.metrics_schemes import MetricsOutScheme_example
+from web.schemes.base import OutScheme
+from web.schemes.metrics.credential_cache_metrics_out_scheme import (
+    CredentialCacheMetricsOutScheme,
+)
+from web.schemes.metrics.mongo_command_metrics_out_scheme import (
+    MongoCommandMetricsOutScheme,
+)
+from web.schemes.metrics.password_hash_cost_metrics_out_scheme import (
+    PasswordHashCostMetricsOutScheme,
+)
+from web.schemes.metrics.password_hashing_metrics_out_scheme import (
+    PasswordHashingMetricsOutScheme,
+)
+
+
+class MetricsOutScheme(OutScheme):
+    password_hashing: PasswordHashingMetricsOutScheme
+    password_hash_cost: PasswordHashCostMetricsOutScheme
+    credential_cache: CredentialCacheMetricsOutScheme
+    mongo_commands: list[MongoCommandMetricsOutScheme]
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [MetricsOutScheme_example],
+        }
+    }
@@ -0,0 +1,35 @@
+from typing import Any, Self
+
+from adapters.monitoring import LatencyHistogram
+from web.docs.examples.schemes.metrics_schemes import (
+    MongoCommandMetricsOutScheme_example,
+)
+from web.schemes.base import OutScheme
+
+
+class MongoCommandMetricsOutScheme(OutScheme):
+    command: str
+    collection: str
+    count: int
+    total_ms: float
+    max_ms: float
+    buckets_ms: dict[str, int]
+
+    @classmethod
+    def from_histogram(
+        cls, command: str, collection: str, histogram: LatencyHistogram
+    ) -> Self:
+        return cls(
+            command=command,
+            collection=collection,
+            count=histogram.count,
+            total_ms=round(histogram.total_ms, 3),
+            max_ms=round(histogram.max_ms, 3),
+            buckets_ms=histogram.buckets,
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [MongoCommandMetricsOutScheme_example],
+        }
+    }
@@ -0,0 +1,18 @@
+from typing import Any
+
+from web.docs.examples.schemes.metrics_schemes import (
+    PasswordHashCostMetricsOutScheme_example,
+)
+from web.schemes.base import OutScheme
+
+
+class PasswordHashCostMetricsOutScheme(OutScheme):
+    rounds: int
+    target_ms: float | None
+    measurements_ms: dict[int, float]
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [PasswordHashCostMetricsOutScheme_example],
+        }
+    }
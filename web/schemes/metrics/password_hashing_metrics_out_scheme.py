@@ -0,0 +1,35 @@
+from typing import Any, Self
+
+from adapters.security import AdmissionController
+from web.docs.examples.schemes.metrics_schemes import (
+    PasswordHashingMetricsOutScheme_example,
+)
+from web.schemes.base import OutScheme
+
+
+class PasswordHashingMetricsOutScheme(OutScheme):
+    max_concurrency: int
+    max_queue_size: int
+    queue_depth: int
+    in_flight: int
+    admitted_count: int
+    rejected_count: int
+
+    @classmethod
+    def from_admission_controller(
+        cls, admission_controller: AdmissionController
+    ) -> Self:
+        return cls(
+            max_concurrency=admission_controller.max_concurrency,
+            max_queue_size=admission_controller.max_queue_size,
+            queue_depth=admission_controller.queue_depth,
+            in_flight=admission_controller.in_flight,
+            admitted_count=admission_controller.admitted_count,
+            rejected_count=admission_controller.rejected_count,
+        )
+
+    model_config: dict[str, Any] = {  # type: ignore
+        'json_schema_extra': {
+            'examples': [PasswordHashingMetricsOutScheme_example],
+        }
+    }
@@ -1,2 +1,3 @@
+from .admin import admin_api_key_scheme
 from .i_jwt_manager import IJwtManager
 from .oauth2 import oauth2_scheme
@@ -0,0 +1,3 @@
+from fastapi.security import APIKeyHeader
+
+admin_api_key_scheme = APIKeyHeader(name='X-Admin-Key', auto_error=False)
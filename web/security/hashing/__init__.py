@@ -0,0 +1 @@
+from .password_hashing import PasswordHashing
@@ -0,0 +1,135 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from adapters.security import (
+    AdmissionControlledPasswordManager,
+    AdmissionController,
+    Argon2PasswordManager,
+    BcryptCalibration,
+    BcryptCostCalibrator,
+    BcryptPasswordManager,
+    CachingPasswordManager,
+    CredentialCache,
+    ProcessPoolPasswordManager,
+    SocketPasswordManager,
+)
+from ports.security import IAsyncPasswordManager, IPasswordManager
+from web.config.settings.base import Settings
+from web.di import Di
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PasswordHashing:
+    @classmethod
+    def calibrate(
+        cls, settings: Settings, hashing_worker: bool = False
+    ) -> BcryptCalibration:
+        if (
+            settings.bcrypt_calibration_target_ms is None
+            or settings.password_hash_algorithm != 'bcrypt'
+        ):
+            return BcryptCalibration(rounds=settings.bcrypt_rounds)
+
+        socket_mode: bool = settings.password_hashing_socket_path is not None
+
+        if socket_mode and settings.bcrypt_calibration_path is None:
+            raise RuntimeError(
+                'BCRYPT_CALIBRATION_PATH must be set when the hashing worker is '
+                'calibrated, so the API reads the same cost'
+            )
+
+        calibrator: BcryptCostCalibrator = BcryptCostCalibrator(
+            min_rounds=settings.bcrypt_min_rounds,
+            max_rounds=settings.bcrypt_max_rounds,
+            target_ms=settings.bcrypt_calibration_target_ms,
+            samples=settings.bcrypt_calibration_samples,
+        )
+        calibration: BcryptCalibration
+
+        if socket_mode and not hashing_worker:
+            # the worker hashes, the API only needs its cost to agree on needs_rehash
+            calibration = calibrator.wait_for_shared(
+                settings.bcrypt_calibration_path,  # type: ignore
+                settings.bcrypt_calibration_wait_seconds,
+            )
+        elif settings.bcrypt_calibration_path is None:
+            calibration = calibrator.calibrate()
+        else:
+            calibration = calibrator.calibrate_shared(settings.bcrypt_calibration_path)
+
+        logger.info(
+            'bcrypt cost calibrated to %d rounds (target %.0f ms, measured %s)',
+            calibration.rounds,
+            calibration.target_ms,
+            ', '.join(
+                f'{rounds} rounds: {elapsed:.0f} ms'
+                for rounds, elapsed in calibration.measurements_ms.items()
+            ),
+        )
+
+        return calibration
+
+    @classmethod
+    def get_password_manager(
+        cls, settings: Settings, calibration: BcryptCalibration
+    ) -> IPasswordManager:
+        if settings.password_hash_algorithm == 'argon2id':
+            return Argon2PasswordManager(
+                time_cost=settings.argon2_time_cost,
+                memory_cost=settings.argon2_memory_cost,
+                parallelism=settings.argon2_parallelism,
+            )
+
+        return BcryptPasswordManager(
+            rounds=calibration.rounds, max_rounds=settings.bcrypt_max_rounds
+        )
+
+    @classmethod
+    def get_executor(cls, settings: Settings) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=settings.password_hashing_workers)
+
+    @classmethod
+    def get_admission_controller(cls, settings: Settings) -> AdmissionController:
+        return AdmissionController(
+            max_concurrency=settings.password_hashing_max_concurrency,
+            max_queue_size=settings.password_hashing_max_queue_size,
+            retry_after=settings.password_hashing_retry_after_seconds,
+        )
+
+    @classmethod
+    def get_credential_cache(cls, settings: Settings) -> CredentialCache:
+        return CredentialCache(
+            ttl_seconds=settings.credential_cache_ttl_seconds,
+            max_entries=settings.credential_cache_max_entries,
+        )
+
+    @classmethod
+    def get_async_password_manager(
+        cls,
+        settings: Settings,
+        password_manager: IPasswordManager,
+        admission_controller: AdmissionController,
+        credential_cache: CredentialCache,
+    ) -> IAsyncPasswordManager:
+        async_password_manager: IAsyncPasswordManager = (
+            SocketPasswordManager(
+                settings.password_hashing_socket_path,
+                password_manager,
+                settings.password_hashing_retry_after_seconds,
+            )
+            if settings.password_hashing_socket_path is not None
+            else ProcessPoolPasswordManager(
+                password_manager, Di.get_raw(ProcessPoolExecutor)
+            )
+        )
+        async_password_manager = AdmissionControlledPasswordManager(
+            async_password_manager, admission_controller
+        )
+
+        if credential_cache.enabled:
+            async_password_manager = CachingPasswordManager(
+                async_password_manager, credential_cache
+            )
+
+        return async_password_manager
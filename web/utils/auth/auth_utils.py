@@ -1,9 +1,13 @@
+import secrets
+
 from fastapi import Depends
 
 from domain.entities import User
 from usecases.user import GetActiveUserUsecase
+from web.config.settings.base import Settings
 from web.di import Di
-from web.security import IJwtManager, oauth2_scheme
+from web.exceptions import ApiSecurityException
+from web.security import IJwtManager, admin_api_key_scheme, oauth2_scheme
 
 
 class AuthUtils:
@@ -17,3 +21,16 @@ class AuthUtils:
         user: User = await usecase.execute(user_id)
 
         return user
+
+    @staticmethod
+    async def require_admin(
+        api_key: str | None = Depends(admin_api_key_scheme),
+        settings: Settings = Di.inject(Settings),
+    ) -> None:
+        if api_key is None:
+            raise ApiSecurityException.MissingAdminKey()
+
+        if settings.admin_api_key is None or not secrets.compare_digest(
+            api_key.encode(), settings.admin_api_key.encode()
+        ):
+            raise ApiSecurityException.InvalidAdminKey()
@@ -0,0 +1 @@
+from .db_timing_middleware import DbTimingMiddleware
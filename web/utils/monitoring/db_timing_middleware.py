@@ -0,0 +1,56 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from adapters.monitoring import QueryStats
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class DbTimingMiddleware:
+    def __init__(
+        self, app: ASGIApp, *, command_warning_count: int, server_timing: bool
+    ) -> None:
+        self._app: ASGIApp = app
+        self._command_warning_count: int = command_warning_count
+        self._server_timing: bool = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+
+        stats, token = QueryStats.start()
+
+        async def send_with_timing(message: Message) -> None:
+            if self._server_timing and message['type'] == 'http.response.start':
+                MutableHeaders(scope=message).append(
+                    'Server-Timing',
+                    f'db;dur={stats.total_ms:.1f};desc="{stats.count} commands"',
+                )
+
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_with_timing)
+        finally:
+            QueryStats.stop(token)
+
+            self._log(scope, stats)
+
+    def _log(self, scope: Scope, stats: QueryStats) -> None:
+        level: int = (
+            logging.WARNING
+            if stats.count >= self._command_warning_count
+            else logging.DEBUG
+        )
+
+        logger.log(
+            level,
+            '%s %s ran %d mongo commands in %.1f ms',
+            scope['method'],
+            scope['path'],
+            stats.count,
+            stats.total_ms,
+        )
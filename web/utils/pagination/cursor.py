@@ -0,0 +1,15 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from adapters.id import Ulid
+
+
+class Cursor:
+    @staticmethod
+    def encode(after_id: str) -> str:
+        return urlsafe_b64encode(after_id.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode(cursor: str) -> str:
+        after_id: str = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+
+        return str(Ulid(after_id))
@@ -0,0 +1,4 @@
+from .duplex_streaming_response import DuplexStreamingResponse
+from .ndjson import Ndjson
+from .user_export_stream import UserExportStream
+from .user_import_stream import UserImportStream
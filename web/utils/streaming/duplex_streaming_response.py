@@ -0,0 +1,12 @@
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # StreamingResponse listens for disconnects through receive(), which would
+        # swallow the request body chunks the stream is still consuming
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
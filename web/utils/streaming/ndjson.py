@@ -0,0 +1,43 @@
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+
+class Ndjson:
+    media_type: str = 'application/x-ndjson'
+
+    @staticmethod
+    async def lines(
+        chunks: AsyncIterable[bytes], *, max_line_bytes: int = 64 * 1024
+    ) -> AsyncIterator[tuple[int, bytes | None]]:
+        buffer: bytes = b''
+        number: int = 0
+        discarding: bool = False
+
+        async for chunk in chunks:
+            buffer += chunk
+
+            while (end := buffer.find(b'\n')) != -1:
+                line, buffer = buffer[:end], buffer[end + 1 :]
+                number += 1
+
+                if discarding:
+                    discarding = False
+                    yield number, None
+                elif line.strip():
+                    yield number, line
+
+            if not discarding and len(buffer) > max_line_bytes:
+                discarding = True
+
+            if discarding:
+                buffer = b''
+
+        if discarding:
+            yield number + 1, None
+        elif buffer.strip():
+            yield number + 1, buffer
+
+    @staticmethod
+    def dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode() + b'\n'
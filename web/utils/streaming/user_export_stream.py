@@ -0,0 +1,53 @@
+import zlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ports.repositories.user import ExportedUser
+from usecases.user import ExportUsersUsecase
+from web.utils.streaming.ndjson import Ndjson
+
+
+class UserExportStream:
+    chunk_size: int = 64 * 1024
+
+    def __init__(self, usecase: ExportUsersUsecase, batch_size: int) -> None:
+        self._usecase: ExportUsersUsecase = usecase
+        self._batch_size: int = batch_size
+
+    async def chunks(self, *, compress: bool = False) -> AsyncIterator[bytes]:
+        compressor: Any = (
+            zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+        )
+        buffer: bytearray = bytearray()
+
+        async for user in self._usecase.execute(self._batch_size):
+            buffer += Ndjson.dumps(self._to_json(user))
+
+            if len(buffer) < self.chunk_size:
+                continue
+
+            chunk: bytes = bytes(buffer)
+            buffer.clear()
+
+            if compressor is None:
+                yield chunk
+            elif compressed := compressor.compress(chunk):
+                yield compressed
+
+        if compressor is None:
+            if buffer:
+                yield bytes(buffer)
+        else:
+            yield compressor.compress(bytes(buffer)) + compressor.flush()
+
+    def _to_json(self, user: ExportedUser) -> dict[str, Any]:
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'birth_date': user.birth_date.isoformat(),
+            'color_theme': str(user.color_theme),
+            'language': str(user.language),
+            'is_active': user.is_active,
+            'created_at': user.created_at.isoformat(),
+        }
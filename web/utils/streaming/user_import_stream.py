@@ -0,0 +1,63 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
+from pydantic import ValidationError
+
+from domain.entities import User
+from usecases.dto.user import CreateUserDto
+from usecases.exceptions.base import AppException
+from usecases.user import ImportUsersUsecase
+from web.schemes.admin import ImportUserResultOutScheme
+from web.schemes.user import CreateUserScheme
+from web.utils.streaming.ndjson import Ndjson
+
+
+class UserImportStream:
+    def __init__(
+        self,
+        usecase: ImportUsersUsecase,
+        batch_size: int,
+        hash_concurrency: int,
+        max_hash_attempts: int,
+    ) -> None:
+        self._usecase: ImportUsersUsecase = usecase
+        self._batch_size: int = batch_size
+        self._hash_concurrency: int = hash_concurrency
+        self._max_hash_attempts: int = max_hash_attempts
+
+    async def results(self, body: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        batch: list[tuple[int, CreateUserDto]] = []
+
+        async for number, line in Ndjson.lines(body):
+            if line is None:
+                yield self._dumps(ImportUserResultOutScheme.from_line_too_long(number))
+                continue
+
+            try:
+                dto: CreateUserDto = CreateUserScheme.model_validate_json(line).to_dto()
+            except ValidationError as e:
+                yield self._dumps(
+                    ImportUserResultOutScheme.from_validation_error(number, e)
+                )
+                continue
+
+            batch.append((number, dto))
+
+            if len(batch) == self._batch_size:
+                yield await self._import(batch)
+                batch = []
+
+        if batch:
+            yield await self._import(batch)
+
+    async def _import(self, batch: list[tuple[int, CreateUserDto]]) -> bytes:
+        results: list[User | AppException] = await self._usecase.execute(
+            [dto for _, dto in batch], self._hash_concurrency, self._max_hash_attempts
+        )
+
+        return b''.join(
+            self._dumps(ImportUserResultOutScheme.from_result(number, result))
+            for (number, _), result in zip(batch, results)
+        )
+
+    def _dumps(self, result: ImportUserResultOutScheme) -> bytes:
+        return Ndjson.dumps(result.model_dump(mode='json'))
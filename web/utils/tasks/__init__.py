@@ -0,0 +1 @@
+from .periodic_task import PeriodicTask
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        operation: Callable[[], Awaitable[object]],
+        jitter_seconds: float = 0,
+    ) -> None:
+        self._name: str = name
+        self._interval_seconds: float = interval_seconds
+        self._operation: Callable[[], Awaitable[object]] = operation
+        self._jitter_seconds: float = jitter_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self._name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def _run(self) -> None:
+        # workers booted together would otherwise run the operation in lockstep
+        await asyncio.sleep(random.uniform(0, self._jitter_seconds))
+
+        while True:
+            start: float = time.perf_counter()
+
+            try:
+                await self._operation()
+            except Exception:
+                logger.exception('periodic task %s failed', self._name)
+            else:
+                logger.info(
+                    'periodic task %s finished in %.1f s',
+                    self._name,
+                    time.perf_counter() - start,
+                )
+
+            await asyncio.sleep(self._interval_seconds)